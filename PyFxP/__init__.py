@@ -1,3 +1,44 @@
 # PyFxP package init
+#
+# Scalar types load eagerly and do not need NumPy. Array types and optional subsystems are
+# imported on first attribute access (PEP 562), so short-lived processes that only quantize
+# scalars skip loading them.
+import importlib
+
 from PyFxP.fix_point import FixedPoint
+from PyFxP.overflow import OverflowMode, OverflowStats, overflow_policy
+from PyFxP.q_format import QFormat
 from PyFxP.registry import Registry, Opp, OppType
+from PyFxP.rounding import RoundingMode
+
+
+# Public names imported on first use, by defining module
+_LAZY_NAMES = {
+    "FixedPointArray": "fix_point_array",
+}
+
+# Submodules reachable as attributes, e.g. PyFxP.lut.LUT, without importing them first
+_LAZY_MODULES = (
+    "wide", "kernels", "filters", "stream", "vectors", "compiler", "range_analysis", "sweep",
+    "profiling", "constants", "lut", "trace", "crosscheck",
+)
+
+__all__ = ["FixedPoint", "FixedPointArray", "OverflowMode", "OverflowStats", "overflow_policy", "QFormat",
+           "Registry", "Opp", "OppType", "RoundingMode"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY_NAMES[name]}"), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_LAZY_MODULES))
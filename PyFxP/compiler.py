@@ -0,0 +1,159 @@
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .fix_point import FixedPoint
+from .fix_point_array import FixedPointArray
+from .q_format import QFormat
+from .registry import Opp, OppType, Registry, RegistryMode
+
+
+_BINARY_OPS = {
+    OppType.__ADD__: (np.add, "__add__"),
+    OppType.__SUB__: (np.subtract, "__sub__"),
+    OppType.__MUL__: (np.multiply, "__mul__"),
+}
+
+
+class Kernel:
+    """
+    Kernel replays a traced FixedPoint computation over whole arrays of inputs.
+
+    Each step is one op of the trace, with its operand slots and result format resolved at
+    compile time. Calling the kernel runs one vectorized FixedPointArray op per step, which
+    is bit-identical to running the scalar computation element by element.
+
+    Built by compile_kernel rather than directly.
+    """
+
+    def __init__(self, input_fmts: tuple[QFormat, ...], steps: list[tuple], constants: dict[int, FixedPointArray],
+                 outputs: tuple[int, ...], n_slots: int, single: bool):
+        """ Kernel class constructor """
+
+        self.input_fmts: tuple[QFormat, ...] = input_fmts
+        self.steps: list[tuple] = steps
+        self.constants: dict[int, FixedPointArray] = constants
+        self.outputs: tuple[int, ...] = outputs
+        self._n_slots = n_slots
+        self._single = single
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __repr__(self) -> str:
+        return f"Kernel(inputs={len(self.input_fmts)}, steps={len(self.steps)}, outputs={len(self.outputs)})"
+
+    def _as_input(self, value, fmt: QFormat) -> FixedPointArray:
+        if not isinstance(value, FixedPointArray):
+            return FixedPointArray(np.asarray(value, dtype=np.float64), fmt.int_width, fmt.fract_width, fmt.signed)
+        if value.fmt is not fmt:
+            raise ValueError(f"Input format {value.fmt} does not match traced format {fmt}")
+        return value
+
+    def __call__(self, *inputs) -> FixedPointArray | tuple[FixedPointArray, ...]:
+        """
+        Evaluate the kernel on arrays of inputs, one per traced input.
+        Float array-likes are quantized to the traced input format; arrays broadcast as in NumPy.
+        """
+        slots = self.evaluate(*inputs)
+        results = tuple(slots[slot] for slot in self.outputs)
+        return results[0] if self._single else results
+
+    def evaluate(self, *inputs) -> list[FixedPointArray | None]:
+        """ Evaluate the kernel and return every slot (inputs, constants and step results) """
+        if len(inputs) != len(self.input_fmts):
+            raise TypeError(f"Kernel takes {len(self.input_fmts)} inputs, got {len(inputs)}")
+
+        slots: list = [None] * self._n_slots
+        for i, (value, fmt) in enumerate(zip(inputs, self.input_fmts)):
+            slots[i] = self._as_input(value, fmt)
+        for slot, value in self.constants.items():
+            slots[slot] = value
+
+        for opp_type, dest, lhs, rhs, params, fmt in self.steps:
+            arr = slots[lhs]
+            if rhs is not None:
+                op, site = _BINARY_OPS[opp_type]
+                slots[dest] = arr._binary_op(arr, slots[rhs], fmt, op, site)
+            elif opp_type is OppType.__LSHIFT__:
+                slots[dest] = arr << params[0]
+            elif opp_type is OppType.__RSHIFT__:
+                slots[dest] = arr >> params[0]
+            elif opp_type is OppType.__RESIZE__:
+                slots[dest] = arr.resize(fmt.int_width, fmt.fract_width, fmt.signed, *params)
+            elif opp_type is OppType.__BSL_SCALE__:
+                slots[dest] = arr.bsl_scale(*params)
+            else:
+                slots[dest] = arr.bsr_scale(*params)
+
+        return slots
+
+
+def _trace(fn: Callable, inputs: list[FixedPoint]) -> tuple[object, list[Opp]]:
+    """ Run fn once with every op recorded into a private scope """
+    with Registry.configure(RegistryMode.FULL) as scope:
+        outputs = fn(*inputs)
+    return outputs, list(scope.op_registry)
+
+
+def compile_kernel(fn: Callable[..., FixedPoint | Sequence[FixedPoint]], *inputs: FixedPoint | QFormat) -> Kernel:
+    """
+    Trace a scalar FixedPoint computation once and compile it into a Kernel.
+
+    fn is called with one example value per input (a QFormat stands for a zero in that
+    format) and must return a FixedPoint or a tuple of them. The trace captures arithmetic
+    operators, shifts, resize and bsl/bsr_scale, so control flow is fixed by the example run.
+    Any other value fn uses, e.g. a FixedPoint literal, becomes a constant of the kernel, as
+    do ops whose operands are all constants. Values produced by untraced operations such as
+    kernels.mac are also frozen as constants, so keep those outside the traced function.
+
+    :param fn: Scalar computation to compile
+    :param inputs: Example inputs, as FixedPoint values or their formats
+    """
+    # Fresh objects so each input has its own identity in the trace
+    examples = [FixedPoint._create(0 if isinstance(x, QFormat) else x.val_int, x if isinstance(x, QFormat) else x.fmt)
+                for x in inputs]
+    outputs, ops = _trace(fn, examples)
+
+    single = isinstance(outputs, FixedPoint)
+    outputs = (outputs,) if single else tuple(outputs)
+    if not all(isinstance(out, FixedPoint) for out in outputs):
+        raise TypeError("Traced function must return a FixedPoint or a sequence of FixedPoint")
+
+    slots = {id(x): i for i, x in enumerate(examples)}
+    live = set(range(len(examples)))
+    constants: dict[int, FixedPoint] = {}
+
+    def slot_of(value: FixedPoint) -> int:
+        key = id(value)
+        if key not in slots:
+            slots[key] = len(slots)
+            constants[slots[key]] = value
+        return slots[key]
+
+    steps = []
+    for op in ops:
+        lhs = slot_of(op.lhs)
+        rhs = None if op.rhs is None else slot_of(op.rhs)
+        if lhs not in live and rhs not in live:
+            # Does not depend on any input, keep the traced result
+            slot_of(op.result)
+            continue
+
+        dest = slots[id(op.result)] = len(slots)
+        live.add(dest)
+        steps.append((op.opp_type, dest, lhs, rhs, op.params, op.result.fmt))
+
+    output_slots = tuple(slot_of(out) for out in outputs)
+
+    # Drop steps that no output depends on
+    needed = set(output_slots)
+    kept = []
+    for step in reversed(steps):
+        if step[1] in needed:
+            kept.append(step)
+            needed.update(s for s in step[2:4] if s is not None)
+    kept.reverse()
+
+    arrays = {slot: FixedPointArray._coerce(value) for slot, value in constants.items() if slot in needed}
+    return Kernel(tuple(x.fmt for x in examples), kept, arrays, output_slots, len(slots), single)
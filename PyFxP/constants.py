@@ -0,0 +1,133 @@
+from functools import lru_cache
+
+from .fix_point import FixedPoint
+from .overflow import OverflowMode, current_policy, resolve_overflow
+from .q_format import QFormat
+from .registry import current_scope
+from .rounding import RoundingMode, shift_round
+
+
+def quantize(value: float, fmt: QFormat, rounding: RoundingMode = RoundingMode.CONVERGENT) -> int:
+    """
+    Raw integer nearest value * 2ⁿ under the given rounding, before overflow handling.
+
+    The float is split into an exact integer ratio, so rounding is exact for any magnitude.
+    CONVERGENT matches FixedPoint(float, ...), which rounds half to even.
+    """
+    numerator, denominator = value.as_integer_ratio()
+    # The denominator of a float's ratio is a power of two
+    return shift_round(numerator, denominator.bit_length() - 1 - fmt.fract_width, rounding)
+
+
+class Constant(FixedPoint):
+    """
+    Constant is an immutable FixedPoint shared by every user of the same (value, format, rounding).
+
+    Its float and binary representations are computed up front, so nothing is ever written to a
+    Constant after construction. Arithmetic on a Constant returns plain FixedPoint values.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _make(cls, raw_int_val: int, fmt: QFormat) -> "Constant":
+        """ Build a Constant from an in-range raw integer """
+        c = object.__new__(cls)
+        init = object.__setattr__
+        init(c, "_val_int", raw_int_val)
+        init(c, "_fmt", fmt)
+        init(c, "_val_float", FixedPoint._int_to_float(c, raw_int_val))
+        init(c, "_val_bin", FixedPoint._int_to_bin(c, raw_int_val))
+        return c
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("Constant is immutable")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError("Constant is immutable")
+
+    def __reduce__(self):
+        return Constant._make, (self._val_int, self._fmt)
+
+
+def _make_constant(value: float, int_width: int, fract_width: int, signed: bool, rounding: RoundingMode,
+                   mode: OverflowMode, overflow: OverflowMode | None) -> Constant:
+    """
+    Quantize value into a new Constant, counting overflow and logging the var.
+    mode is the resolved overflow mode and only keys the cache. overflow is passed on as given,
+    so an unset mode warns under the active policy like FixedPoint(float, ...).
+    """
+    fmt = QFormat(int_width, fract_width, signed)
+    raw_int_val = quantize(value, fmt, rounding)
+    if raw_int_val > fmt.max_val or raw_int_val < fmt.min_val:
+        raw_int_val = resolve_overflow(raw_int_val, fmt, overflow, site="const")
+    c = Constant._make(raw_int_val, fmt)
+
+    scope = current_scope()
+    if scope.enabled:
+        scope.log_var(c)
+    return c
+
+
+class QuantCache:
+    """
+    QuantCache memoizes float-to-fixed quantization as shared Constant instances.
+
+    Entries are keyed on (value, format, rounding, overflow mode) and the least recently used
+    entry is evicted once maxsize is reached. Overflow events and the registry var log are only
+    recorded when an entry is first quantized.
+
+    :param maxsize: Number of entries kept
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """ QuantCache class constructor """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize: int = maxsize
+        # lru_cache keeps lookups in C and is safe to share between threads
+        self._lookup = lru_cache(maxsize=maxsize)(_make_constant)
+
+    def __len__(self) -> int:
+        return self._lookup.cache_info().currsize
+
+    @property
+    def hits(self) -> int:
+        return self._lookup.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        return self._lookup.cache_info().misses
+
+    def get(self, value: float, fmt: QFormat, rounding: RoundingMode = RoundingMode.CONVERGENT,
+            overflow: OverflowMode | None = None) -> Constant:
+        """ Shared Constant for value quantized into fmt """
+        mode = current_policy().mode if overflow is None else overflow
+        return self._lookup(value, fmt.int_width, fmt.fract_width, fmt.signed, rounding, mode, overflow)
+
+    def clear(self) -> None:
+        self._lookup.cache_clear()
+
+
+# Process-wide cache used by const()
+default_cache = QuantCache()
+
+
+def const(value: float, int_width: int, fract_width: int, signed: bool = False,
+          rounding: RoundingMode = RoundingMode.CONVERGENT, overflow: OverflowMode | None = None) -> Constant:
+    """
+    Shared, immutable FixedPoint for a real-valued constant, e.g. a filter coefficient in a loop.
+
+    The first call quantizes value and later calls with the same arguments return the same
+    instance from default_cache. value is always a real number, never a raw integer.
+
+    :param value: Real value to quantize
+    :param int_width: Number of integer bits (not including sign)
+    :param fract_width: Number of fractional bits
+    :param signed: Whether the value is signed (two's complement)
+    :param rounding: How value * 2ⁿ is rounded to an integer, CONVERGENT matches FixedPoint(float, ...)
+    :param overflow: How to handle out-of-range values, defaults to the active overflow policy
+    """
+    mode = current_policy().mode if overflow is None else overflow
+    return default_cache._lookup(value, int_width, fract_width, bool(signed), rounding, mode, overflow)
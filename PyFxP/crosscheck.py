@@ -0,0 +1,554 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Callable, Iterator, Sequence
+
+from .compiler import compile_kernel
+from .filters import FIRFilter, Quantizer
+from .fix_point import FixedPoint
+from .fix_point_array import FixedPointArray
+from .kernels import dot, mac
+from .overflow import OverflowMode, overflow_policy
+from .q_format import QFormat
+from .rounding import RoundingMode
+
+
+OPS = ("add", "sub", "mul", "lshift", "rshift", "resize", "bsl_scale", "bsr_scale", "mac", "dot", "fir")
+
+# Ops spanning several operands per format, checked on the scalar and array paths only
+_KERNEL_OPS = ("mac", "dot", "fir")
+
+# Widest format generated, in bits incl. sign, covering native, two-limb and object storage
+MAX_WIDTH = 140
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    One op on concrete operands, evaluated under one overflow mode.
+
+    params depend on the op:
+        lshift, rshift, bsl_scale: (n,)
+        bsr_scale: (n, rounding)
+        resize: (int_width, fract_width, signed, rounding)
+        mac: (rounding,), with fmts and raws (acc, a, b)
+        dot: (n, rounding), with fmts (coeff, sample[, acc]) and raws n coefficients then n samples
+        fir: (n_taps, rounding), with fmts (coeff, input, acc) and raws n_taps coefficients then
+            the input block, quantizing each product and sum into acc
+    """
+    op: str
+    fmts: tuple[QFormat, ...]
+    raws: tuple[int, ...]
+    params: tuple = ()
+    overflow: OverflowMode = OverflowMode.SATURATE
+
+    def reproducer(self) -> str:
+        """ Python source evaluating the case on the scalar path, or the array path for fir """
+        args = [f"FixedPoint._create({raw}, {fmt!r})" for raw, fmt in zip(self.raws, _raw_fmts(self))]
+        n = self.params[0] if self.op in ("dot", "fir") else 0
+        match self.op:
+            case "mac":
+                expr = f"mac({', '.join(args)}, {self.params[0]})"
+            case "dot":
+                acc = self.fmts[2] if len(self.fmts) > 2 else None
+                expr = f"dot([{', '.join(args[:n])}], [{', '.join(args[n:])}], {acc!r}, {self.params[1]})"
+            case "fir":
+                coeff, inp, acc = self.fmts
+                expr = (f"FIRFilter(FixedPointArray.from_fixed_points([{', '.join(args[:n])}]), {inp!r}, "
+                        f"product=Quantizer({acc!r}, {self.params[1]}), accumulator=Quantizer({acc!r}))"
+                        f".process(FixedPointArray.from_fixed_points([{', '.join(args[n:])}]))")
+            case "add" | "sub" | "mul":
+                expr = f"{args[0]} {dict(add='+', sub='-', mul='*')[self.op]} {args[1]}"
+            case "lshift" | "rshift":
+                expr = f"{args[0]} {'<<' if self.op == 'lshift' else '>>'} {self.params[0]}"
+            case _:
+                expr = f"{args[0]}.{self.op}({', '.join(map(str, self.params))})"
+        return f"with overflow_policy({self.overflow}, warn=False):\n    result = {expr}"
+
+
+def _raw_fmts(case: Case) -> tuple[QFormat, ...]:
+    """ Format of each raw operand """
+    if case.op in ("dot", "fir"):
+        n = case.params[0]
+        return (case.fmts[0],) * n + (case.fmts[1],) * (len(case.raws) - n)
+    return case.fmts[:len(case.raws)]
+
+
+# Outcome of a case on one path: (raw, format), ((raw, ...), format) for fir, or the name of
+# the exception raised. A path returns None for ops it does not implement.
+Outcome = tuple[int | tuple[int, ...], QFormat] | str | None
+
+
+def _round_shift(x: int, k: int, rounding: RoundingMode) -> int:
+    """ x / 2^k rounded to an integer, written independently of rounding.shift_round """
+    if k <= 0:
+        return x << -k
+    q, r = divmod(x, 1 << k)
+    half = 1 << (k - 1)
+    match rounding:
+        case RoundingMode.FLOOR:
+            return q
+        case RoundingMode.CEIL:
+            return q + (r > 0)
+        case RoundingMode.HALF_UP:
+            return q + (r >= half)
+        case RoundingMode.CONVERGENT:
+            return q + (r > half or (r == half and q % 2 == 1))
+        case _:
+            return q + (r > 0 and x < 0)
+
+
+class _Overflow(Exception):
+    pass
+
+
+def _resolve(value: int, fmt: QFormat, overflow: OverflowMode) -> int:
+    """ value held in fmt under the overflow mode, raising _Overflow for RAISE """
+    width = fmt.int_width + fmt.fract_width + fmt.signed
+    lo, hi = (-(1 << (width - 1)), (1 << (width - 1)) - 1) if fmt.signed else (0, (1 << width) - 1)
+    if lo <= value <= hi:
+        return value
+    if overflow is OverflowMode.SATURATE:
+        return min(max(value, lo), hi)
+    if overflow is OverflowMode.WRAP:
+        return (value - lo) % (1 << width) + lo
+    raise _Overflow
+
+
+def _reference_kernel(case: Case) -> Outcome:
+    """ Reference model of the fused kernels and the FIR filter """
+    match case.op:
+        case "mac":
+            (acc, a, b), (x, y, z) = case.fmts, case.raws
+            prod_fract = a.fract_width + b.fract_width
+            fract = max(acc.fract_width, prod_fract)
+            total = (x << (fract - acc.fract_width)) + ((y * z) << (fract - prod_fract))
+            return _resolve(_round_shift(total, fract - acc.fract_width, case.params[0]), acc, case.overflow), acc
+        case "dot":
+            n, rounding = case.params
+            c, s = case.fmts[:2]
+            fract = c.fract_width + s.fract_width
+            if len(case.fmts) > 2:
+                acc = case.fmts[2]
+            else:
+                # Full-precision product format, widened so n terms cannot overflow
+                acc = QFormat(c.int_width + s.int_width + (c.signed and s.signed) + (n - 1).bit_length(), fract,
+                              c.signed or s.signed)
+            total = sum(x * y for x, y in zip(case.raws[:n], case.raws[n:]))
+            return _resolve(_round_shift(total, fract - acc.fract_width, rounding), acc, case.overflow), acc
+        case _:
+            n_taps, rounding = case.params
+            c, s, acc = case.fmts
+            taps, block = case.raws[:n_taps], case.raws[n_taps:]
+            history = (0,) * (n_taps - 1) + block
+            fract = c.fract_width + s.fract_width
+            out = []
+            for i in range(len(block)):
+                total = 0
+                for k, tap in enumerate(taps):
+                    prod = _resolve(_round_shift(tap * history[n_taps - 1 + i - k], fract - acc.fract_width, rounding),
+                                    acc, case.overflow)
+                    total = prod if k == 0 else _resolve(total + prod, acc, case.overflow)
+                out.append(total)
+            return tuple(out), acc
+
+
+def reference(case: Case) -> Outcome:
+    """
+    Reference integer model of every op, built from the Qm.n rules with plain Python ints and
+    sharing no code with FixedPoint, QFormat or the kernels.
+    """
+    if case.op in _KERNEL_OPS:
+        try:
+            return _reference_kernel(case)
+        except _Overflow:
+            return "OverflowError"
+
+    f = case.fmts[0]
+    x = case.raws[0]
+    s1 = int(f.signed)
+    match case.op:
+        case "add" | "sub" | "mul":
+            g, y = case.fmts[1], case.raws[1]
+            s2 = int(g.signed)
+            signed = bool(s1 or s2)
+            if case.op == "mul":
+                fmt = QFormat(f.int_width + g.int_width + (s1 and s2), f.fract_width + g.fract_width, signed)
+                value = x * y
+            elif f.fract_width != g.fract_width:
+                return "ValueError"
+            elif case.op == "add":
+                fmt = QFormat(max(f.int_width + s1, g.int_width + s2) + 1 - signed, f.fract_width, signed)
+                value = x + y
+            else:
+                fmt = QFormat(max(f.int_width, g.int_width) + 1, f.fract_width, signed)
+                value = x - y
+        case "lshift" | "bsl_scale":
+            fmt, value = f, x << case.params[0]
+        case "rshift":
+            # Arithmetic for signed formats, logical on the bit pattern for unsigned ones
+            fmt, value = f, (x if f.signed else x % (1 << f.total_width)) >> case.params[0]
+        case "bsr_scale":
+            fmt, value = f, _round_shift(x, case.params[0], case.params[1])
+        case "resize":
+            int_width, fract_width, signed, rounding = case.params
+            fmt, value = QFormat(int_width, fract_width, signed), _round_shift(x, f.fract_width - fract_width, rounding)
+        case _:
+            raise ValueError(f"Unknown op {case.op!r}")
+
+    try:
+        return _resolve(value, fmt, case.overflow), fmt
+    except _Overflow:
+        return "OverflowError"
+
+
+def _apply(case: Case, *operands):
+    """ Apply the case's op to FixedPoint or FixedPointArray operands """
+    a = operands[0]
+    match case.op:
+        case "add":
+            return a + operands[1]
+        case "sub":
+            return a - operands[1]
+        case "mul":
+            return a * operands[1]
+        case "lshift":
+            return a << case.params[0]
+        case "rshift":
+            return a >> case.params[0]
+        case "bsl_scale":
+            return a.bsl_scale(case.params[0])
+        case "bsr_scale":
+            return a.bsr_scale(case.params[0], case.params[1])
+        case _:
+            return a.resize(*case.params)
+
+
+def _scalars(case: Case) -> list[FixedPoint]:
+    return [FixedPoint._create(raw, fmt) for raw, fmt in zip(case.raws, _raw_fmts(case))]
+
+
+def scalar_path(case: Case) -> Outcome:
+    """ FixedPoint ops, and mac/dot on FixedPoint operands """
+    match case.op:
+        case "mac":
+            result = mac(*_scalars(case), rounding=case.params[0])
+        case "dot":
+            operands, n = _scalars(case), case.params[0]
+            result = dot(operands[:n], operands[n:], case.fmts[2] if len(case.fmts) > 2 else None, case.params[1])
+        case "fir":
+            return None
+        case _:
+            result = _apply(case, *_scalars(case))
+    return result.val_int, result.fmt
+
+
+def _arrays(case: Case) -> list[FixedPointArray]:
+    return [FixedPointArray.from_fixed_points([x]) for x in _scalars(case)]
+
+
+def array_path(case: Case) -> Outcome:
+    """
+    FixedPointArray ops, on native, two-limb or object storage depending on the formats. mac
+    runs on one-element arrays, dot on a batch of one row and fir through FIRFilter.process.
+    """
+    match case.op:
+        case "mac":
+            result = mac(*_arrays(case), rounding=case.params[0])
+        case "dot" | "fir":
+            operands, n = _scalars(case), case.params[0]
+            coeffs, samples = FixedPointArray.from_fixed_points(operands[:n]), FixedPointArray.from_fixed_points(operands[n:])
+            if case.op == "fir":
+                coeff_fmt, input_fmt, acc = case.fmts
+                fir = FIRFilter(coeffs, input_fmt, product=Quantizer(acc, case.params[1]), accumulator=Quantizer(acc))
+                result = fir.process(samples)
+                return tuple(int(raw) for raw in result.val_int), result.fmt
+            batch = FixedPointArray._create(samples._val_int.reshape(1, n), samples.fmt)
+            result = dot(coeffs, batch, case.fmts[2] if len(case.fmts) > 2 else None, case.params[1])
+        case _:
+            result = _apply(case, *_arrays(case))
+    return int(result.val_int[0]), result.fmt
+
+
+@lru_cache(maxsize=1024)
+def _kernel(op: str, fmts: tuple[QFormat, ...], params: tuple):
+    probe = Case(op, fmts, (0,) * len(fmts), params)
+    return compile_kernel(lambda *operands: _apply(probe, *operands), *fmts)
+
+
+def compiled_path(case: Case) -> Outcome:
+    """ Kernel compiled from a trace of the scalar op, run on arrays """
+    if case.op in _KERNEL_OPS:
+        return None
+    result = _kernel(case.op, case.fmts, case.params)(*_arrays(case))
+    return int(result.val_int[0]), result.fmt
+
+
+# Paths compared against the reference model by default
+PATHS: dict[str, Callable[[Case], Outcome]] = {
+    "scalar": scalar_path,
+    "array": array_path,
+    "compiled": compiled_path,
+}
+
+
+def evaluate(case: Case, paths: dict[str, Callable[[Case], Outcome]] | None = None) -> dict[str, Outcome]:
+    """ Outcome of the case under the reference model and every path """
+    outcomes = {"reference": reference(case)}
+    for name, path in (PATHS if paths is None else paths).items():
+        try:
+            with overflow_policy(case.overflow, warn=False):
+                outcomes[name] = path(case)
+        except Exception as e:
+            outcomes[name] = type(e).__name__
+    return outcomes
+
+
+def _mismatch(outcomes: dict[str, Outcome]) -> bool:
+    expected = outcomes["reference"]
+    return any(outcome is not None and outcome != expected for outcome in outcomes.values())
+
+
+def _random_fmt(rng: random.Random, fract_width: int | None = None, width: int | None = None) -> QFormat:
+    # Mostly narrow formats, with a share around the 64-bit and 128-bit storage boundaries
+    if width is None:
+        width = rng.choice((rng.randint(1, 16), rng.randint(1, 16), rng.randint(48, 80), rng.randint(112, MAX_WIDTH)))
+    signed = rng.random() < 0.6
+    if fract_width is None:
+        fract_width = rng.randint(0, width - signed)
+    int_width = max(width - signed - fract_width, 0 if signed or fract_width else 1)
+    return QFormat(int_width, fract_width, signed)
+
+
+def _random_raw(rng: random.Random, fmt: QFormat) -> int:
+    # Bounds and values near zero are where sign and carry handling go wrong
+    match rng.randint(0, 5):
+        case 0:
+            return fmt.min_val
+        case 1:
+            return fmt.max_val
+        case 2:
+            return min(max(rng.randint(-2, 2), fmt.min_val), fmt.max_val)
+        case _:
+            return rng.randint(fmt.min_val, fmt.max_val)
+
+
+def _boundary_width(rng: random.Random) -> int:
+    # Kernel sums sized to land on either side of the native and two-limb storage limits
+    return rng.choice((rng.randint(2, 24), rng.randint(62, 65), rng.randint(126, 129)))
+
+
+def _product_fmts(rng: random.Random, width: int) -> tuple[QFormat, QFormat]:
+    """ Two operand formats whose product is about width bits wide """
+    a = rng.randint(1, max(width - 1, 1))
+    return _random_fmt(rng, width=a), _random_fmt(rng, width=max(width - a, 1))
+
+
+def _near(rng: random.Random, width: int) -> int:
+    return min(max(width + rng.randint(-3, 3), 1), MAX_WIDTH)
+
+
+def random_case(rng: random.Random, ops: Sequence[str] = OPS) -> Case:
+    """ Random case with random formats, operands and overflow mode """
+    op = rng.choice(ops)
+    fmt = _random_fmt(rng)
+    fmts = (fmt,)
+    params: tuple = ()
+    rounding = rng.choice(list(RoundingMode))
+
+    match op:
+        case "add" | "sub":
+            fmts = (fmt, _random_fmt(rng, fmt.fract_width))
+        case "mul":
+            fmts = (fmt, _random_fmt(rng))
+        case "lshift" | "rshift" | "bsl_scale":
+            params = (rng.randint(0, fmt.total_width + 2),)
+        case "bsr_scale":
+            params = (rng.randint(0, fmt.total_width + 2), rounding)
+        case "resize":
+            new = _random_fmt(rng)
+            params = (new.int_width, new.fract_width, new.signed, rounding)
+        case "mac":
+            width = _boundary_width(rng)
+            acc = _random_fmt(rng, width=_near(rng, width) if rng.random() < 0.5 else None)
+            fmts = (acc,) + _product_fmts(rng, width)
+            params = (rounding,)
+        case "dot":
+            width, n = _boundary_width(rng), rng.randint(1, 4)
+            fmts = _product_fmts(rng, max(width - (n - 1).bit_length(), 2))
+            if rng.random() < 0.5:
+                fmts += (_random_fmt(rng, width=_near(rng, width)),)
+            params = (n, rounding)
+        case "fir":
+            width, n_taps = _boundary_width(rng), rng.randint(1, 4)
+            fmts = _product_fmts(rng, width) + (_random_fmt(rng, width=_near(rng, width)),)
+            params = (n_taps, rounding)
+
+    raw_fmts = fmts
+    if op in ("dot", "fir"):
+        n_samples = params[0] if op == "dot" else rng.randint(1, 6)
+        raw_fmts = (fmts[0],) * params[0] + (fmts[1],) * n_samples
+
+    # Kernel sums only reach the top of their width when every operand is at a bound
+    if op in _KERNEL_OPS and rng.random() < 0.3:
+        top = rng.random() < 0.5
+        raws = tuple(f.max_val if top else rng.choice((f.min_val, f.max_val)) for f in raw_fmts)
+    else:
+        raws = tuple(_random_raw(rng, f) for f in raw_fmts)
+    return Case(op, fmts, raws, params, rng.choice(list(OverflowMode)))
+
+
+def _shrink_candidates(case: Case) -> Iterator[Case]:
+    """ Simpler variants of a case, smallest changes to operands last """
+    # Fewer bits in the operand formats, keeping operands in range and add/sub fractions aligned
+    raw_fmts = _raw_fmts(case)
+    for k, fmt in enumerate(case.fmts):
+        for int_width, fract_width, signed in ((fmt.int_width - 1, fmt.fract_width, fmt.signed),
+                                               (fmt.int_width, fmt.fract_width - 1, fmt.signed),
+                                               (fmt.int_width + 1, fmt.fract_width, False)):
+            if int_width < 0 or fract_width < 0 or not 1 <= int_width + fract_width + signed <= fmt.total_width:
+                continue
+            smaller = QFormat(int_width, fract_width, signed)
+            if smaller is fmt or not all(smaller.min_val <= raw <= smaller.max_val
+                                         for raw, raw_fmt in zip(case.raws, raw_fmts) if raw_fmt is fmt):
+                continue
+            fmts = case.fmts[:k] + (smaller,) + case.fmts[k + 1:]
+            if case.op in ("add", "sub") and fmts[0].fract_width != fmts[1].fract_width:
+                continue
+            yield replace(case, fmts=fmts)
+
+    # Fewer taps and samples
+    if case.op in ("dot", "fir") and case.params[0] > 1:
+        n = case.params[0]
+        for k in range(n):
+            raws = case.raws[:k] + case.raws[k + 1:]
+            if case.op == "dot":
+                raws = raws[:n - 1 + k] + raws[n + k:]
+            yield replace(case, raws=raws, params=(n - 1,) + case.params[1:])
+    if case.op == "fir" and len(case.raws) > case.params[0] + 1:
+        yield replace(case, raws=case.raws[:-1])
+
+    # Simpler params: smaller shifts, FLOOR rounding, a narrower resize target
+    params = case.params
+    if case.op in ("lshift", "rshift", "bsl_scale", "bsr_scale") and params[0] > 0:
+        yield replace(case, params=(params[0] // 2,) + params[1:])
+        yield replace(case, params=(params[0] - 1,) + params[1:])
+    if case.op == "resize":
+        int_width, fract_width, signed, rounding = params
+        if int_width > 0 and int_width + fract_width + signed > 1:
+            yield replace(case, params=(int_width - 1, fract_width, signed, rounding))
+        if fract_width > 0 and int_width + fract_width + signed > 1:
+            yield replace(case, params=(int_width, fract_width - 1, signed, rounding))
+    if params and params[-1] is not RoundingMode.FLOOR and isinstance(params[-1], RoundingMode):
+        yield replace(case, params=params[:-1] + (RoundingMode.FLOOR,))
+
+    if case.overflow is not OverflowMode.SATURATE:
+        yield replace(case, overflow=OverflowMode.SATURATE)
+
+    # Operands closer to zero
+    for k, raw in enumerate(case.raws):
+        for smaller in (0, raw // 2 if raw > 0 else -(-raw // 2), raw - 1 if raw > 0 else raw + 1):
+            if smaller != raw and raw_fmts[k].min_val <= smaller <= raw_fmts[k].max_val:
+                yield replace(case, raws=case.raws[:k] + (smaller,) + case.raws[k + 1:])
+
+
+def shrink(case: Case, paths: dict[str, Callable[[Case], Outcome]] | None = None, max_steps: int = 10000) -> Case:
+    """
+    Greedily simplify a failing case while it keeps failing: narrower formats, smaller shifts,
+    FLOOR rounding and operands closer to zero. Returns the case once no simpler variant fails.
+    """
+    for _ in range(max_steps):
+        for candidate in _shrink_candidates(case):
+            if _mismatch(evaluate(candidate, paths)):
+                case = candidate
+                break
+        else:
+            return case
+    return case
+
+
+@dataclass
+class Mismatch:
+    """ A failing case, its minimal reproducer and the outcomes of both """
+    case: Case
+    outcomes: dict[str, Outcome]
+    shrunk: Case
+    shrunk_outcomes: dict[str, Outcome]
+
+
+@dataclass
+class CrossCheckReport:
+    """ Cases run and mismatches found, in the order their batches were generated """
+    n_cases: int = 0
+    mismatches: list[Mismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    def report(self) -> str:
+        """ Summary and each distinct minimal reproducer with the outcome of every path """
+        distinct = {m.shrunk: m for m in self.mismatches}
+        lines = [f"{self.n_cases} cases, {len(self.mismatches)} mismatches, {len(distinct)} distinct reproducers"]
+        for m in distinct.values():
+            lines.append("")
+            lines.append(m.shrunk.reproducer())
+            lines.extend(f"    {name}: {outcome}" for name, outcome in m.shrunk_outcomes.items())
+        return "\n".join(lines)
+
+
+def _run_batch(seed: int, batch: int, n_cases: int, ops: Sequence[str],
+               paths: dict[str, Callable[[Case], Outcome]] | None, max_failures: int) -> list[Mismatch]:
+    """ Worker entry point, generating and checking one batch of cases """
+    rng = random.Random(f"{seed}:{batch}")
+    mismatches = []
+    for _ in range(n_cases):
+        case = random_case(rng, ops)
+        outcomes = evaluate(case, paths)
+        if _mismatch(outcomes):
+            shrunk = shrink(case, paths)
+            mismatches.append(Mismatch(case, outcomes, shrunk, evaluate(shrunk, paths)))
+            if len(mismatches) >= max_failures:
+                break
+    return mismatches
+
+
+def run_crosscheck(n_cases: int = 10000, seed: int = 0, ops: Sequence[str] = OPS,
+                   paths: dict[str, Callable[[Case], Outcome]] | None = None, batch_size: int = 500,
+                   max_failures: int = 10, max_workers: int | None = None) -> CrossCheckReport:
+    """
+    Compare every path against the reference integer model on random cases, bit for bit.
+
+    Cases are generated in batches of batch_size, each from its own seed, so a run is
+    reproducible regardless of the number of workers. Each failing case is shrunk to a minimal
+    reproducer. A batch stops after max_failures mismatches.
+
+    Custom paths map a name to a function taking a Case and returning (raw, format). They must
+    be picklable (module-level functions) when running on a process pool.
+
+    :param n_cases: Number of random cases
+    :param seed: Base seed of the case generator
+    :param ops: Ops to generate cases for
+    :param paths: Paths to check, defaults to PATHS (scalar, array and compiled)
+    :param batch_size: Cases per job
+    :param max_failures: Mismatches kept per batch
+    :param max_workers: Worker processes, 0 runs every batch in the calling process
+    """
+    unknown = set(ops) - set(OPS)
+    if unknown:
+        raise ValueError(f"Unknown ops {sorted(unknown)}")
+
+    sizes = [min(batch_size, n_cases - start) for start in range(0, n_cases, batch_size)]
+    report = CrossCheckReport(n_cases=n_cases)
+    if max_workers == 0:
+        for batch, size in enumerate(sizes):
+            report.mismatches.extend(_run_batch(seed, batch, size, ops, paths, max_failures))
+        return report
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        jobs = [pool.submit(_run_batch, seed, batch, size, tuple(ops), paths, max_failures)
+                for batch, size in enumerate(sizes)]
+        for job in jobs:
+            report.mismatches.extend(job.result())
+    return report
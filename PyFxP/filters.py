@@ -0,0 +1,324 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from .fix_point_array import FixedPointArray, _NATIVE_WIDTH
+from .overflow import OverflowMode, resolve_overflow, resolve_overflow_array
+from .q_format import QFormat
+from .rounding import RoundingMode, _INT_SHIFT_ROUND, shift_round
+
+
+@dataclass(frozen=True)
+class Quantizer:
+    """ Requantization applied at one filter stage, equivalent to FixedPoint.resize """
+    fmt: QFormat
+    rounding: RoundingMode = RoundingMode.FLOOR
+    overflow: OverflowMode | None = None
+
+    def apply(self, arr: FixedPointArray) -> FixedPointArray:
+        return arr.resize(self.fmt.int_width, self.fmt.fract_width, self.fmt.signed, self.rounding, self.overflow)
+
+    def apply_raw(self, raw: int, fmt: QFormat, site: str) -> int:
+        """ Scalar resize of a raw integer held in fmt, without building a FixedPoint """
+        raw = shift_round(raw, fmt.fract_width - self.fmt.fract_width, self.rounding)
+        if raw > self.fmt.max_val or raw < self.fmt.min_val:
+            raw = resolve_overflow(raw, self.fmt, self.overflow, site)
+        return raw
+
+    def apply_raw_array(self, raw: np.ndarray, fmt: QFormat, site: str) -> np.ndarray:
+        """ apply_raw on an array of raw integers held in fmt """
+        raw = shift_round(raw, fmt.fract_width - self.fmt.fract_width, self.rounding)
+        return resolve_overflow_array(raw, self.fmt, self.overflow, site)
+
+    def _width(self, fmt: QFormat) -> int:
+        """ Bits needed to hold a raw integer from fmt while it is shifted onto this quantizer's format """
+        return fmt.total_width + max(self.fmt.fract_width - fmt.fract_width, 0)
+
+    def _int_step(self, fmt: QFormat) -> tuple:
+        """
+        Constants for applying this quantizer inline to Python ints held in fmt:
+        (round, shift, check, min_val, max_val), where round is None if no bits are dropped.
+        """
+        shift = fmt.fract_width - self.fmt.fract_width
+        return _INT_SHIFT_ROUND[self.rounding] if shift > 0 else None, shift, True, self.fmt.min_val, self.fmt.max_val
+
+
+def _as_coeffs(coeffs: FixedPointArray | Sequence[float], coeff_fmt: QFormat | None) -> FixedPointArray:
+    if isinstance(coeffs, FixedPointArray):
+        return coeffs
+    if coeff_fmt is None:
+        raise ValueError("coeff_fmt is required when coefficients are given as floats")
+    return FixedPointArray(np.asarray(coeffs, dtype=np.float64), coeff_fmt.int_width, coeff_fmt.fract_width, coeff_fmt.signed)
+
+
+class FIRFilter:
+    """
+    FIRFilter models a direct-form FIR filter with bit-true fixed-point semantics.
+
+    Each output is computed as the FixedPoint chain
+
+        acc = Q_acc(Q_prod(c[0] * x[n]))
+        acc = Q_acc(acc + Q_prod(c[k] * x[n - k]))      for k = 1 .. N-1
+        y[n] = Q_out(acc)
+
+    where an omitted quantizer leaves the full-precision result of __mul__/__add__ untouched.
+    Whole blocks are processed with one vectorized op per tap, and the last N-1 input samples
+    are carried across blocks so a signal can be streamed in pieces.
+
+    :param coeffs: Coefficients as a FixedPointArray, or floats quantized to coeff_fmt
+    :param input_fmt: Format of input samples
+    :param coeff_fmt: Coefficient format, required when coeffs are floats
+    :param product: Quantizer applied to each product
+    :param accumulator: Quantizer applied after each accumulation
+    :param output: Quantizer applied to each output sample
+    """
+
+    def __init__(self, coeffs: FixedPointArray | Sequence[float], input_fmt: QFormat, coeff_fmt: QFormat | None = None,
+                 product: Quantizer | None = None, accumulator: Quantizer | None = None, output: Quantizer | None = None):
+        """ FIRFilter class constructor """
+
+        self.coeffs: FixedPointArray = _as_coeffs(coeffs, coeff_fmt)
+        self.input_fmt: QFormat = input_fmt
+        self.product: Quantizer | None = product
+        self.accumulator: Quantizer | None = accumulator
+        self.output: Quantizer | None = output
+
+        self._taps = self.coeffs.to_fixed_points()
+        self.reset()
+
+    @property
+    def output_fmt(self) -> QFormat:
+        """ Format of output samples, resolved as the FixedPoint chain would """
+        fmt = self.coeffs.fmt.mul(self.input_fmt)
+        prod_fmt = fmt if self.product is None else self.product.fmt
+        acc_fmt = prod_fmt if self.accumulator is None else self.accumulator.fmt
+        for _ in range(len(self._taps) - 1):
+            acc_fmt = acc_fmt.add(prod_fmt) if self.accumulator is None else self.accumulator.fmt
+        return acc_fmt if self.output is None else self.output.fmt
+
+    def reset(self) -> None:
+        """ Clear the input history to zeros """
+        self._history = FixedPointArray._create(np.zeros(len(self._taps) - 1, dtype=np.int64), self.input_fmt)
+
+    def _as_input(self, block: FixedPointArray | np.ndarray) -> FixedPointArray:
+        if not isinstance(block, FixedPointArray):
+            fmt = self.input_fmt
+            return FixedPointArray(np.asarray(block, dtype=np.float64), fmt.int_width, fmt.fract_width, fmt.signed)
+        if block.fmt is not self.input_fmt:
+            raise ValueError(f"Input block format {block.fmt} does not match {self.input_fmt}")
+        return block
+
+    def process(self, block: FixedPointArray | np.ndarray) -> FixedPointArray:
+        """ Filter one block of input samples, continuing from the previous block's state """
+        block = self._as_input(block)
+        n_taps, n = len(self._taps), len(block)
+
+        window = np.concatenate([self._history._val_int, block._val_int])
+        history = window[n:] if n_taps > 1 else window[:0]
+        window = FixedPointArray._create(window, self.input_fmt)
+
+        acc = None
+        for k, coeff in enumerate(self._taps):
+            # x[n - k] for every n in the block
+            prod = coeff * window[n_taps - 1 - k:n_taps - 1 - k + n]
+            if self.product is not None:
+                prod = self.product.apply(prod)
+
+            acc = prod if acc is None else acc + prod
+            if self.accumulator is not None:
+                acc = self.accumulator.apply(acc)
+
+        self._history = FixedPointArray._create(history, self.input_fmt)
+        return acc if self.output is None else self.output.apply(acc)
+
+
+class IIRFilter:
+    """
+    IIRFilter models a direct-form I IIR filter with bit-true fixed-point semantics.
+
+    Each output is computed as the FixedPoint chain
+
+        acc = Q_acc(Q_prod(b[0] * x[n]))
+        acc = Q_acc(acc + Q_prod(b[k] * x[n - k]))      for k = 1 .. len(b)-1
+        acc = Q_acc(acc - Q_prod(a[k] * y[n - k]))      for k = 1 .. len(a)-1
+        y[n] = Q_out(acc)
+
+    with a[0] taken as 1. The feed-forward terms only depend on the input, so they are
+    computed for a whole block at once on raw integer arrays (int64 when every intermediate
+    width fits). The feedback terms make samples depend on each other, so they run one sample
+    at a time on Python ints with every format and quantizer constant resolved up front.
+    Input and output history is carried across blocks.
+
+    :param b: Feed-forward coefficients as a FixedPointArray, or floats quantized to coeff_fmt
+    :param a: Feedback coefficients a[1:], as a FixedPointArray or floats quantized to coeff_fmt
+    :param input_fmt: Format of input samples
+    :param output: Quantizer applied to each output sample, which also fixes the feedback format
+    :param coeff_fmt: Coefficient format, required when coefficients are floats
+    :param product: Quantizer applied to each product
+    :param accumulator: Quantizer applied after each accumulation
+    """
+
+    def __init__(self, b: FixedPointArray | Sequence[float], a: FixedPointArray | Sequence[float], input_fmt: QFormat,
+                 output: Quantizer, coeff_fmt: QFormat | None = None, product: Quantizer | None = None,
+                 accumulator: Quantizer | None = None):
+        """ IIRFilter class constructor """
+
+        self.b: FixedPointArray = _as_coeffs(b, coeff_fmt)
+        self.a: FixedPointArray = _as_coeffs(a, coeff_fmt)
+        self.input_fmt: QFormat = input_fmt
+        self.output: Quantizer = output
+        self.product: Quantizer | None = product
+        self.accumulator: Quantizer | None = accumulator
+
+        if len(self.b) == 0:
+            raise ValueError("IIRFilter needs at least one feed-forward coefficient")
+
+        self._plan = self._resolve_plan()
+        self._feedback = self._resolve_feedback()
+        self.reset()
+
+    def _resolve_plan(self) -> list[tuple]:
+        """
+        Resolve every step's operand and result formats once.
+        Each step is (coeff raw, source, delay, is_sub, full product fmt, sum fmt), where the
+        sum fmt is the format of acc +/- product before accumulator quantization.
+        """
+        plan = []
+        acc_fmt = None
+        widths = [self.input_fmt.total_width]
+        terms = [(int(c), "x", k, self.b.fmt, self.input_fmt) for k, c in enumerate(self.b.val_int)]
+        terms += [(int(c), "y", k + 1, self.a.fmt, self.output.fmt) for k, c in enumerate(self.a.val_int)]
+
+        for coeff, source, delay, coeff_fmt, sample_fmt in terms:
+            full_fmt = coeff_fmt.mul(sample_fmt)
+            prod_fmt = full_fmt if self.product is None else self.product.fmt
+
+            is_sub = source == "y"
+            if acc_fmt is None:
+                acc_fmt = prod_fmt
+            else:
+                acc_fmt = acc_fmt.sub(prod_fmt) if is_sub else acc_fmt.add(prod_fmt)
+            plan.append((coeff, source, delay, is_sub, full_fmt, acc_fmt))
+
+            if not is_sub:
+                # Mixed-sign sums can exceed their format by one bit before overflow handling
+                widths += [full_fmt.total_width, acc_fmt.total_width + 1]
+                widths += [self.product._width(full_fmt)] if self.product is not None else []
+                widths += [self.accumulator._width(acc_fmt)] if self.accumulator is not None else []
+            if self.accumulator is not None:
+                acc_fmt = self.accumulator.fmt
+
+        # Raw feed-forward arrays stay in int64 when no intermediate value can exceed it
+        self._dtype = np.int64 if max(widths) <= _NATIVE_WIDTH else object
+        self._acc_fmt = acc_fmt
+        return plan
+
+    def _resolve_feedback(self) -> list[tuple]:
+        """
+        Flatten the feedback steps for the per-sample loop, each as (coeff raw, index into the
+        output history, *product step, *sum check, sum fmt, *accumulator step). A step is (round,
+        shift, check, min_val, max_val) as from Quantizer._int_step and a sum check is (check,
+        min_val, max_val). Outputs are bounded by the output format, so the reachable range of
+        every intermediate is tracked and checks that cannot fire are switched off.
+        """
+        def reach(lo: int, hi: int, step: tuple) -> tuple[tuple, int, int]:
+            round_fn, shift, _, min_val, max_val = step
+            if shift > 0:
+                lo, hi = lo >> shift, -(-hi >> shift)
+            elif shift < 0:
+                lo, hi = lo << -shift, hi << -shift
+            check = lo < min_val or hi > max_val
+            return (round_fn, shift, check, min_val, max_val), max(lo, min_val), min(hi, max_val)
+
+        # Accumulator after the feed-forward terms, bounded by its format
+        fmt = self._plan[len(self.b) - 1][5] if self.accumulator is None else self.accumulator.fmt
+        acc_lo, acc_hi = fmt.min_val, fmt.max_val
+        y_lo, y_hi = self.output.fmt.min_val, self.output.fmt.max_val
+
+        feedback = []
+        for coeff, _, delay, _, full_fmt, sum_fmt in self._plan[len(self.b):]:
+            unquantized = (None, 0, True, full_fmt.min_val, full_fmt.max_val)
+            prod_step, lo, hi = reach(min(coeff * y_lo, coeff * y_hi), max(coeff * y_lo, coeff * y_hi),
+                                      unquantized if self.product is None else self.product._int_step(full_fmt))
+            sum_step, acc_lo, acc_hi = reach(acc_lo - hi, acc_hi - lo, (None, 0, True, sum_fmt.min_val, sum_fmt.max_val))
+            if self.accumulator is not None:
+                acc_step, acc_lo, acc_hi = reach(acc_lo, acc_hi, self.accumulator._int_step(sum_fmt))
+            else:
+                acc_step = (None, 0, False, sum_fmt.min_val, sum_fmt.max_val)
+            # One flat tuple per step, unpacked once per sample in the loop
+            feedback.append((coeff, delay - 1) + prod_step + sum_step[2:] + (sum_fmt,) + acc_step)
+        return feedback
+
+    def reset(self) -> None:
+        """ Clear input and output history to zeros """
+        # Last len(b) - 1 inputs, oldest first, and last len(a) outputs, newest first
+        self._x = [0] * (len(self.b) - 1)
+        self._y = [0] * len(self.a)
+
+    def _feed_forward(self, window: np.ndarray, n: int) -> np.ndarray:
+        """ Accumulator after the feed-forward terms for each of the last n samples of window """
+        product, accumulator = self.product, self.accumulator
+        n_b = len(self.b)
+
+        acc = None
+        for coeff, _, delay, _, full_fmt, sum_fmt in self._plan[:n_b]:
+            # x[n - delay] for every n in the block
+            prod = coeff * window[n_b - 1 - delay:n_b - 1 - delay + n]
+            if product is not None:
+                prod = product.apply_raw_array(prod, full_fmt, "__mul__")
+
+            acc = prod if acc is None else resolve_overflow_array(acc + prod, sum_fmt, None, "__add__")
+            if accumulator is not None:
+                acc = accumulator.apply_raw_array(acc, sum_fmt, "resize")
+        return acc
+
+    def process(self, block: FixedPointArray | np.ndarray) -> FixedPointArray:
+        """ Filter one block of input samples, continuing from the previous block's state """
+        if not isinstance(block, FixedPointArray):
+            fmt = self.input_fmt
+            block = FixedPointArray(np.asarray(block, dtype=np.float64), fmt.int_width, fmt.fract_width, fmt.signed)
+        elif block.fmt is not self.input_fmt:
+            raise ValueError(f"Input block format {block.fmt} does not match {self.input_fmt}")
+
+        n = len(block)
+        window = np.concatenate([np.array(self._x, dtype=self._dtype), block.val_int.astype(self._dtype)])
+        partial = self._feed_forward(window, n).tolist()
+
+        product, accumulator, output = self.product, self.accumulator, self.output
+        out_round, out_shift, _, out_min, out_max = output._int_step(self._acc_fmt)
+        y_hist = list(self._y)
+        out = []
+
+        for acc in partial:
+            for (coeff, index, p_round, p_shift, p_check, p_min, p_max, s_check, s_min, s_max, sum_fmt,
+                 a_round, a_shift, a_check, a_min, a_max) in self._feedback:
+                # Product, quantized inline as Quantizer.apply_raw would
+                prod = coeff * y_hist[index]
+                if p_shift:
+                    prod = p_round(prod, p_shift) if p_round is not None else prod << -p_shift
+                if p_check and (prod > p_max or prod < p_min):
+                    prod = resolve_overflow(prod, product.fmt, product.overflow, "__mul__")
+
+                acc -= prod
+                if s_check and (acc > s_max or acc < s_min):
+                    acc = resolve_overflow(acc, sum_fmt, None, "__sub__")
+
+                if a_shift:
+                    acc = a_round(acc, a_shift) if a_round is not None else acc << -a_shift
+                if a_check and (acc > a_max or acc < a_min):
+                    acc = resolve_overflow(acc, accumulator.fmt, accumulator.overflow, "resize")
+
+            if out_shift:
+                acc = out_round(acc, out_shift) if out_round is not None else acc << -out_shift
+            if acc > out_max or acc < out_min:
+                acc = resolve_overflow(acc, output.fmt, output.overflow, "resize")
+            if y_hist:
+                y_hist.insert(0, acc)
+                y_hist.pop()
+            out.append(acc)
+
+        n_x = len(self.b) - 1
+        self._x = window[len(window) - n_x:].tolist() if n_x else []
+        self._y = y_hist
+        return FixedPointArray._create(np.array(out, dtype=np.int64 if output.fmt.total_width < 64 else object), output.fmt)
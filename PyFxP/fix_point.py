@@ -1,6 +1,18 @@
-import warnings
+from .overflow import OverflowMode, resolve_overflow
+from .q_format import QFormat
+from .rounding import RoundingMode, shift_round
+from .registry import OppType, current_scope
 
-from .registry import Registry, OppType
+
+# Op types as module globals, since every OppType attribute lookup goes through the enum metaclass
+_ADD = OppType.__ADD__
+_SUB = OppType.__SUB__
+_MUL = OppType.__MUL__
+_LSHIFT = OppType.__LSHIFT__
+_RSHIFT = OppType.__RSHIFT__
+_RESIZE = OppType.__RESIZE__
+_BSL_SCALE = OppType.__BSL_SCALE__
+_BSR_SCALE = OppType.__BSR_SCALE__
 
 
 class FixedPoint:
@@ -14,19 +26,16 @@ class FixedPoint:
     :param int_width: Number of integer bits (not including sign)
     :param fract_width: Number of fractional bits
     :param signed: Whether the value is signed (two's complement)
+    :param overflow: How to handle out-of-range values, defaults to the active overflow policy
     """
 
-    def __init__(self, val: int | float | str, int_width: int, fract_width: int, signed: bool = False):
-        """ FixedPoint class construtor """
+    __slots__ = ("_val_int", "_fmt", "_val_float", "_val_bin")
 
-        self._int_width: int = int_width
-        self._fract_width: int = fract_width
-        self._total_width: int = int_width + fract_width + (1 if signed else 0)
-        self._signed: bool = signed
+    def __init__(self, val: int | float | str, int_width: int, fract_width: int, signed: bool = False,
+                 overflow: OverflowMode | None = None):
+        """ FixedPoint class construtor """
 
-        # Define bounds set by Qm.n scheme
-        self._min_val = -(1 << (self._total_width - 1)) if signed else 0
-        self._max_val = (1 << (self._total_width - 1)) - 1 if signed else (1 << self._total_width) - 1
+        fmt = QFormat(int_width, fract_width, signed)
 
         # Convert input value to raw integer representation
         match val:
@@ -34,33 +43,63 @@ class FixedPoint:
                 raw_int_val = val
 
             case float():
-                raw_int_val = round(val * (1 << self._fract_width))
+                raw_int_val = round(val * fmt.scale)
 
             case str():
-                raw_int_val = self._bin_to_int(val)
+                raw_int_val = self._bin_to_int(val, fmt)
                 
             case _:
                 raise TypeError("Value must be float, int, or binary str")
-            
-        # Clip true integer value to range defined by Qm.n scheme
-        if raw_int_val > self._max_val:
-            warnings.warn(f"Overflow: Value {raw_int_val} exceeds maximum {self._max_val} and will be clipped", RuntimeWarning)
-            self._val_int = self._max_val
-        elif raw_int_val < self._min_val:
-            warnings.warn(f"Underflow: Value {raw_int_val} below minimum {self._min_val} and will be clipped", RuntimeWarning)
-            self._val_int = self._min_val
-        else:
-            self._val_int = raw_int_val
 
-        # Define float and binary bit string representations
-        self._val_float = self._int_to_float(self._val_int)
-        self._val_bin = self._int_to_bin(self._val_int)
+        self._init(raw_int_val, fmt, overflow)
+
+    @classmethod
+    def _create(cls, raw_int_val: int, fmt: QFormat, overflow: OverflowMode | None = None, site: str = "construct") -> "FixedPoint":
+        """ Build a FixedPoint from a raw integer and a resolved format, skipping type dispatch """
+        fxp = object.__new__(cls)
+        fxp._init(raw_int_val, fmt, overflow, site)
+        return fxp
+
+    @classmethod
+    def from_raw(cls, raw_int_val: int, fmt: QFormat) -> "FixedPoint":
+        """
+        Build a FixedPoint from a raw integer and a format with the least possible overhead.
+        Skips type dispatch, the range check and registry logging, so raw_int_val must already
+        lie in [fmt.min_val, fmt.max_val], e.g. raw values read back from a file or produced by
+        a quantizer that handled overflow itself.
+        """
+        fxp = object.__new__(cls)
+        fxp._val_int = raw_int_val
+        fxp._fmt = fmt
+        fxp._val_float = None
+        fxp._val_bin = None
+        return fxp
+
+    def _init(self, raw_int_val: int, fmt: QFormat, overflow: OverflowMode | None = None, site: str = "construct") -> None:
+        """ Bring a raw integer into the format range, store it and log the new var """
+        self._fmt = fmt
+
+        # Out-of-range values are saturated, wrapped or rejected per the overflow policy
+        if raw_int_val > fmt.max_val or raw_int_val < fmt.min_val:
+            raw_int_val = resolve_overflow(raw_int_val, fmt, overflow, site)
+        self._val_int = raw_int_val
+
+        # Float and binary bit string representations are computed on first access
+        self._val_float: float | None = None
+        self._val_bin: str | None = None
 
         # Log creation of var
-        Registry.log_var(fxp=self)
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.var_count += 1
+            else:
+                scope.log_var(self)
         
     @property
     def val_float(self) -> float:
+        if self._val_float is None:
+            self._val_float = self._int_to_float(self._val_int)
         return self._val_float
 
     @property
@@ -69,52 +108,59 @@ class FixedPoint:
 
     @property
     def val_bin(self) -> str:
+        if self._val_bin is None:
+            self._val_bin = self._int_to_bin(self._val_int)
         return self._val_bin
 
+    @property
+    def fmt(self) -> QFormat:
+        return self._fmt
+
     @property
     def int_width(self) -> int:
-        return self._int_width
+        return self._fmt.int_width
 
     @property
     def fract_width(self) -> int:
-        return self._fract_width
+        return self._fmt.fract_width
     
     @property
     def total_width(self) -> int:
-        return self._total_width
+        return self._fmt.total_width
 
     @property
     def signed(self) -> bool:
-        return self._signed
+        return self._fmt.signed
 
     def _int_to_float(self, val_int: int) -> float:
         """
         Convert internal integer representation to float using Qm.n format.
         Handles sign-extension for signed numbers.
         """
-        if self._signed:
-            if val_int > self._max_val:
-                val_int -= 1 << self._total_width  # two's complement
-        return val_int / (1 << self._fract_width)
+        fmt = self._fmt
+        if fmt.signed:
+            if val_int > fmt.max_val:
+                val_int -= 1 << fmt.total_width  # two's complement
+        return val_int / fmt.scale
 
     def _int_to_bin(self, val_int: int) -> str:
         """
         Convert fixed-point integer to binary string of length `total_width`.
         """
-        mask = (1 << self._total_width) - 1
-        return format(val_int & mask, f"0{self._total_width}b")
+        return format(val_int & self._fmt.mask, f"0{self._fmt.total_width}b")
 
-    def _bin_to_int(self, val_bin: str) -> int:
+    @staticmethod
+    def _bin_to_int(val_bin: str, fmt: QFormat) -> int:
         """
         Convert binary string to fixed-point integer.
         Handles sign extension if needed.
         """
-        if len(val_bin) != self._total_width:
-            raise ValueError(f"Binary string must be {self._total_width} bits")
+        if len(val_bin) != fmt.total_width:
+            raise ValueError(f"Binary string must be {fmt.total_width} bits")
         raw = int(val_bin, 2)
-        if self._signed and val_bin[0] == '1':
+        if fmt.signed and val_bin[0] == '1':
             # Negative in two's complement
-            raw -= 1 << self._total_width
+            raw -= 1 << fmt.total_width
         return raw
 
     def __add__(self, other: "FixedPoint") -> "FixedPoint":
@@ -123,20 +169,20 @@ class FixedPoint:
         The result uses Q(m+1).n format to avoid overflow.
         """
         if not isinstance(other, FixedPoint):
-            raise TypeError("Can only add FixedPoint to FixedPoint")
+            # Defer to reflected operand (e.g. FixedPointArray), else TypeError
+            return NotImplemented
 
-        if self._fract_width != other.fract_width:
-            raise ValueError("Fractional widths must match for addition")
+        result_val : int = self._val_int + other._val_int
 
-        result_signed = self._signed or other.signed
-        result_fract = self._fract_width
-        result_int = max(self._int_width + self._signed, other.int_width + other.signed) + 1
+        result = FixedPoint._create(result_val, self._fmt.add(other._fmt), site="__add__")
 
-        result_val : int = self._val_int + other.val_int
-
-        result = FixedPoint(val=result_val, int_width=result_int - int(result_signed), fract_width=result_fract, signed=result_signed)
-
-        Registry.log_op(lhs=self, rhs=other, result=result, opp_type=OppType.__ADD__)
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.op_count += 1
+                scope.type_counts[_ADD] += 1
+            else:
+                scope.log_op(self, other, result, _ADD)
 
         return result
 
@@ -146,20 +192,19 @@ class FixedPoint:
         The result uses Q(m+1).n format to avoid overflow.
         """
         if not isinstance(other, FixedPoint):
-            raise TypeError("Can only subtract FixedPoint from FixedPoint")
-
-        if self._fract_width != other.fract_width:
-            raise ValueError("Fractional widths must match for subtraction")
+            return NotImplemented
 
-        result_signed = self._signed or other.signed
-        result_fract = self._fract_width
-        result_int = max(self._int_width, other.int_width) + 1
+        result_val : int = self._val_int - other._val_int
 
-        result_val : int = self._val_int - other.val_int
+        result = FixedPoint._create(result_val, self._fmt.sub(other._fmt), site="__sub__")
 
-        result = FixedPoint(val=result_val, int_width=result_int, fract_width=result_fract, signed=result_signed)
-
-        Registry.log_op(lhs=self, rhs=other, result=result, opp_type=OppType.__SUB__)
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.op_count += 1
+                scope.type_counts[_SUB] += 1
+            else:
+                scope.log_op(self, other, result, _SUB)
 
         return result
 
@@ -170,17 +215,19 @@ class FixedPoint:
         A signed result uses Q(m1 + m2 + 1).(n1 + n2) format.
         """
         if not isinstance(other, FixedPoint):
-            raise TypeError("Can only multiply FixedPoint by FixedPoint")
-
-        result_signed = self._signed or other.signed
-        result_int = self._int_width + other.int_width + int(self._signed and other.signed)
-        result_fract = self._fract_width + other.fract_width
+            return NotImplemented
 
-        result_val = self._val_int * other.val_int
+        result_val = self._val_int * other._val_int
 
-        result = FixedPoint(val=result_val, int_width=result_int, fract_width=result_fract, signed=result_signed)
+        result = FixedPoint._create(result_val, self._fmt.mul(other._fmt), site="__mul__")
 
-        Registry.log_op(lhs=self, rhs=other, result=result, opp_type=OppType.__MUL__)
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.op_count += 1
+                scope.type_counts[_MUL] += 1
+            else:
+                scope.log_op(self, other, result, _MUL)
 
         return result
 
@@ -193,7 +240,17 @@ class FixedPoint:
             raise ValueError("Shift amount must be a non-negative integer")
 
         shifted_val = self._val_int << n
-        return FixedPoint(shifted_val, self._int_width, self._fract_width, self._signed)
+        result = FixedPoint._create(shifted_val, self._fmt, site="__lshift__")
+
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.op_count += 1
+                scope.type_counts[_LSHIFT] += 1
+            else:
+                scope.log_op(self, None, result, _LSHIFT, (n,))
+
+        return result
 
 
     def __rshift__(self, n: int) -> "FixedPoint":
@@ -204,21 +261,90 @@ class FixedPoint:
         if not isinstance(n, int) or n < 0:
             raise ValueError("Shift amount must be a non-negative integer")
 
-        if self._signed:
+        if self._fmt.signed:
             # Arithmetic right shift (preserve sign)
             shifted_val = self._val_int >> n
         else:
             # Logical right shift (insert zeros from the left)
-            shifted_val = (self._val_int & ((1 << self._total_width) - 1)) >> n
+            shifted_val = (self._val_int & self._fmt.mask) >> n
+
+        result = FixedPoint._create(shifted_val, self._fmt, site="__rshift__")
+
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.op_count += 1
+                scope.type_counts[_RSHIFT] += 1
+            else:
+                scope.log_op(self, None, result, _RSHIFT, (n,))
 
-        return FixedPoint(shifted_val, self._int_width, self._fract_width, self._signed)
+        return result
     
-    def bsl_scale(self, n: int) -> "FixedPoint":
-        """ Bitwise scale left (value *= 2ⁿ) without changing format """
-        shifted_val = self.val_float * (2 ** n)
-        return FixedPoint(shifted_val, self._int_width, self._fract_width, self._signed)
-
-    def bsr_scale(self, n: int) -> "FixedPoint":
-        """ Bitwise scale right (value /= 2ⁿ) without changing format """
-        shifted_val = self.val_float / (2 ** n)
-        return FixedPoint(shifted_val, self._int_width, self._fract_width, self._signed)
\ No newline at end of file
+    def resize(self, int_width: int, fract_width: int, signed: bool | None = None,
+               rounding: RoundingMode = RoundingMode.FLOOR, overflow: OverflowMode | None = None) -> "FixedPoint":
+        """
+        Requantize to a new Qm.n format using only the integer representation.
+        Dropped fractional bits are rounded per `rounding`, out-of-range results are
+        handled per `overflow` (defaults to the active overflow policy).
+        """
+        fmt = QFormat(int_width, fract_width, self._fmt.signed if signed is None else signed)
+
+        resized_val = shift_round(self._val_int, self._fmt.fract_width - fract_width, rounding)
+        result = FixedPoint._create(resized_val, fmt, overflow, site="resize")
+
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.op_count += 1
+                scope.type_counts[_RESIZE] += 1
+            else:
+                scope.log_op(self, None, result, _RESIZE, (rounding, overflow))
+
+        return result
+
+    def bsl_scale(self, n: int, overflow: OverflowMode | None = None,
+                  rounding: RoundingMode = RoundingMode.CONVERGENT) -> "FixedPoint":
+        """
+        Bitwise scale left (value *= 2ⁿ) without changing format.
+        Shifts the integer representation directly; out-of-range results follow the overflow policy.
+        A negative n scales right by -n, rounding discarded bits per rounding.
+        """
+        if n < 0:
+            return self.bsr_scale(-n, rounding, overflow)
+
+        shifted_val = self._val_int << n
+        result = FixedPoint._create(shifted_val, self._fmt, overflow, site="bsl_scale")
+
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.op_count += 1
+                scope.type_counts[_BSL_SCALE] += 1
+            else:
+                scope.log_op(self, None, result, _BSL_SCALE, (n, overflow))
+
+        return result
+
+    def bsr_scale(self, n: int, rounding: RoundingMode = RoundingMode.CONVERGENT, overflow: OverflowMode | None = None) -> "FixedPoint":
+        """
+        Bitwise scale right (value /= 2ⁿ) without changing format.
+        Discarded bits are rounded half-to-even by default, as the float round() this replaces did.
+        A right shift cannot overflow, so overflow only applies when a negative n scales left.
+        """
+        if n < 0:
+            return self.bsl_scale(-n, overflow)
+
+        # A rounded right shift cannot leave the format range, so the range check is skipped
+        result = FixedPoint.from_raw(shift_round(self._val_int, n, rounding), self._fmt)
+
+        scope = current_scope()
+        if scope.enabled:
+            if scope.count_only:
+                scope.var_count += 1
+                scope.op_count += 1
+                scope.type_counts[_BSR_SCALE] += 1
+            else:
+                scope.log_var(result)
+                scope.log_op(self, None, result, _BSR_SCALE, (n, rounding, overflow))
+
+        return result
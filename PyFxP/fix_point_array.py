@@ -0,0 +1,357 @@
+import numpy as np
+
+from .fix_point import FixedPoint
+from .overflow import OverflowMode, resolve_overflow_array
+from .q_format import QFormat
+from .rounding import RoundingMode, shift_round
+from . import wide
+from .wide import INT128
+
+
+# Widest format (in bits, incl. sign) whose intermediate results are computed in int64
+_NATIVE_WIDTH = 63
+
+
+def _storage_dtype(fmt: QFormat) -> np.dtype:
+    """
+    NumPy dtype used to hold raw values of a given format.
+    Formats up to 128 bits are held in two 64-bit limbs, wider ones fall back to Python int objects.
+    """
+    if fmt.total_width <= 64:
+        return np.dtype(np.int64) if fmt.signed else np.dtype(np.uint64)
+    if wide.fits(fmt.total_width, fmt.signed):
+        return INT128
+    return np.dtype(object)
+
+
+def _to_storage(raw: np.ndarray, fmt: QFormat) -> np.ndarray:
+    """ Convert in-range raw integers from any compute dtype to the format's storage dtype """
+    storage = _storage_dtype(fmt)
+    if storage == INT128:
+        return wide.from_int(raw)
+    if raw.dtype == INT128:
+        if storage == object:
+            return wide.to_object(raw)
+        # In range, so the low limb holds the value
+        return raw["lo"].astype(storage)
+    return raw.astype(storage, copy=False)
+
+
+def _shift_round(raw, n: int, rounding: RoundingMode):
+    """ rounding.shift_round that also accepts INT128 arrays """
+    if isinstance(raw, np.ndarray) and raw.dtype == INT128:
+        return wide.shift_round(raw, n, rounding)
+    if isinstance(raw, np.ndarray) and raw.dtype != object and n >= 63:
+        # The rounding masks no longer fit the native dtype
+        raw = raw.astype(object)
+    return shift_round(raw, n, rounding)
+
+
+class FixedPointArray:
+    """
+    FixedPointArray represents an array of values sharing a single Qm.n fixed-point format.
+
+    Raw values are held in an int64 (signed) or uint64 (unsigned) NumPy buffer, a pair of
+    64-bit limbs (wide.INT128) for formats up to 128 bits, or an object buffer of Python ints
+    beyond that. Arithmetic runs as whole-array operations and follows the same width-promotion
+    rules as FixedPoint. val_int always presents Python ints for limb-backed formats.
+
+    :param val: Values to initialise with. Can be:
+        - array-like of float: interpreted as real numbers
+        - array-like of int: raw fixed-point integer representations
+    :param int_width: Number of integer bits (not including sign)
+    :param fract_width: Number of fractional bits
+    :param signed: Whether the values are signed (two's complement)
+    :param overflow: How to handle out-of-range values, defaults to the active overflow policy
+    """
+
+    def __init__(self, val, int_width: int, fract_width: int, signed: bool = False, overflow: OverflowMode | None = None):
+        """ FixedPointArray class constructor """
+
+        fmt = QFormat(int_width, fract_width, signed)
+
+        arr = np.asarray(val)
+
+        # Convert input values to raw integer representation
+        match arr.dtype.kind:
+            case "f":
+                raw = self._float_to_raw(arr, fmt)
+
+            case "i" | "u" | "b":
+                if fmt.total_width <= _NATIVE_WIDTH:
+                    raw = arr.copy()
+                elif _storage_dtype(fmt) == INT128:
+                    raw = wide.from_int(arr)
+                else:
+                    raw = arr.astype(object)
+
+            case "O":
+                raw = arr.copy()
+
+            case _:
+                raise TypeError("Values must be float or int")
+
+        self._init(raw, fmt, overflow)
+
+    @classmethod
+    def _create(cls, raw: np.ndarray, fmt: QFormat, overflow: OverflowMode | None = None, site: str = "construct") -> "FixedPointArray":
+        """ Build an array from raw integers and a resolved format, skipping type dispatch """
+        arr = object.__new__(cls)
+        arr._init(raw, fmt, overflow, site)
+        return arr
+
+    def _init(self, raw: np.ndarray, fmt: QFormat, overflow: OverflowMode | None = None, site: str = "construct") -> None:
+        """ Bring raw integers into the format range and store them in the format's dtype """
+        self._fmt = fmt
+        self._val_int = _to_storage(resolve_overflow_array(raw, fmt, overflow, site), fmt)
+
+    @classmethod
+    def from_fixed_points(cls, values: list[FixedPoint]) -> "FixedPointArray":
+        """ Pack a sequence of FixedPoint values sharing a format into an array """
+        if not values:
+            raise ValueError("Cannot build FixedPointArray from an empty sequence")
+
+        fmt = values[0].fmt
+        if any(v.fmt is not fmt for v in values):
+            raise ValueError("All FixedPoint values must share the same format")
+
+        return cls._create(np.array([v.val_int for v in values], dtype=object), fmt)
+
+    @property
+    def val_float(self) -> np.ndarray:
+        scale = self._fmt.scale
+        if self._val_int.dtype == INT128:
+            return wide.to_float(self._val_int) / float(scale)
+        if self._val_int.dtype == object:
+            return np.array([int(v) / scale for v in self._val_int.ravel()], dtype=np.float64).reshape(self.shape)
+        return self._val_int / float(scale)
+
+    @property
+    def val_int(self) -> np.ndarray:
+        if self._val_int.dtype == INT128:
+            return wide.to_object(self._val_int)
+        return self._val_int
+
+    @property
+    def fmt(self) -> QFormat:
+        return self._fmt
+
+    @property
+    def int_width(self) -> int:
+        return self._fmt.int_width
+
+    @property
+    def fract_width(self) -> int:
+        return self._fmt.fract_width
+
+    @property
+    def total_width(self) -> int:
+        return self._fmt.total_width
+
+    @property
+    def signed(self) -> bool:
+        return self._fmt.signed
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._val_int.shape
+
+    def __len__(self) -> int:
+        return len(self._val_int)
+
+    def __getitem__(self, index) -> "FixedPoint | FixedPointArray":
+        item = self._val_int[index]
+        if isinstance(item, np.ndarray):
+            return FixedPointArray._create(item, self._fmt)
+        return FixedPoint._create(wide.to_int(item) if isinstance(item, np.void) else int(item), self._fmt)
+
+    def to_fixed_points(self) -> list[FixedPoint]:
+        """ Unpack into a list of scalar FixedPoint values """
+        return [FixedPoint._create(int(v), self._fmt) for v in self.val_int.ravel()]
+
+    @staticmethod
+    def _float_to_raw(arr: np.ndarray, fmt: QFormat) -> np.ndarray:
+        """
+        Scale floats by 2ⁿ and round half-to-even, matching FixedPoint's use of round().
+        Scaling by a power of two is exact, so results are bit-identical to the scalar path.
+        """
+        scaled = np.rint(arr.astype(np.float64) * float(fmt.scale))
+        peak = np.abs(scaled).max() if scaled.size else 0.0
+        if fmt.total_width <= _NATIVE_WIDTH and peak < 2.0 ** 63:
+            # Float integers below 2⁶³ convert to int64 exactly
+            return scaled.astype(np.int64)
+        if _storage_dtype(fmt) == INT128 and peak < 2.0 ** 127:
+            return wide.from_float(scaled)
+        return np.array([int(v) for v in scaled.ravel()], dtype=object).reshape(scaled.shape)
+
+    def _widened(self, extra_bits: int) -> np.ndarray:
+        """ Raw values in a dtype that can hold them shifted left by extra_bits """
+        width = self.total_width + max(extra_bits, 0)
+        if width <= _NATIVE_WIDTH:
+            return self._val_int.astype(np.int64, copy=False)
+        if wide.fits(width, self.signed):
+            return wide.from_int(self._val_int)
+        return self.val_int.astype(object)
+
+    @staticmethod
+    def _coerce(other) -> "FixedPointArray | None":
+        """ Promote a scalar FixedPoint operand to a broadcastable array """
+        if isinstance(other, FixedPointArray):
+            return other
+        if isinstance(other, FixedPoint):
+            return FixedPointArray._create(np.array(other.val_int, dtype=object), other.fmt)
+        return None
+
+    @staticmethod
+    def _operands(lhs: "FixedPointArray", rhs: "FixedPointArray", result_fmt: QFormat) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Raw operands in a dtype wide enough to hold the exact result.
+        The exact result exceeds the promoted result format by at most one bit (e.g. an
+        unsigned maximum plus a positive signed value), so int64 suffices whenever every
+        format involved fits in 63 bits, and INT128 whenever the result fits in 127.
+        """
+        fmts = (lhs._fmt, rhs._fmt, result_fmt)
+        if max(fmt.total_width for fmt in fmts) <= _NATIVE_WIDTH:
+            return lhs._val_int.astype(np.int64, copy=False), rhs._val_int.astype(np.int64, copy=False)
+        if wide.fits(lhs._fmt.total_width, lhs.signed) and wide.fits(rhs._fmt.total_width, rhs.signed) and \
+                wide.fits(result_fmt.total_width + 1, True):
+            return wide.from_int(lhs._val_int), wide.from_int(rhs._val_int)
+        return lhs.val_int.astype(object), rhs.val_int.astype(object)
+
+    def _binary_op(self, lhs: "FixedPointArray", rhs: "FixedPointArray", result_fmt: QFormat, op, site: str) -> "FixedPointArray":
+        """ Apply a whole-array arithmetic op and pack the result into the promoted format """
+        lhs_raw, rhs_raw = self._operands(lhs, rhs, result_fmt)
+        if lhs_raw.dtype == INT128:
+            op = _WIDE_OPS[op]
+
+        return FixedPointArray._create(op(lhs_raw, rhs_raw), result_fmt, site=site)
+
+    def __add__(self, other) -> "FixedPointArray":
+        """
+        Add element-wise and return a new FixedPointArray result.
+        The result uses Q(m+1).n format to avoid overflow.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._binary_op(self, other, self._fmt.add(other._fmt), np.add, "__add__")
+
+    def __radd__(self, other) -> "FixedPointArray":
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._binary_op(other, self, other._fmt.add(self._fmt), np.add, "__add__")
+
+    def __sub__(self, other) -> "FixedPointArray":
+        """
+        Subtract element-wise and return a new FixedPointArray result.
+        The result uses Q(m+1).n format to avoid overflow.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._binary_op(self, other, self._fmt.sub(other._fmt), np.subtract, "__sub__")
+
+    def __rsub__(self, other) -> "FixedPointArray":
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._binary_op(other, self, other._fmt.sub(self._fmt), np.subtract, "__sub__")
+
+    def __mul__(self, other) -> "FixedPointArray":
+        """
+        Multiply element-wise and return a new FixedPointArray result.
+        An unsigned result uses Q(m1 + m2).(n1 + n2) format.
+        A signed result uses Q(m1 + m2 + 1).(n1 + n2) format.
+        """
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._binary_op(self, other, self._fmt.mul(other._fmt), np.multiply, "__mul__")
+
+    def __rmul__(self, other) -> "FixedPointArray":
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._binary_op(other, self, other._fmt.mul(self._fmt), np.multiply, "__mul__")
+
+    def __lshift__(self, n: int) -> "FixedPointArray":
+        """
+        Logical bitwise left shift on internal integer representation.
+        Equivalent to MATLAB bitsll.
+        """
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("Shift amount must be a non-negative integer")
+
+        if self.total_width + n <= _NATIVE_WIDTH:
+            shifted_val = self._val_int.astype(np.int64, copy=False) << n
+        elif wide.fits(self.total_width + n, self.signed):
+            shifted_val = wide.lshift(wide.from_int(self._val_int), n)
+        else:
+            shifted_val = self.val_int.astype(object) << n
+
+        return FixedPointArray._create(shifted_val, self._fmt, site="__lshift__")
+
+    def __rshift__(self, n: int) -> "FixedPointArray":
+        """
+        Logical bitwise right shift on internal integer representation.
+        Equivalent to MATLAB bitsra for signed, bitsrl for unsigned.
+        """
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("Shift amount must be a non-negative integer")
+
+        if self._val_int.dtype == object:
+            shifted_val = self._val_int >> n
+        elif self._val_int.dtype == INT128:
+            # Unsigned values are non-negative, so the arithmetic shift inserts zeros
+            shifted_val = wide.rshift(self._val_int, n)
+        elif n >= 64:
+            # Shifting a native buffer by its full width is undefined, saturate the amount
+            shifted_val = self._val_int >> 63 if self.signed else np.zeros_like(self._val_int)
+        else:
+            # int64 shifts are arithmetic (preserve sign), uint64 shifts insert zeros
+            shifted_val = self._val_int >> np.asarray(n, dtype=self._val_int.dtype)
+
+        return FixedPointArray._create(shifted_val, self._fmt, site="__rshift__")
+
+    def resize(self, int_width: int, fract_width: int, signed: bool | None = None,
+               rounding: RoundingMode = RoundingMode.FLOOR, overflow: OverflowMode | None = None) -> "FixedPointArray":
+        """
+        Requantize to a new Qm.n format using only the integer representation.
+        Dropped fractional bits are rounded per `rounding`, out-of-range results are
+        handled per `overflow` (defaults to the active overflow policy).
+        """
+        fmt = QFormat(int_width, fract_width, self.signed if signed is None else signed)
+        shift = self.fract_width - fract_width
+
+        resized_val = _shift_round(self._widened(-shift), shift, rounding)
+        return FixedPointArray._create(resized_val, fmt, overflow, site="resize")
+
+    def bsl_scale(self, n: int, overflow: OverflowMode | None = None,
+                  rounding: RoundingMode = RoundingMode.CONVERGENT) -> "FixedPointArray":
+        """
+        Bitwise scale left (value *= 2ⁿ) of every element without changing format.
+        Shifts the integer representation directly; out-of-range results follow the overflow policy.
+        A negative n scales right by -n, rounding discarded bits per rounding.
+        """
+        if n < 0:
+            return self.bsr_scale(-n, rounding, overflow)
+
+        shifted_val = _shift_round(self._widened(n), -n, RoundingMode.FLOOR)
+        return FixedPointArray._create(shifted_val, self._fmt, overflow, site="bsl_scale")
+
+    def bsr_scale(self, n: int, rounding: RoundingMode = RoundingMode.CONVERGENT, overflow: OverflowMode | None = None) -> "FixedPointArray":
+        """
+        Bitwise scale right (value /= 2ⁿ) of every element without changing format.
+        Discarded bits are rounded half-to-even by default, matching FixedPoint.bsr_scale.
+        A right shift cannot overflow, so overflow only applies when a negative n scales left.
+        """
+        if n < 0:
+            return self.bsl_scale(-n, overflow)
+
+        shifted_val = _shift_round(self._val_int, n, rounding)
+        return FixedPointArray._create(shifted_val, self._fmt, overflow, site="bsr_scale")
+
+
+# Limb-wise counterparts of the ufuncs used by _binary_op
+_WIDE_OPS = {np.add: wide.add, np.subtract: wide.sub, np.multiply: wide.mul}
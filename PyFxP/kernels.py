@@ -0,0 +1,122 @@
+from typing import Sequence
+
+import numpy as np
+
+from .fix_point import FixedPoint
+from .fix_point_array import FixedPointArray, _NATIVE_WIDTH, _shift_round
+from .overflow import OverflowMode
+from .q_format import QFormat
+from .rounding import RoundingMode
+from . import wide
+
+
+def _guard_bits(n: int) -> int:
+    """ Extra integer bits needed so a sum of n terms cannot overflow """
+    return max(n - 1, 0).bit_length()
+
+
+def _unsigned(*values) -> int:
+    """ Sign bit to add to a width computed from unsigned formats before it is held in signed limbs """
+    return int(not all(v.signed for v in values))
+
+
+def _accumulate(total, total_fract: int, acc_fmt: QFormat, rounding: RoundingMode):
+    """ Requantize a full-precision sum onto the accumulator's fractional width """
+    return _shift_round(total, total_fract - acc_fmt.fract_width, rounding)
+
+
+def mac(acc: FixedPoint | FixedPointArray, a: FixedPoint | FixedPointArray, b: FixedPoint | FixedPointArray,
+        rounding: RoundingMode = RoundingMode.FLOOR, overflow: OverflowMode | None = None) -> FixedPoint | FixedPointArray:
+    """
+    Fused multiply-accumulate, acc + a * b.
+
+    The product and sum are formed at full precision on raw integers and rounded once into the
+    accumulator's format. No intermediate values are constructed or logged.
+
+    :param acc: Accumulator, whose format is also the result format
+    :param a: Multiplicand
+    :param b: Multiplier
+    :param rounding: Rounding applied if the product has more fractional bits than acc
+    :param overflow: How to handle a result outside acc's format, defaults to the active policy
+    """
+    acc_fmt = acc.fmt
+    prod_fract = a.fract_width + b.fract_width
+    fract = max(acc_fmt.fract_width, prod_fract)
+
+    if isinstance(acc, FixedPoint) and isinstance(a, FixedPoint) and isinstance(b, FixedPoint):
+        total = (acc.val_int << (fract - acc_fmt.fract_width)) + ((a.val_int * b.val_int) << (fract - prod_fract))
+        return FixedPoint._create(_accumulate(total, fract, acc_fmt, rounding), acc_fmt, overflow, site="mac")
+
+    acc_arr, a_arr, b_arr = (FixedPointArray._coerce(x) for x in (acc, a, b))
+    prod_width = a_arr.total_width + b_arr.total_width
+    width = max(acc_fmt.total_width + fract - acc_fmt.fract_width, prod_width + fract - prod_fract) + 1
+
+    # width counts magnitude bits only when an operand is unsigned, and limbs are signed
+    if width <= _NATIVE_WIDTH or not wide.fits(width + _unsigned(acc_arr, a_arr, b_arr), True):
+        dtype = np.int64 if width <= _NATIVE_WIDTH else object
+        acc_raw, a_raw, b_raw = (x.val_int.astype(dtype) for x in (acc_arr, a_arr, b_arr))
+        total = (acc_raw << (fract - acc_fmt.fract_width)) + ((a_raw * b_raw) << (fract - prod_fract))
+    else:
+        acc_raw, a_raw, b_raw = (wide.from_int(x._val_int) for x in (acc_arr, a_arr, b_arr))
+        total = wide.add(wide.lshift(acc_raw, fract - acc_fmt.fract_width),
+                         wide.lshift(wide.mul(a_raw, b_raw), fract - prod_fract))
+    return FixedPointArray._create(_accumulate(total, fract, acc_fmt, rounding), acc_fmt, overflow, site="mac")
+
+
+def dot_format(coeff_fmt: QFormat, sample_fmt: QFormat, n: int) -> QFormat:
+    """
+    Smallest accumulator format holding any sum of n full-precision products without overflow.
+    Chaining __add__ would instead grow the format by one bit per term.
+    """
+    prod_fmt = coeff_fmt.mul(sample_fmt)
+    return QFormat(prod_fmt.int_width + _guard_bits(n), prod_fmt.fract_width, prod_fmt.signed)
+
+
+def dot(coeffs: Sequence[FixedPoint] | FixedPointArray, samples: Sequence[FixedPoint] | FixedPointArray,
+        acc_fmt: QFormat | None = None, rounding: RoundingMode = RoundingMode.FLOOR,
+        overflow: OverflowMode | None = None) -> FixedPoint | FixedPointArray:
+    """
+    Dot product of coefficients and samples in a single pass over raw integers.
+
+    Products are summed at full precision and rounded once into the accumulator format.
+    Samples may be a FixedPointArray with a leading batch dimension, e.g. (n_outputs, n_taps),
+    in which case one result per row is returned as a FixedPointArray.
+
+    :param coeffs: Coefficients, a list of FixedPoint or a 1-D FixedPointArray
+    :param samples: Samples, a list of FixedPoint or a FixedPointArray whose last axis matches coeffs
+    :param acc_fmt: Accumulator (result) format, defaults to dot_format(...) which cannot overflow
+    :param rounding: Rounding applied if the products have more fractional bits than acc_fmt
+    :param overflow: How to handle a result outside acc_fmt, defaults to the active policy
+    """
+    if not isinstance(coeffs, FixedPointArray):
+        coeffs = FixedPointArray.from_fixed_points(list(coeffs))
+    if not isinstance(samples, FixedPointArray):
+        samples = FixedPointArray.from_fixed_points(list(samples))
+
+    n = coeffs.shape[-1]
+    if len(coeffs.shape) != 1 or samples.shape[-1] != n:
+        raise ValueError("Coefficients must be 1-D and match the last axis of samples")
+
+    full_fmt = dot_format(coeffs.fmt, samples.fmt, n)
+    acc_fmt = full_fmt if acc_fmt is None else acc_fmt
+    fract = max(acc_fmt.fract_width, full_fmt.fract_width)
+    shift = fract - full_fmt.fract_width
+
+    # np.dot on int64 is exact (no BLAS) as long as the full sum fits
+    width = full_fmt.total_width + shift
+    if width <= _NATIVE_WIDTH or not wide.fits(width + _unsigned(full_fmt), True):
+        dtype = np.int64 if width <= _NATIVE_WIDTH else object
+        total = np.dot(samples.val_int.astype(dtype), coeffs.val_int.astype(dtype))
+        total = _accumulate(total << shift, fract, acc_fmt, rounding)
+    else:
+        # Limb arithmetic has no dot kernel, so accumulate one tap at a time across the batch
+        sample_raw, coeff_raw = wide.from_int(samples._val_int), wide.from_int(coeffs._val_int)
+        total = wide.from_int(np.zeros(samples.shape[:-1], dtype=np.int64))
+        for k in range(n):
+            total = wide.add(total, wide.mul(sample_raw[..., k], coeff_raw[k]))
+        total = _accumulate(wide.lshift(total, shift), fract, acc_fmt, rounding)
+
+    if np.ndim(total) == 0:
+        value = wide.to_int(total[()]) if getattr(total, "dtype", None) == wide.INT128 else int(total)
+        return FixedPoint._create(value, acc_fmt, overflow, site="dot")
+    return FixedPointArray._create(total, acc_fmt, overflow, site="dot")
@@ -0,0 +1,280 @@
+import hashlib
+import os
+import tempfile
+from enum import Enum
+from types import BuiltinFunctionType, CodeType, FunctionType, ModuleType
+from typing import Callable
+
+import numpy as np
+
+from .fix_point import FixedPoint
+from .fix_point_array import FixedPointArray
+from .overflow import OverflowMode, overflow_policy
+from .q_format import QFormat
+from .rounding import RoundingMode, shift_round
+
+
+# Largest table generated, in address bits
+MAX_ADDR_BITS = 24
+
+# Bumped whenever the table layout or lookup arithmetic changes, invalidating cached files
+_LUT_VERSION = 1
+
+
+class LUT:
+    """
+    LUT is a quantized lookup table of a real function over a fixed-point input format.
+
+    The input range is split into 2ᵃ equal segments addressed by the a most significant bits of
+    the input's offset from its minimum, (raw - min_val) >> shift with shift = total_width - a.
+    Entry k holds fn at the start of segment k, quantized into output_fmt with saturation.
+
+    With interpolation, the table has one extra entry at the end of the range, and the
+    remaining shift LSBs linearly interpolate between neighbouring entries:
+
+        y = t[k] + round((t[k + 1] - t[k]) * frac / 2^shift)
+
+    Lookups use only integer arithmetic, so FixedPoint and FixedPointArray inputs give
+    bit-identical results, which an RTL implementation of the same table can match.
+
+    :param fn: Vectorized real function, called once with a float array of segment start points
+    :param input_fmt: Format of lookup inputs
+    :param output_fmt: Format of table entries and lookup results
+    :param addr_bits: Address bits a, defaults to the input's total width (one entry per input value)
+    :param interpolate: Linearly interpolate between entries using the remaining input LSBs
+    :param rounding: Rounding of the interpolation step
+    """
+
+    def __init__(self, fn: Callable[[np.ndarray], np.ndarray], input_fmt: QFormat, output_fmt: QFormat,
+                 addr_bits: int | None = None, interpolate: bool = False,
+                 rounding: RoundingMode = RoundingMode.CONVERGENT):
+        """ LUT class constructor """
+        addr_bits = input_fmt.total_width if addr_bits is None else addr_bits
+        _check_addr_bits(addr_bits, input_fmt)
+
+        n = (1 << addr_bits) + (1 if interpolate else 0)
+        shift = input_fmt.total_width - addr_bits
+        points = (np.arange(n) * 2.0 ** shift + input_fmt.min_val) / input_fmt.scale
+
+        with np.errstate(all="ignore"):
+            values = np.asarray(fn(points), dtype=np.float64)
+        # Points outside fn's domain (NaN) map to 0, infinities saturate
+        values = np.clip(np.nan_to_num(values, nan=0.0), (output_fmt.min_val - 1) / output_fmt.scale,
+                         (output_fmt.max_val + 1) / output_fmt.scale)
+
+        with overflow_policy(OverflowMode.SATURATE, warn=False) as stats:
+            entries = FixedPointArray(values, output_fmt.int_width, output_fmt.fract_width, output_fmt.signed)
+
+        self._init(entries.val_int, input_fmt, output_fmt, addr_bits, interpolate, rounding)
+        # Entries clipped to the output range, e.g. near a pole of 1/x
+        self.saturated: int = stats.total
+
+    def _init(self, table: np.ndarray, input_fmt: QFormat, output_fmt: QFormat, addr_bits: int, interpolate: bool,
+              rounding: RoundingMode) -> None:
+        self.table: np.ndarray = table
+        self.input_fmt: QFormat = input_fmt
+        self.output_fmt: QFormat = output_fmt
+        self.addr_bits: int = addr_bits
+        self.interpolate: bool = interpolate
+        self.rounding: RoundingMode = rounding
+        self.saturated: int = 0
+
+        self._shift = input_fmt.total_width - addr_bits
+        # Entries, offsets from min_val and interpolation products must fit int64
+        self._native = input_fmt.total_width <= 62 and output_fmt.total_width <= 63 and \
+            (not interpolate or output_fmt.total_width + 1 + self._shift <= 62)
+        self._lookup_table = table.astype(np.int64 if self._native else object)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __repr__(self) -> str:
+        return (f"LUT(entries={len(self)}, input_fmt={self.input_fmt}, output_fmt={self.output_fmt}, "
+                f"interpolate={self.interpolate})")
+
+    @property
+    def entries(self) -> FixedPointArray:
+        """ Table entries as an array in the output format, e.g. for vectors.write_memh """
+        return FixedPointArray._create(self.table, self.output_fmt)
+
+    def _lookup_raw(self, raw):
+        """ Integer lookup of raw inputs (Python int or array), returning raw outputs """
+        offset = raw - self.input_fmt.min_val
+        index = offset >> self._shift
+        if isinstance(index, np.ndarray):
+            # Object offsets of wide inputs still give addresses below 2^MAX_ADDR_BITS
+            index = index.astype(np.intp)
+        table = self._lookup_table
+        if not self.interpolate:
+            return table[index]
+
+        lo, hi = table[index], table[index + 1]
+        frac = offset & ((1 << self._shift) - 1)
+        return lo + shift_round((hi - lo) * frac, self._shift, self.rounding)
+
+    def __call__(self, x: FixedPoint | FixedPointArray) -> FixedPoint | FixedPointArray:
+        """ Look up FixedPoint or FixedPointArray inputs in the input format """
+        if x.fmt is not self.input_fmt:
+            raise ValueError(f"Input format {x.fmt} does not match {self.input_fmt}")
+
+        if isinstance(x, FixedPoint):
+            return FixedPoint._create(int(self._lookup_raw(x.val_int)), self.output_fmt, site="lut")
+
+        dtype = np.int64 if self._native else object
+        raw = self._lookup_raw(x.val_int.astype(dtype))
+        return FixedPointArray._create(raw, self.output_fmt, site="lut")
+
+    def save(self, path: str | os.PathLike) -> None:
+        """ Write the table and its parameters to an .npz file """
+        with open(path, "wb") as f:
+            self._write(f)
+
+    def _write(self, f) -> None:
+        params = np.array(_fmt_fields(self.input_fmt) + _fmt_fields(self.output_fmt) +
+                          [self.addr_bits, int(self.interpolate), self.rounding.value, _LUT_VERSION], dtype=np.int64)
+        # Tables wider than 64 bits are stored as decimal strings
+        table = self.table if self.table.dtype != object else self.table.astype(str)
+        np.savez(f, table=table, params=params)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "LUT":
+        """ Read a table written by save """
+        with np.load(path) as data:
+            table, params = data["table"], [int(v) for v in data["params"]]
+
+        if params[9] != _LUT_VERSION:
+            raise ValueError(f"LUT file version {params[9]} is not supported")
+
+        input_fmt, output_fmt = QFormat(params[0], params[1], bool(params[2])), QFormat(params[3], params[4], bool(params[5]))
+        if table.dtype.kind == "U":
+            table = np.array([int(v) for v in table], dtype=object)
+
+        lut = object.__new__(cls)
+        lut._init(table, input_fmt, output_fmt, params[6], bool(params[7]), RoundingMode(params[8]))
+        return lut
+
+
+def _fmt_fields(fmt: QFormat) -> list[int]:
+    """ Format as the (int_width, fract_width, signed) fields of a saved table's params """
+    return [fmt.int_width, fmt.fract_width, int(fmt.signed)]
+
+
+def _check_addr_bits(addr_bits: int, input_fmt: QFormat) -> None:
+    if not 0 <= addr_bits <= input_fmt.total_width:
+        raise ValueError(f"addr_bits must be between 0 and the input width {input_fmt.total_width}")
+    if addr_bits > MAX_ADDR_BITS:
+        raise ValueError(f"A {addr_bits}-bit table exceeds the {MAX_ADDR_BITS}-bit limit, use fewer addr_bits")
+
+
+def _value_key(value, seen: set[int]) -> str:
+    """ Description of a value fn depends on that is the same in every process """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, Enum, QFormat)):
+        return repr(value)
+    if isinstance(value, (tuple, list)):
+        return f"{type(value).__name__}({','.join(_value_key(v, seen) for v in value)})"
+    if isinstance(value, frozenset):
+        # String hashes, and so set order, vary between processes
+        return f"frozenset({','.join(sorted(_value_key(v, seen) for v in value))})"
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        data = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return f"ndarray({value.dtype.str},{value.shape},{data})"
+    if isinstance(value, np.generic):
+        return f"{value.dtype.str}({value.item()!r})"
+    if isinstance(value, CodeType):
+        return _code_key(value, seen)
+    if callable(value):
+        return _fn_fingerprint(value, seen)
+    raise ValueError(f"Cannot identify {type(value).__name__} value {value!r} for caching, pass name=")
+
+
+def _code_key(code: CodeType, seen: set[int]) -> str:
+    consts = ",".join(_value_key(const, seen) for const in code.co_consts)
+    return f"{code.co_code.hex()}:{','.join(code.co_names)}:{consts}"
+
+
+def _fn_fingerprint(fn: Callable, seen: set[int] | None = None) -> str:
+    """
+    Function name plus a hash of everything its result depends on, so edits invalidate the cache.
+
+    Python functions hash their bytecode and constants, defaults, closure cell values and the
+    plain-data globals they read. Modules, classes and functions they reach through globals, as
+    well as compiled functions such as NumPy ufuncs, are identified by name only. Raises
+    ValueError if fn or a captured value cannot be identified across processes.
+    """
+    name = f"{getattr(fn, '__module__', None)}.{getattr(fn, '__qualname__', getattr(fn, '__name__', None))}"
+    if isinstance(fn, (np.ufunc, BuiltinFunctionType)):
+        return name
+    if not isinstance(fn, FunctionType):
+        raise ValueError(f"Cannot identify {fn!r} for caching, pass name=")
+
+    seen = set() if seen is None else seen
+    if id(fn) in seen:
+        return name
+    seen.add(id(fn))
+
+    code = fn.__code__
+    parts = [
+        _code_key(code, seen),
+        _value_key(fn.__defaults__ or (), seen),
+        _value_key(tuple(sorted((fn.__kwdefaults__ or {}).items())), seen),
+        _value_key(tuple(cell.cell_contents for cell in fn.__closure__ or ()), seen),
+    ]
+    for global_name in _global_names(code):
+        if global_name in fn.__globals__:
+            value = fn.__globals__[global_name]
+            if not isinstance(value, (ModuleType, type)) and not callable(value):
+                parts.append(f"{global_name}={_value_key(value, seen)}")
+    return name + hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def _global_names(code: CodeType) -> set[str]:
+    """ Names code and the code objects nested in it may read as globals """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def default_cache_dir() -> str:
+    """ $PYFXP_LUT_CACHE, or ~/.cache/pyfxp/lut """
+    return os.environ.get("PYFXP_LUT_CACHE") or os.path.join(os.path.expanduser("~"), ".cache", "pyfxp", "lut")
+
+
+def cached_lut(fn: Callable[[np.ndarray], np.ndarray], input_fmt: QFormat, output_fmt: QFormat,
+               addr_bits: int | None = None, interpolate: bool = False,
+               rounding: RoundingMode = RoundingMode.CONVERGENT, name: str | None = None,
+               cache_dir: str | os.PathLike | None = None) -> LUT:
+    """
+    LUT loaded from the disk cache, or built and written to it on first use.
+
+    Files are keyed on fn, the formats and the table options. A Python function is identified
+    by its name plus a hash of its code, defaults, closure values and the plain-data globals it
+    reads, a NumPy ufunc or builtin by its name. name overrides the function's identity and is
+    required for other callables, such as functools.partial, or functions capturing values that
+    cannot be identified across processes. Files are written atomically, so concurrent
+    processes can share a cache directory.
+
+    :param cache_dir: Directory holding cached tables, defaults to default_cache_dir()
+    """
+    addr_bits = input_fmt.total_width if addr_bits is None else addr_bits
+    identity = name if name is not None else _fn_fingerprint(fn)
+    key = repr((identity, input_fmt, output_fmt, addr_bits, interpolate, rounding.value, _LUT_VERSION))
+    label = "".join(c if c.isalnum() else "_" for c in (name or getattr(fn, "__name__", "lut")))
+
+    cache_dir = os.fspath(default_cache_dir() if cache_dir is None else cache_dir)
+    path = os.path.join(cache_dir, f"{label}-{hashlib.sha256(key.encode()).hexdigest()[:16]}.npz")
+    if os.path.exists(path):
+        return LUT.load(path)
+
+    lut = LUT(fn, input_fmt, output_fmt, addr_bits, interpolate, rounding)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=".npz", dir=cache_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            lut._write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return lut
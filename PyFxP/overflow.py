@@ -0,0 +1,226 @@
+import threading
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import TYPE_CHECKING, Iterator
+
+from .q_format import QFormat
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class OverflowMode(Enum):
+    SATURATE = 0    # Clip to the nearest bound of the format
+    WRAP = 1        # Discard MSBs (two's-complement wrap), as hardware does
+    RAISE = 2       # Raise OverflowError
+
+
+class OverflowStats:
+    """
+    OverflowStats aggregates overflow and underflow events per (format, op site).
+
+    The op site is the name of the operation that produced the value, e.g. "__mul__" or
+    "construct" for values built directly from user input.
+    """
+
+    def __init__(self):
+        """ OverflowStats class constructor """
+        self.counts: dict[tuple[QFormat, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, fmt: QFormat, site: str, kind: str, n: int = 1) -> None:
+        """ Add n events of kind "overflow" or "underflow" """
+        key = (fmt, site, kind)
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + n
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def by_format(self) -> dict[QFormat, int]:
+        totals: dict[QFormat, int] = {}
+        for (fmt, _, _), n in self.counts.items():
+            totals[fmt] = totals.get(fmt, 0) + n
+        return totals
+
+    def by_site(self) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for (_, site, _), n in self.counts.items():
+            totals[site] = totals.get(site, 0) + n
+        return totals
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+    def report(self) -> str:
+        """ Table of event counts, most frequent first """
+        lines = [f"{'site':<12} {'format':<12} {'kind':<10} {'count':>10}"]
+        for (fmt, site, kind), n in sorted(self.counts.items(), key=lambda item: -item[1]):
+            q = f"{'s' if fmt.signed else 'u'}Q{fmt.int_width}.{fmt.fract_width}"
+            lines.append(f"{site:<12} {q:<12} {kind:<10} {n:>10}")
+        return "\n".join(lines)
+
+
+class OverflowPolicy:
+    """
+    OverflowPolicy selects how out-of-range values are handled and where events are counted.
+
+    :param mode: Overflow handling mode
+    :param warn: Emit a RuntimeWarning naming the format and op site, once per format, op site
+        and kind of event under this policy. Calls that pass an explicit overflow mode never warn.
+    :param stats: Counter that receives every event
+    """
+
+    def __init__(self, mode: OverflowMode = OverflowMode.SATURATE, warn: bool = True, stats: OverflowStats | None = None):
+        """ OverflowPolicy class constructor """
+        self.mode: OverflowMode = mode
+        self.warn: bool = warn
+        self.stats: OverflowStats = OverflowStats() if stats is None else stats
+        # (format, site, kind) keys already warned about, so repeated events skip the warnings machinery
+        self.warned: set[tuple[QFormat, str, str]] = set()
+
+
+# Saturate with a warning per format and op site unless a policy is opened
+_default_policy = OverflowPolicy()
+_current_policy: ContextVar[OverflowPolicy] = ContextVar("pyfxp_overflow_policy", default=_default_policy)
+
+current_policy = _current_policy.get
+
+
+@contextmanager
+def overflow_policy(mode: OverflowMode = OverflowMode.SATURATE, warn: bool = False, stats: OverflowStats | None = None) -> Iterator[OverflowStats]:
+    """
+    Handle out-of-range values with the given mode for the duration of a with-block.
+    Yields the OverflowStats counting events raised inside the block.
+    """
+    policy = OverflowPolicy(mode=mode, warn=warn, stats=stats)
+    token = _current_policy.set(policy)
+    try:
+        yield policy.stats
+    finally:
+        _current_policy.reset(token)
+
+
+def _wrap(raw, fmt: QFormat):
+    """ Two's-complement wrap of raw integers (scalar or array) into the format width """
+    if not isinstance(raw, int):
+        # Imported here so scalar-only users never load NumPy
+        from . import wide
+
+        if raw.dtype == wide.INT128:
+            if wide.fits(fmt.total_width, fmt.signed):
+                return wide.wrap(raw, fmt.total_width, fmt.signed)
+            raw = wide.to_object(raw)
+        if raw.dtype != object and fmt.total_width >= 63:
+            # The mask no longer fits the native dtype
+            raw = raw.astype(object)
+
+    if not fmt.signed:
+        return raw & fmt.mask
+
+    # Sign-extend from the format's MSB
+    sign = 1 << (fmt.total_width - 1)
+    return ((raw & fmt.mask) ^ sign) - sign
+
+
+def _warn(policy: OverflowPolicy, fmt: QFormat, site: str, kind: str, mode: OverflowMode) -> None:
+    """ Warn about events of one kind at a format and op site, unless the policy already has """
+    key = (fmt, site, kind)
+    if key in policy.warned:
+        return
+    policy.warned.add(key)
+
+    q = f"{'s' if fmt.signed else 'u'}Q{fmt.int_width}.{fmt.fract_width}"
+    if mode is OverflowMode.WRAP:
+        warnings.warn(f"{kind.capitalize()} at {site}: values outside [{fmt.min_val}, {fmt.max_val}] of {q} are wrapped",
+                      RuntimeWarning)
+    elif kind == "overflow":
+        warnings.warn(f"Overflow at {site}: values above maximum {fmt.max_val} of {q} are clipped", RuntimeWarning)
+    else:
+        warnings.warn(f"Underflow at {site}: values below minimum {fmt.min_val} of {q} are clipped", RuntimeWarning)
+
+
+def resolve_overflow(raw: int, fmt: QFormat, mode: OverflowMode | None = None, site: str = "construct") -> int:
+    """
+    Bring an out-of-range raw integer back into the format range.
+    Only called once a value is known to lie outside [min_val, max_val]. An explicit mode
+    overrides the policy's and silences its warnings, since the caller chose the behaviour.
+    """
+    policy = _current_policy.get()
+    warn = policy.warn and mode is None
+    mode = policy.mode if mode is None else mode
+    kind = "overflow" if raw > fmt.max_val else "underflow"
+
+    policy.stats.record(fmt, site, kind)
+
+    match mode:
+        case OverflowMode.SATURATE:
+            if warn:
+                _warn(policy, fmt, site, kind, mode)
+            return fmt.max_val if kind == "overflow" else fmt.min_val
+
+        case OverflowMode.WRAP:
+            if warn:
+                _warn(policy, fmt, site, kind, mode)
+            return _wrap(raw, fmt)
+
+        case _:
+            raise OverflowError(f"{kind.capitalize()}: Value {raw} outside [{fmt.min_val}, {fmt.max_val}]")
+
+
+def resolve_overflow_array(raw: "np.ndarray", fmt: QFormat, mode: OverflowMode | None = None,
+                           site: str = "construct") -> "np.ndarray":
+    """
+    Bring out-of-range raw integers of an array back into the format range.
+    Events are counted per element, warnings are emitted as for resolve_overflow.
+    """
+    import numpy as np
+    from . import wide
+
+    if raw.dtype == wide.INT128:
+        # Bounds beyond the INT128 range cannot be exceeded
+        over = wide.greater(raw, fmt.max_val) if fmt.max_val < 2 ** 127 else np.zeros(raw.shape, dtype=bool)
+        under = wide.less(raw, fmt.min_val) if fmt.min_val >= -2 ** 127 else np.zeros(raw.shape, dtype=bool)
+    else:
+        over = raw > fmt.max_val
+        under = raw < fmt.min_val
+    n_over = int(np.count_nonzero(over))
+    n_under = int(np.count_nonzero(under))
+
+    if n_over == 0 and n_under == 0:
+        return raw
+
+    policy = _current_policy.get()
+    warn = policy.warn and mode is None
+    mode = policy.mode if mode is None else mode
+
+    if n_over:
+        policy.stats.record(fmt, site, "overflow", n_over)
+    if n_under:
+        policy.stats.record(fmt, site, "underflow", n_under)
+
+    match mode:
+        case OverflowMode.SATURATE:
+            if warn and n_over:
+                _warn(policy, fmt, site, "overflow", mode)
+            if warn and n_under:
+                _warn(policy, fmt, site, "underflow", mode)
+            raw = raw.copy()
+            wide_raw = raw.dtype == wide.INT128
+            if n_over:
+                raw[over] = wide.const(fmt.max_val) if wide_raw else fmt.max_val
+            if n_under:
+                raw[under] = wide.const(fmt.min_val) if wide_raw else fmt.min_val
+            return raw
+
+        case OverflowMode.WRAP:
+            if warn:
+                _warn(policy, fmt, site, "overflow" if n_over else "underflow", mode)
+            return _wrap(raw, fmt)
+
+        case _:
+            raise OverflowError(f"Overflow: {n_over + n_under} values outside [{fmt.min_val}, {fmt.max_val}]")
@@ -0,0 +1,217 @@
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Iterator
+
+from .fix_point import FixedPoint
+from .fix_point_array import FixedPointArray
+from .overflow import OverflowPolicy, OverflowStats, _current_policy
+
+
+# Methods instrumented while any hook is installed; reflected ops are reported under their forward name
+_OPS = {
+    FixedPoint: ("__add__", "__sub__", "__mul__", "__lshift__", "__rshift__", "resize", "bsl_scale", "bsr_scale"),
+    FixedPointArray: ("__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__", "__lshift__", "__rshift__",
+                      "resize", "bsl_scale", "bsr_scale"),
+}
+_REFLECTED = {"__radd__": "__add__", "__rsub__": "__sub__", "__rmul__": "__mul__"}
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Hook signature: hook(site, op, result, elapsed_ns, overflows)
+OpHook = Callable[[str, str, "FixedPoint | FixedPointArray", int, int], None]
+
+_hooks: list[OpHook] = []
+_originals: dict[tuple[type, str], Callable] = {}
+_install_lock = threading.Lock()
+
+# Set while an instrumented op runs, so ops nested inside it are not reported twice
+_state = threading.local()
+
+_node_name: ContextVar[str | None] = ContextVar("pyfxp_profile_node", default=None)
+
+
+def _caller_site() -> str:
+    """ file:line of the innermost frame outside the PyFxP package """
+    frame = sys._getframe(2)
+    # The separator keeps sibling paths such as .../PyFxP_examples/ from matching
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR + os.sep):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+
+
+class _OpStats(OverflowStats):
+    """ Events of one instrumented op, also forwarded to the stats of the policy it runs under """
+
+    def __init__(self, parent: OverflowStats):
+        """ _OpStats class constructor """
+        super().__init__()
+        self.parent: OverflowStats = parent
+
+    def record(self, fmt, site: str, kind: str, n: int = 1) -> None:
+        super().record(fmt, site, kind, n)
+        self.parent.record(fmt, site, kind, n)
+
+
+def _instrument(fn: Callable, op: str) -> Callable:
+    @wraps(fn)
+    def instrumented(*args, **kwargs):
+        if getattr(_state, "active", False):
+            return fn(*args, **kwargs)
+
+        # The op runs under its own copy of the active policy, so its overflow count is not
+        # polluted by events other threads record into shared stats such as the default's
+        policy = _current_policy.get()
+        op_policy = OverflowPolicy(policy.mode, policy.warn, _OpStats(policy.stats))
+        # Warnings already given under the active policy are not repeated per op
+        op_policy.warned = policy.warned
+        # Also covers the hooks, so ops they run themselves are not reported
+        _state.active = True
+        try:
+            token = _current_policy.set(op_policy)
+            try:
+                start = perf_counter_ns()
+                result = fn(*args, **kwargs)
+                elapsed = perf_counter_ns() - start
+            finally:
+                _current_policy.reset(token)
+
+            if result is not NotImplemented:
+                site = _node_name.get() or _caller_site()
+                for hook in tuple(_hooks):
+                    hook(site, op, result, elapsed, op_policy.stats.total)
+        finally:
+            _state.active = False
+        return result
+
+    return instrumented
+
+
+def _install() -> None:
+    for cls, names in _OPS.items():
+        for name in names:
+            fn = cls.__dict__[name]
+            _originals[cls, name] = fn
+            setattr(cls, name, _instrument(fn, _REFLECTED.get(name, name)))
+
+
+def _uninstall() -> None:
+    for (cls, name), fn in _originals.items():
+        setattr(cls, name, fn)
+    _originals.clear()
+
+
+def add_hook(hook: OpHook) -> None:
+    """
+    Call hook(site, op, result, elapsed_ns, overflows) after every FixedPoint/FixedPointArray op.
+
+    site is the active node name, or file:line of the user code that issued the op. Ops are
+    instrumented only while at least one hook is installed, so no cost is paid otherwise.
+    """
+    with _install_lock:
+        if not _hooks:
+            _install()
+        _hooks.append(hook)
+
+
+def remove_hook(hook: OpHook) -> None:
+    """ Remove a hook added with add_hook, restoring uninstrumented ops once none are left """
+    with _install_lock:
+        _hooks.remove(hook)
+        if not _hooks:
+            _uninstall()
+
+
+@contextmanager
+def node(name: str) -> Iterator[None]:
+    """ Attribute ops issued inside the with-block to name instead of their source line """
+    token = _node_name.set(name)
+    try:
+        yield
+    finally:
+        _node_name.reset(token)
+
+
+@dataclass
+class SiteStats:
+    """ Aggregated cost of one op type at one site """
+    site: str
+    op: str
+    calls: int = 0
+    time_ns: int = 0
+    overflows: int = 0
+    values: int = 0
+    max_width: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.time_ns / self.calls if self.calls else 0.0
+
+
+class Profiler:
+    """
+    Profiler aggregates call counts, time, overflow events and result width per (site, op).
+
+    Install it with profile(), or pass it to add_hook directly. values counts elements processed,
+    1 per FixedPoint op and the array size per FixedPointArray op.
+    """
+
+    def __init__(self):
+        """ Profiler class constructor """
+        self.stats: dict[tuple[str, str], SiteStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, site: str, op: str, result, elapsed_ns: int, overflows: int) -> None:
+        key = (site, op)
+        size = result.val_int.size if isinstance(result, FixedPointArray) else 1
+        with self._lock:
+            entry = self.stats.get(key)
+            if entry is None:
+                entry = self.stats[key] = SiteStats(site, op)
+            entry.calls += 1
+            entry.time_ns += elapsed_ns
+            entry.overflows += overflows
+            entry.values += size
+            entry.max_width = max(entry.max_width, result.total_width)
+
+    @property
+    def total_ns(self) -> int:
+        return sum(entry.time_ns for entry in self.stats.values())
+
+    def top(self, n: int | None = None, key: str = "time_ns") -> list[SiteStats]:
+        """ Site entries sorted by key (time_ns, calls, overflows, ...), most costly first """
+        return sorted(self.stats.values(), key=lambda entry: getattr(entry, key), reverse=True)[:n]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.clear()
+
+    def report(self, n: int | None = None, key: str = "time_ns") -> str:
+        """ Table of per-site costs, most costly first """
+        total = self.total_ns or 1
+        lines = [f"{'site':<28} {'op':<12} {'calls':>9} {'time_ms':>10} {'%':>6} {'mean_us':>9} {'overflows':>10} {'width':>6}"]
+        for entry in self.top(n, key):
+            lines.append(f"{entry.site:<28} {entry.op:<12} {entry.calls:>9} {entry.time_ns / 1e6:>10.3f} "
+                         f"{100 * entry.time_ns / total:>6.1f} {entry.mean_ns / 1e3:>9.2f} {entry.overflows:>10} {entry.max_width:>6}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile(profiler: Profiler | None = None) -> Iterator[Profiler]:
+    """
+    Profile every FixedPoint/FixedPointArray op issued inside the with-block.
+    Yields the Profiler, which stays readable afterwards.
+    """
+    profiler = Profiler() if profiler is None else profiler
+    add_hook(profiler)
+    try:
+        yield profiler
+    finally:
+        remove_hook(profiler)
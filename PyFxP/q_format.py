@@ -0,0 +1,107 @@
+class QFormat:
+    """
+    QFormat is an immutable, interned descriptor of a Qm.n fixed-point format.
+
+    Constructing the same (int_width, fract_width, signed) twice returns the same instance, so
+    formats can be compared by identity and used as dict keys. Bounds, mask and scale are
+    computed once per format, and the result formats of add/sub/mul with other formats are
+    memoized on first use.
+
+    :param int_width: Number of integer bits (not including sign)
+    :param fract_width: Number of fractional bits
+    :param signed: Whether the format is signed (two's complement)
+    """
+
+    __slots__ = ("int_width", "fract_width", "signed", "total_width", "min_val", "max_val", "mask", "scale",
+                 "_add_cache", "_sub_cache", "_mul_cache")
+
+    _interned: dict[tuple[int, int, bool], "QFormat"] = {}
+
+    def __new__(cls, int_width: int, fract_width: int, signed: bool = False) -> "QFormat":
+        key = (int_width, fract_width, bool(signed))
+        fmt = cls._interned.get(key)
+        if fmt is not None:
+            return fmt
+
+        total_width = int_width + fract_width + (1 if signed else 0)
+
+        fmt = object.__new__(cls)
+        init = object.__setattr__
+        init(fmt, "int_width", int_width)
+        init(fmt, "fract_width", fract_width)
+        init(fmt, "signed", bool(signed))
+        init(fmt, "total_width", total_width)
+
+        # Define bounds set by Qm.n scheme
+        init(fmt, "min_val", -(1 << (total_width - 1)) if signed else 0)
+        init(fmt, "max_val", (1 << (total_width - 1)) - 1 if signed else (1 << total_width) - 1)
+        init(fmt, "mask", (1 << total_width) - 1)
+        init(fmt, "scale", 1 << fract_width)
+
+        # Memoized result formats keyed by the other operand's format
+        init(fmt, "_add_cache", {})
+        init(fmt, "_sub_cache", {})
+        init(fmt, "_mul_cache", {})
+
+        # Another thread may have interned the same key in the meantime
+        return cls._interned.setdefault(key, fmt)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("QFormat is immutable")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError("QFormat is immutable")
+
+    def __reduce__(self):
+        # Re-intern on unpickling so identity comparisons hold across processes
+        return QFormat, (self.int_width, self.fract_width, self.signed)
+
+    def __repr__(self) -> str:
+        return f"QFormat(int_width={self.int_width}, fract_width={self.fract_width}, signed={self.signed})"
+
+    def add(self, other: "QFormat") -> "QFormat":
+        """
+        Result format of adding two Qm.n operands.
+        The result uses Q(m+1).n format to avoid overflow.
+        """
+        result = self._add_cache.get(other)
+        if result is None:
+            if self.fract_width != other.fract_width:
+                raise ValueError("Fractional widths must match for addition")
+
+            result_signed = self.signed or other.signed
+            result_int = max(self.int_width + self.signed, other.int_width + other.signed) + 1
+
+            result = self._add_cache[other] = QFormat(result_int - int(result_signed), self.fract_width, result_signed)
+        return result
+
+    def sub(self, other: "QFormat") -> "QFormat":
+        """
+        Result format of subtracting two Qm.n operands.
+        The result uses Q(m+1).n format to avoid overflow.
+        """
+        result = self._sub_cache.get(other)
+        if result is None:
+            if self.fract_width != other.fract_width:
+                raise ValueError("Fractional widths must match for subtraction")
+
+            result_signed = self.signed or other.signed
+            result_int = max(self.int_width, other.int_width) + 1
+
+            result = self._sub_cache[other] = QFormat(result_int, self.fract_width, result_signed)
+        return result
+
+    def mul(self, other: "QFormat") -> "QFormat":
+        """
+        Result format of multiplying two Qm.n operands.
+        An unsigned result uses Q(m1 + m2).(n1 + n2) format.
+        A signed result uses Q(m1 + m2 + 1).(n1 + n2) format.
+        """
+        result = self._mul_cache.get(other)
+        if result is None:
+            result_signed = self.signed or other.signed
+            result_int = self.int_width + other.int_width + int(self.signed and other.signed)
+            result_fract = self.fract_width + other.fract_width
+
+            result = self._mul_cache[other] = QFormat(result_int, result_fract, result_signed)
+        return result
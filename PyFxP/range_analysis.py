@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from .compiler import Kernel
+from .overflow import OverflowMode, current_policy
+from .q_format import QFormat
+from .registry import OppType
+from .rounding import shift_round
+
+
+_OP_NAMES = {
+    OppType.__ADD__: "add",
+    OppType.__SUB__: "sub",
+    OppType.__MUL__: "mul",
+    OppType.__LSHIFT__: "lshift",
+    OppType.__RSHIFT__: "rshift",
+    OppType.__RESIZE__: "resize",
+    OppType.__BSL_SCALE__: "bsl_scale",
+    OppType.__BSR_SCALE__: "bsr_scale",
+}
+
+
+def min_int_width(lo: int, hi: int, fract_width: int, signed: bool) -> int:
+    """ Smallest int_width whose format holds every raw value in [lo, hi] at the given fract_width """
+    if signed:
+        # x >= 0 needs x <= 2ᵏ - 1, x < 0 needs x >= -2ᵏ, i.e. ~x <= 2ᵏ - 1
+        magnitude = max(hi.bit_length() if hi > 0 else 0, (~lo).bit_length() if lo < 0 else 0)
+    else:
+        magnitude = max(hi, 0).bit_length()
+    return max(magnitude - fract_width, 0)
+
+
+@dataclass
+class NodeRange:
+    """ Value range of one node of a traced op graph, as raw integers in the node's format """
+    name: str
+    op: str
+    fmt: QFormat
+    static: tuple[int, int]
+    observed: tuple[int, int] | None = None
+    may_overflow: bool = False
+
+    @property
+    def static_int_width(self) -> int:
+        """ int_width guaranteed to hold the node for any input in range (interval analysis) """
+        return min_int_width(*self.static, self.fmt.fract_width, self.fmt.signed)
+
+    @property
+    def observed_int_width(self) -> int | None:
+        """ int_width that held every value seen in simulation, None if nothing was observed """
+        if self.observed is None:
+            return None
+        return min_int_width(*self.observed, self.fmt.fract_width, self.fmt.signed)
+
+    def recommended_fmt(self, observed: bool = False) -> QFormat:
+        """ Node format narrowed to the static (or observed) int_width """
+        int_width = self.observed_int_width if observed and self.observed is not None else self.static_int_width
+        return QFormat(int_width, self.fmt.fract_width, self.fmt.signed)
+
+
+class RangeReport:
+    """
+    RangeReport holds the value ranges and recommended int_width of every node of a kernel.
+
+    Nodes are the kernel inputs followed by its steps in execution order. Constants are not
+    listed since their width is known exactly.
+    """
+
+    def __init__(self, nodes: list[NodeRange]):
+        """ RangeReport class constructor """
+        self.nodes: list[NodeRange] = nodes
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __getitem__(self, name: str) -> NodeRange:
+        for node in self.nodes:
+            if node.name == name:
+                return node
+        raise KeyError(name)
+
+    @property
+    def bits_saved(self) -> int:
+        """ Total int bits removed across all nodes by the static recommendations """
+        return sum(node.fmt.int_width - node.static_int_width for node in self.nodes)
+
+    def report(self) -> str:
+        """ Table of traced vs recommended int_width per node """
+        lines = [f"{'node':<8} {'op':<10} {'format':<12} {'static':>7} {'observed':>9}  note"]
+        for node in self.nodes:
+            q = f"{'s' if node.fmt.signed else 'u'}Q{node.fmt.int_width}.{node.fmt.fract_width}"
+            observed = "-" if node.observed is None else str(node.observed_int_width)
+            note = "may overflow" if node.may_overflow else ""
+            lines.append(f"{node.name:<8} {node.op:<10} {q:<12} {node.static_int_width:>7} {observed:>9}  {note}")
+        return "\n".join(lines)
+
+
+def _input_interval(fmt: QFormat, value_range: tuple[float, float] | None) -> tuple[int, int]:
+    if value_range is None:
+        return fmt.min_val, fmt.max_val
+    lo, hi = (round(v * fmt.scale) for v in value_range)
+    return max(lo, fmt.min_val), min(hi, fmt.max_val)
+
+
+def _step_interval(opp_type, params: tuple, fmt: QFormat, lhs: tuple[int, int], rhs: tuple[int, int] | None,
+                   lhs_fmt: QFormat) -> tuple[int, int]:
+    """ Exact interval of a step's result before overflow handling """
+    lo, hi = lhs
+    match opp_type:
+        case OppType.__ADD__:
+            return lo + rhs[0], hi + rhs[1]
+        case OppType.__SUB__:
+            return lo - rhs[1], hi - rhs[0]
+        case OppType.__MUL__:
+            corners = [a * b for a in lhs for b in rhs]
+            return min(corners), max(corners)
+        case OppType.__LSHIFT__ | OppType.__BSL_SCALE__:
+            return lo << params[0], hi << params[0]
+        case OppType.__RSHIFT__:
+            return lo >> params[0], hi >> params[0]
+        case OppType.__RESIZE__:
+            shift = lhs_fmt.fract_width - fmt.fract_width
+            return shift_round(lo, shift, params[0]), shift_round(hi, shift, params[0])
+        case OppType.__BSR_SCALE__:
+            return shift_round(lo, params[0], params[1]), shift_round(hi, params[0], params[1])
+    raise ValueError(f"Unsupported op type {opp_type}")
+
+
+def _overflow_mode(opp_type, params: tuple) -> OverflowMode:
+    """ Overflow mode a step resolves with, explicit or from the active policy """
+    explicit = {OppType.__RESIZE__: 1, OppType.__BSL_SCALE__: 1, OppType.__BSR_SCALE__: 2}.get(opp_type)
+    if explicit is not None and params[explicit] is not None:
+        return params[explicit]
+    return current_policy().mode
+
+
+def _observe(kernel: Kernel, samples: Iterable[Sequence]) -> dict[int, tuple[int, int]]:
+    """ Min/max raw value of every slot over all simulation runs """
+    observed: dict[int, tuple[int, int]] = {}
+    for args in samples:
+        for slot, arr in enumerate(kernel.evaluate(*args)):
+            if arr is None or slot in kernel.constants or arr.val_int.size == 0:
+                continue
+            lo, hi = int(np.min(arr.val_int)), int(np.max(arr.val_int))
+            if slot in observed:
+                lo, hi = min(lo, observed[slot][0]), max(hi, observed[slot][1])
+            observed[slot] = (lo, hi)
+    return observed
+
+
+def analyze_ranges(kernel: Kernel, input_ranges: Sequence[tuple[float, float] | None] | None = None,
+                   samples: Iterable[Sequence] | None = None) -> RangeReport:
+    """
+    Propagate value ranges through a compiled kernel and recommend the minimal int_width per node.
+
+    Static ranges come from interval arithmetic on raw integers, starting from input_ranges
+    (or each input's full format range) and constants. A node whose interval exceeds its
+    format is flagged and continues with the interval its overflow mode leaves, i.e. clipped
+    for SATURATE/RAISE and the full format range for WRAP. Observed ranges are the min/max
+    seen when evaluating the kernel on each argument tuple in samples.
+
+    Width promotion in +, - and * assumes worst-case operands, so the recommendations are
+    often several bits narrower than the traced formats. Apply them with resize.
+
+    :param kernel: Kernel from compile_kernel
+    :param input_ranges: Real-valued (min, max) per input, None for the input's full range
+    :param samples: Argument tuples to evaluate the kernel on, e.g. [(xs, ys)]
+    """
+    input_ranges = [None] * len(kernel.input_fmts) if input_ranges is None else list(input_ranges)
+    if len(input_ranges) != len(kernel.input_fmts):
+        raise ValueError(f"Expected {len(kernel.input_fmts)} input ranges, got {len(input_ranges)}")
+
+    intervals: dict[int, tuple[int, int]] = {}
+    fmts: dict[int, QFormat] = {}
+    nodes = []
+
+    for i, (fmt, value_range) in enumerate(zip(kernel.input_fmts, input_ranges)):
+        intervals[i], fmts[i] = _input_interval(fmt, value_range), fmt
+        nodes.append((i, NodeRange(f"in{i}", "input", fmt, intervals[i])))
+
+    for slot, const in kernel.constants.items():
+        value = int(const.val_int)
+        intervals[slot], fmts[slot] = (value, value), const.fmt
+
+    for k, (opp_type, dest, lhs, rhs, params, fmt) in enumerate(kernel.steps):
+        lo, hi = _step_interval(opp_type, params, fmt, intervals[lhs], None if rhs is None else intervals[rhs], fmts[lhs])
+        node = NodeRange(f"n{k}", _OP_NAMES.get(opp_type, str(opp_type)), fmt, (lo, hi))
+
+        if lo < fmt.min_val or hi > fmt.max_val:
+            node.may_overflow = True
+            if _overflow_mode(opp_type, params) is OverflowMode.WRAP:
+                lo, hi = fmt.min_val, fmt.max_val
+            else:
+                lo, hi = max(lo, fmt.min_val), min(hi, fmt.max_val)
+
+        intervals[dest], fmts[dest] = (lo, hi), fmt
+        nodes.append((dest, node))
+
+    if samples is not None:
+        observed = _observe(kernel, samples)
+        for slot, node in nodes:
+            node.observed = observed.get(slot)
+
+    return RangeReport([node for _, node in nodes])
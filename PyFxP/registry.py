@@ -1,6 +1,11 @@
-from dataclasses import dataclass
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import TYPE_CHECKING
+from functools import wraps
+from typing import TYPE_CHECKING, Callable, Iterator, NamedTuple
 
 if TYPE_CHECKING:
     from .fix_point import FixedPoint
@@ -10,25 +15,240 @@ class OppType(Enum):
     __ADD__ = 0
     __SUB__ = 1
     __MUL__ = 2
-    
+    __LSHIFT__ = 3
+    __RSHIFT__ = 4
+    __RESIZE__ = 5
+    __BSL_SCALE__ = 6
+    __BSR_SCALE__ = 7
 
-@dataclass
-class Opp:
+
+# Dunder names are not Enum members, so OppType's attributes are the plain ints 0 to 7
+_OPP_TYPES = (OppType.__ADD__, OppType.__SUB__, OppType.__MUL__, OppType.__LSHIFT__, OppType.__RSHIFT__,
+              OppType.__RESIZE__, OppType.__BSL_SCALE__, OppType.__BSR_SCALE__)
+
+
+# A NamedTuple rather than a dataclass keeps dataclasses (and inspect) out of the import path
+class Opp(NamedTuple):
     lhs: "FixedPoint"
-    rhs: "FixedPoint"
+    rhs: "FixedPoint | None"
     result: "FixedPoint"
     opp_type: OppType
+    # Non-FixedPoint arguments of unary ops, e.g. (n,) for shifts or (rounding, overflow) for resize
+    params: tuple = ()
+
+
+class RegistryMode(Enum):
+    OFF = 0         # Nothing recorded
+    COUNT = 1       # Var and per-op-type counts only
+    SAMPLED = 2     # Counts, plus every Nth var and op
+    RING = 3        # Counts, plus the last N vars and ops
+    FULL = 4        # Counts, plus every var and op
+
+
+class RegistryScope:
+    """
+    RegistryScope holds the var/op logs and counters recorded under one registry mode.
+
+    Each thread or asyncio task records into its own active scope without locking. A scope
+    opened with a parent merges its logs and counters into that parent when it is closed.
+
+    :param mode: Recording mode
+    :param sample_every: Log every Nth var and op (SAMPLED mode)
+    :param capacity: Number of most recent vars and ops kept (RING mode)
+    :param parent: Scope to merge into on close, if any
+    """
+
+    def __init__(self, mode: RegistryMode = RegistryMode.FULL, sample_every: int = 1, capacity: int | None = None,
+                 parent: "RegistryScope | None" = None):
+        """ RegistryScope class constructor """
+
+        if mode is RegistryMode.SAMPLED and sample_every < 1:
+            raise ValueError("sample_every must be a positive integer")
+        if mode is RegistryMode.RING and (capacity is None or capacity < 1):
+            raise ValueError("RING mode requires a positive capacity")
+
+        self.mode: RegistryMode = mode
+        self.sample_every: int = sample_every
+        self.capacity: int | None = capacity
+        self.parent: RegistryScope | None = parent
+
+        # Checked by FixedPoint before logging, so OFF mode costs a single attribute lookup
+        self.enabled: bool = mode is not RegistryMode.OFF
+        # FixedPoint bumps the counters of a COUNT scope inline instead of calling log_var/log_op
+        self.count_only: bool = mode is RegistryMode.COUNT
+
+        self.var_count: int = 0
+        self.op_count: int = 0
+        # Op count indexed by op type, a list so FixedPoint can bump it inline
+        self.type_counts: list[int] = [0] * len(_OPP_TYPES)
+
+        # Ring buffers drop the oldest entries once full
+        if mode is RegistryMode.RING:
+            self.var_registry: list["FixedPoint"] | deque["FixedPoint"] = deque(maxlen=capacity)
+            self.op_registry: list[Opp] | deque[Opp] = deque(maxlen=capacity)
+        else:
+            self.var_registry = []
+            self.op_registry = []
+
+        self._record: bool = mode in (RegistryMode.FULL, RegistryMode.RING)
+        # Compared on every log call, where looking up RegistryMode.SAMPLED would cost more than the check
+        self._sampled: bool = mode is RegistryMode.SAMPLED
+
+        # Only taken when child scopes merge in, never on the recording path
+        self._merge_lock = threading.Lock()
+
+    @property
+    def op_counts(self) -> dict[OppType, int]:
+        """ Op count per op type, for the types logged at least once """
+        return {opp_type: count for opp_type, count in zip(_OPP_TYPES, self.type_counts) if count}
+
+    def log_var(self, fxp: "FixedPoint") -> None:
+        self.var_count += 1
+        if self._record:
+            self.var_registry.append(fxp)
+        elif self._sampled and self.var_count % self.sample_every == 0:
+            self.var_registry.append(fxp)
+
+    def log_op(self, lhs: "FixedPoint", rhs: "FixedPoint | None", result: "FixedPoint", opp_type: OppType,
+               params: tuple = ()) -> None:
+        self.op_count += 1
+        self.type_counts[opp_type] += 1
+        if self._record or (self._sampled and self.op_count % self.sample_every == 0):
+            self.op_registry.append(Opp(lhs, rhs, result, opp_type, params))
+
+    def merge(self, child: "RegistryScope") -> None:
+        """
+        Absorb a child scope's counters and recorded vars/ops.
+        Entries the child already dropped (sampling, ring eviction) are not recovered.
+        """
+        if not self.enabled:
+            return
+
+        with self._merge_lock:
+            self.var_count += child.var_count
+            self.op_count += child.op_count
+            for i, count in enumerate(child.type_counts):
+                self.type_counts[i] += count
+
+            if self.mode is not RegistryMode.COUNT:
+                self.var_registry.extend(child.var_registry)
+                self.op_registry.extend(child.op_registry)
+
 
+def _scope_from_env(value: str | None) -> RegistryScope:
+    """
+    Root scope for a PYFXP_REGISTRY value: off, count, sampled:N, ring:N or full.
+    FULL is kept when unset, for backward compatibility.
+    """
+    if not value:
+        return RegistryScope()
+
+    name, _, arg = value.strip().partition(":")
+    try:
+        mode = RegistryMode[name.upper()]
+        n = int(arg) if arg else None
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid PYFXP_REGISTRY value {value!r}, expected off, count, sampled:N, ring:N or full") from None
+
+    if mode is RegistryMode.SAMPLED:
+        return RegistryScope(mode, sample_every=1 if n is None else n)
+    return RegistryScope(mode, capacity=n)
+
+
+# Root scope seen by any context that has not opened its own
+_root_scope = _scope_from_env(os.environ.get("PYFXP_REGISTRY"))
+_current_scope: ContextVar[RegistryScope] = ContextVar("pyfxp_registry_scope", default=_root_scope)
+
+# Fast accessor for the scope active in the calling thread/task
+current_scope: Callable[[], RegistryScope] = _current_scope.get
+
+
+class _RegistryMeta(type):
+    """ Resolves Registry's log attributes against the scope active in the calling context """
+
+    @property
+    def var_registry(cls) -> list["FixedPoint"] | deque["FixedPoint"]:
+        return _current_scope.get().var_registry
+
+    @property
+    def op_registry(cls) -> list[Opp] | deque[Opp]:
+        return _current_scope.get().op_registry
+
+    @property
+    def enabled(cls) -> bool:
+        return _current_scope.get().enabled
+
+
+class Registry(metaclass=_RegistryMeta):
+    """
+    Registry records FixedPoint vars and arithmetic ops into the RegistryScope active in the
+    calling thread or asyncio task.
+
+    Every var and op is logged into a process-wide root scope by default, for backward
+    compatibility. The PYFXP_REGISTRY environment variable selects another root mode at import,
+    e.g. PYFXP_REGISTRY=ring:1000. Registry.scope opens
+    a child scope for a block, e.g. one per worker thread or task, which merges back into its
+    parent on exit. Registry.configure switches to a cheaper mode for a block without merging.
+    """
+
+    @classmethod
+    def current(cls) -> RegistryScope:
+        """ Scope active in the calling context """
+        return _current_scope.get()
+
+    @classmethod
+    @contextmanager
+    def scope(cls, mode: RegistryMode | None = None, sample_every: int = 1, capacity: int | None = None,
+              parent: RegistryScope | None = None, merge: bool = True) -> Iterator[RegistryScope]:
+        """
+        Record into a fresh scope for the duration of a with-block.
+
+        :param mode: Recording mode, inherited from the parent if None
+        :param parent: Scope to merge into, defaults to the scope active in this context.
+            Pass it explicitly from worker threads, which do not inherit the spawning context.
+        :param merge: Whether to merge the scope's logs into the parent on exit
+        """
+        parent = _current_scope.get() if parent is None else parent
+        if mode is None:
+            mode, sample_every, capacity = parent.mode, parent.sample_every, parent.capacity
+
+        scope = RegistryScope(mode=mode, sample_every=sample_every, capacity=capacity, parent=parent if merge else None)
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+            if scope.parent is not None:
+                scope.parent.merge(scope)
+
+    @classmethod
+    def configure(cls, mode: RegistryMode, sample_every: int = 1, capacity: int | None = None):
+        """
+        Record into a fresh scope with the given mode for the duration of a with-block.
+        The previous scope is restored on exit; the yielded scope stays readable afterwards.
+        """
+        return cls.scope(mode=mode, sample_every=sample_every, capacity=capacity, merge=False)
+
+    @classmethod
+    def bind(cls, fn: Callable, mode: RegistryMode | None = None) -> Callable:
+        """
+        Wrap fn so each call records into its own child of the scope active now.
+        Useful for handing work to thread pools, e.g. executor.submit(Registry.bind(model), x).
+        """
+        parent = _current_scope.get()
 
-class Registry:
+        @wraps(fn)
+        def run(*args, **kwargs):
+            with cls.scope(mode=mode, parent=parent):
+                return fn(*args, **kwargs)
 
-    var_registry : list["FixedPoint"] = []
-    op_registry : list[Opp] = []
+        return run
 
     @classmethod
     def log_var(cls, fxp : "FixedPoint") -> None:
-        cls.var_registry.append(fxp)
+        _current_scope.get().log_var(fxp)
 
     @classmethod
-    def log_op(cls, lhs : "FixedPoint", rhs: "FixedPoint", result : "FixedPoint", opp_type: OppType) -> None:
-        cls.op_registry.append(Opp(lhs=lhs, rhs=rhs, result=result, opp_type=opp_type))
+    def log_op(cls, lhs : "FixedPoint", rhs: "FixedPoint | None", result : "FixedPoint", opp_type: OppType,
+               params: tuple = ()) -> None:
+        _current_scope.get().log_op(lhs, rhs, result, opp_type, params)
@@ -0,0 +1,57 @@
+from enum import Enum
+
+
+class RoundingMode(Enum):
+    FLOOR = 0           # Toward -inf, i.e. drop LSBs
+    CEIL = 1            # Toward +inf
+    HALF_UP = 2         # Nearest, ties toward +inf
+    CONVERGENT = 3      # Nearest, ties to even
+    TRUNCATE = 4        # Toward zero
+
+
+# Scalar forms of shift_round. Python ints cannot overflow, so each adds its rounding offset
+# before a single floor shift. Keyed by mode, since matching on enum members costs an
+# attribute lookup per case.
+_INT_SHIFT_ROUND = {
+    RoundingMode.FLOOR: lambda raw, n: raw >> n,
+    RoundingMode.CEIL: lambda raw, n: -(-raw >> n),
+    RoundingMode.HALF_UP: lambda raw, n: (raw + (1 << (n - 1))) >> n,
+    RoundingMode.CONVERGENT: lambda raw, n: (raw + (1 << (n - 1)) - 1 + ((raw >> n) & 1)) >> n,
+    RoundingMode.TRUNCATE: lambda raw, n: raw >> n if raw >= 0 else -(-raw >> n),
+}
+
+
+def shift_round(raw, n: int, rounding: RoundingMode = RoundingMode.FLOOR):
+    """
+    Arithmetic right shift of raw integers by n bits with the given rounding.
+
+    Works on Python ints and NumPy integer/object arrays alike. The rounding increment is derived
+    from the discarded bits rather than added before the shift, so native int64 arrays cannot
+    overflow.
+    """
+    if n <= 0:
+        return raw << -n
+
+    if type(raw) is int:
+        return _INT_SHIFT_ROUND[rounding](raw, n)
+
+    quotient = raw >> n
+    if rounding is RoundingMode.FLOOR:
+        return quotient
+
+    remainder = raw & ((1 << n) - 1)
+    half = 1 << (n - 1)
+
+    match rounding:
+        case RoundingMode.CEIL:
+            carry = remainder != 0
+        case RoundingMode.HALF_UP:
+            carry = remainder >= half
+        case RoundingMode.CONVERGENT:
+            carry = (remainder > half) | ((remainder == half) & (quotient & 1 == 1))
+        case RoundingMode.TRUNCATE:
+            carry = (raw < 0) & (remainder != 0)
+        case _:
+            raise ValueError(f"Unsupported rounding mode {rounding}")
+
+    return quotient + carry
@@ -0,0 +1,110 @@
+import os
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+from .fix_point_array import FixedPointArray
+from .overflow import OverflowMode
+from .q_format import QFormat
+
+
+def _file_kind(path: str | os.PathLike, kind: str | None) -> str:
+    """ Resolve the file kind from an explicit value or the file extension """
+    if kind is not None:
+        return kind
+    ext = os.path.splitext(os.fspath(path))[1].lower()
+    return {".npy": "npy", ".csv": "csv", ".txt": "csv"}.get(ext, "raw")
+
+
+def read_chunks(path: str | os.PathLike, chunk_size: int = 65536, kind: str | None = None,
+                dtype: np.dtype = np.float64, delimiter: str = ",") -> Iterator[np.ndarray]:
+    """
+    Yield float samples from a file in chunks of at most chunk_size values (rows for CSV).
+
+    .npy and raw binary files are memory-mapped, so files larger than RAM are read one chunk
+    at a time. Each yielded chunk is an in-memory copy and can be dropped once processed.
+
+    :param path: File to read
+    :param chunk_size: Number of samples per chunk
+    :param kind: "npy", "raw" or "csv", inferred from the extension if None
+    :param dtype: Sample dtype of raw binary files
+    :param delimiter: Column delimiter of CSV files
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    match _file_kind(path, kind):
+        case "npy":
+            data = np.load(path, mmap_mode="r")
+        case "raw":
+            if os.path.getsize(path) == 0:
+                return
+            data = np.memmap(path, dtype=dtype, mode="r")
+        case "csv":
+            with open(path) as f:
+                while lines := list(islice(f, chunk_size)):
+                    yield np.loadtxt(lines, delimiter=delimiter, dtype=np.float64, ndmin=1)
+            return
+        case other:
+            raise ValueError(f"Unsupported file kind {other!r}")
+
+    for start in range(0, len(data), chunk_size):
+        yield np.array(data[start:start + chunk_size])
+
+
+def quantize_stream(chunks: Iterable[np.ndarray], fmt: QFormat, overflow: OverflowMode | None = None,
+                    stage: Callable[[FixedPointArray], FixedPointArray] | None = None) -> Iterator[FixedPointArray]:
+    """
+    Quantize float chunks to a Qm.n format, optionally passing each through an arithmetic stage.
+
+    :param chunks: Float sample chunks, e.g. from read_chunks
+    :param fmt: Format to quantize to
+    :param overflow: How to handle out-of-range samples, defaults to the active overflow policy
+    :param stage: Callable applied to each quantized chunk, e.g. FIRFilter.process. Stateful
+        stages see chunks in order, so streaming filters continue across chunk boundaries.
+    """
+    for chunk in chunks:
+        quantized = FixedPointArray(chunk, fmt.int_width, fmt.fract_width, fmt.signed, overflow=overflow)
+        yield quantized if stage is None else stage(quantized)
+
+
+def _raw_dtype(fmt: QFormat) -> np.dtype:
+    if fmt.total_width > 64:
+        raise ValueError(f"Raw binary output supports formats up to 64 bits, got {fmt.total_width}")
+    return np.dtype("<i8") if fmt.signed else np.dtype("<u8")
+
+
+def write_stream(arrays: Iterable[FixedPointArray], path: str | os.PathLike, kind: str | None = None) -> int:
+    """
+    Write raw integer values of a stream of arrays to a file chunk by chunk.
+
+    Raw binary output holds little-endian int64 (signed) or uint64 (unsigned) values and can
+    be read back with read_chunks(path, kind="raw", dtype=...). CSV output holds one raw
+    integer per line. Returns the number of values written.
+    """
+    kind = _file_kind(path, kind)
+    if kind not in ("raw", "csv"):
+        raise ValueError(f"Unsupported output kind {kind!r}")
+
+    count = 0
+    with open(path, "wb") as f:
+        for arr in arrays:
+            if kind == "raw":
+                arr.val_int.astype(_raw_dtype(arr.fmt)).tofile(f)
+            else:
+                f.write("".join(f"{int(v)}\n" for v in arr.val_int.ravel()).encode())
+            count += arr.val_int.size
+    return count
+
+
+def quantize_file(src: str | os.PathLike, dst: str | os.PathLike, fmt: QFormat, chunk_size: int = 65536,
+                  src_kind: str | None = None, dst_kind: str | None = None, src_dtype: np.dtype = np.float64,
+                  overflow: OverflowMode | None = None,
+                  stage: Callable[[FixedPointArray], FixedPointArray] | None = None) -> int:
+    """
+    Quantize a float capture file into a raw integer test-vector file in constant memory.
+    Returns the number of values written.
+    """
+    chunks = read_chunks(src, chunk_size=chunk_size, kind=src_kind, dtype=src_dtype)
+    return write_stream(quantize_stream(chunks, fmt, overflow=overflow, stage=stage), dst, kind=dst_kind)
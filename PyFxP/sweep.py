@@ -0,0 +1,181 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from .fix_point_array import FixedPointArray
+from .overflow import OverflowMode, OverflowStats, overflow_policy
+
+
+# Descriptor of an array held in shared memory: (segment name, shape, dtype)
+_SharedArray = tuple[str, tuple[int, ...], str]
+
+# Segments attached by this worker process, kept open for the life of the pool
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+@dataclass
+class SweepResult:
+    """ Quantization error of one configuration, pooled over every input set """
+    config: Any
+    signal_power: float = 0.0
+    noise_power: float = 0.0
+    max_error: float = 0.0
+    overflows: int = 0
+    n_samples: int = 0
+    n_runs: int = 0
+
+    @property
+    def sqnr_db(self) -> float:
+        """ Signal-to-quantization-noise ratio in dB over all samples """
+        if self.noise_power == 0:
+            return math.inf
+        return 10 * math.log10(self.signal_power / self.noise_power)
+
+    @property
+    def mse(self) -> float:
+        return self.noise_power / self.n_samples if self.n_samples else 0.0
+
+    def add(self, signal_power: float, noise_power: float, max_error: float, overflows: int, n_samples: int) -> None:
+        """ Fold the metrics of one run into the totals """
+        self.signal_power += signal_power
+        self.noise_power += noise_power
+        self.max_error = max(self.max_error, max_error)
+        self.overflows += overflows
+        self.n_samples += n_samples
+        self.n_runs += 1
+
+
+class SweepReport:
+    """ SweepReport holds one SweepResult per configuration, in the order configurations were given """
+
+    def __init__(self, results: list[SweepResult]):
+        """ SweepReport class constructor """
+        self.results: list[SweepResult] = results
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def best(self, min_sqnr_db: float | None = None, max_overflows: int = 0) -> SweepResult | None:
+        """
+        First configuration meeting the SQNR target without exceeding max_overflows, or the
+        highest-SQNR configuration if no target is given. Order configurations cheapest first.
+        """
+        candidates = [r for r in self.results if r.overflows <= max_overflows]
+        if min_sqnr_db is None:
+            return max(candidates, key=lambda r: r.sqnr_db, default=None)
+        return next((r for r in candidates if r.sqnr_db >= min_sqnr_db), None)
+
+    def report(self) -> str:
+        """ Table of error metrics per configuration """
+        lines = [f"{'config':<30} {'sqnr_db':>9} {'max_error':>12} {'overflows':>10} {'runs':>5}"]
+        for r in self.results:
+            lines.append(f"{str(r.config):<30} {r.sqnr_db:>9.2f} {r.max_error:>12.4g} {r.overflows:>10} {r.n_runs:>5}")
+        return "\n".join(lines)
+
+
+def _metrics(output: FixedPointArray, reference: np.ndarray, stats: OverflowStats) -> tuple[float, float, float, int, int]:
+    if not isinstance(output, FixedPointArray):
+        raise TypeError("Sweep model must return a FixedPointArray")
+    if output.shape != reference.shape:
+        raise ValueError(f"Model output shape {output.shape} does not match reference shape {reference.shape}")
+
+    error = output.val_float - reference
+    max_error = float(np.max(np.abs(error))) if error.size else 0.0
+    return float(np.dot(reference.ravel(), reference.ravel())), float(np.dot(error.ravel(), error.ravel())), \
+        max_error, stats.total, int(reference.size)
+
+
+def _evaluate(model: Callable, config, inputs: Sequence[np.ndarray], reference: np.ndarray,
+              overflow: OverflowMode) -> tuple[float, float, float, int, int]:
+    """ Run one (config, input set) job and measure it against the reference """
+    with overflow_policy(overflow, warn=False) as stats:
+        output = model(config, *inputs)
+    return _metrics(output, reference, stats)
+
+
+def _attach(shared: _SharedArray) -> np.ndarray:
+    """ Read-only view of a shared array, attaching to its segment on first use """
+    name, shape, dtype = shared
+    shm = _attached.get(name)
+    if shm is None:
+        # Pool workers share the parent's resource tracker, which unlinks the segment only once
+        shm = _attached[name] = shared_memory.SharedMemory(name=name)
+
+    view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    view.flags.writeable = False
+    return view
+
+
+def _run_job(model: Callable, config, inputs: list[_SharedArray], reference: _SharedArray,
+             overflow: OverflowMode) -> tuple[float, float, float, int, int]:
+    """ Worker entry point, resolving shared inputs before evaluating """
+    return _evaluate(model, config, [_attach(x) for x in inputs], _attach(reference), overflow)
+
+
+def _share(arr: np.ndarray, segments: list[shared_memory.SharedMemory]) -> _SharedArray:
+    """ Copy an array into a new shared memory segment owned by the caller """
+    arr = np.ascontiguousarray(arr)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    segments.append(shm)
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm.name, arr.shape, arr.dtype.str
+
+
+def run_sweep(model: Callable[..., FixedPointArray], configs: Sequence, reference: Callable[..., np.ndarray],
+              inputs: Callable[[np.random.Generator], Sequence[np.ndarray]] | Sequence[Sequence[np.ndarray]],
+              seeds: Sequence[int] = (0,), overflow: OverflowMode = OverflowMode.SATURATE,
+              max_workers: int | None = None) -> SweepReport:
+    """
+    Measure quantization error of a fixed-point model over every (configuration, input set) pair.
+
+    Input sets and their float references are generated once in the calling process and
+    copied into shared memory, so workers map them instead of receiving pickled copies. Each
+    job runs model(config, *inputs) under its own overflow policy, which counts events without
+    warning, and the metrics are pooled per configuration.
+
+    model, reference and inputs must be picklable (module-level functions) when running on a
+    process pool. Jobs are independent, so throughput scales with the number of workers.
+
+    :param model: Fixed-point model, called as model(config, *inputs) and returning a FixedPointArray
+    :param configs: Format configurations to compare, passed to model unchanged
+    :param reference: Floating-point reference, called as reference(*inputs)
+    :param inputs: Random input generator called with np.random.default_rng(seed) for each seed,
+        or an explicit sequence of input sets
+    :param seeds: Seeds for the input generator, ignored for explicit input sets
+    :param overflow: Overflow mode applied inside every job
+    :param max_workers: Worker processes, 0 runs every job in the calling process
+    """
+    input_sets = [tuple(inputs(np.random.default_rng(s))) for s in seeds] if callable(inputs) else [tuple(x) for x in inputs]
+    references = [np.asarray(reference(*input_set), dtype=np.float64) for input_set in input_sets]
+    results = [SweepResult(config) for config in configs]
+
+    if max_workers == 0:
+        for result in results:
+            for input_set, ref in zip(input_sets, references):
+                result.add(*_evaluate(model, result.config, input_set, ref, overflow))
+        return SweepReport(results)
+
+    segments: list[shared_memory.SharedMemory] = []
+    try:
+        shared_inputs = [[_share(np.asarray(x), segments) for x in input_set] for input_set in input_sets]
+        shared_refs = [_share(ref, segments) for ref in references]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            jobs = [(result, pool.submit(_run_job, model, result.config, shared_inputs[k], shared_refs[k], overflow))
+                    for result in results for k in range(len(input_sets))]
+            # Fold in submission order so pooled sums are reproducible
+            for result, future in jobs:
+                result.add(*future.result())
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+    return SweepReport(results)
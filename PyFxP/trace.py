@@ -0,0 +1,398 @@
+import json
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+
+from .fix_point import FixedPoint
+from .q_format import QFormat
+from .range_analysis import _OP_NAMES
+from .registry import OppType, RegistryMode, RegistryScope, _current_scope
+from .rounding import RoundingMode, shift_round
+
+
+# Bit flags per op
+OVERFLOW = 1        # Result differs from the exact result, i.e. overflow handling changed it
+SATURATED = 2       # Overflowed and clipped to a bound of the result format
+
+_TRACE_VERSION = 2
+
+# Vars whose ids a writer remembers by default, a few tens of MB of bookkeeping
+MAX_IDS = 1 << 18
+
+# One file per column, each a packed little-endian array
+COLUMNS = np.dtype([
+    ("op", "u1"), ("flags", "u1"), ("rounding", "u1"), ("param", "<i4"),
+    ("lhs_id", "<i8"), ("rhs_id", "<i8"), ("result_id", "<i8"),
+    ("lhs_fmt", "<u2"), ("rhs_fmt", "<u2"), ("result_fmt", "<u2"),
+    ("lhs_raw", "<i8"), ("rhs_raw", "<i8"), ("result_raw", "<i8"),
+])
+_RAW_COLUMNS = ("lhs_raw", "rhs_raw", "result_raw")
+
+# Placeholders for absent operands and parameters
+NO_ID = -1
+NO_FMT = 0xFFFF
+NO_ROUNDING = 0xFF
+NO_PARAM = -1
+
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+# Raw result of each op before overflow handling, from (lhs, rhs, result, params). Right shifts cannot overflow
+_EXACT = {
+    OppType.__ADD__: lambda lhs, rhs, result, params: lhs._val_int + rhs._val_int,
+    OppType.__SUB__: lambda lhs, rhs, result, params: lhs._val_int - rhs._val_int,
+    OppType.__MUL__: lambda lhs, rhs, result, params: lhs._val_int * rhs._val_int,
+    OppType.__LSHIFT__: lambda lhs, rhs, result, params: lhs._val_int << params[0],
+    OppType.__RESIZE__: lambda lhs, rhs, result, params:
+        shift_round(lhs._val_int, lhs._fmt.fract_width - result._fmt.fract_width, params[0]),
+    OppType.__BSL_SCALE__: lambda lhs, rhs, result, params: lhs._val_int << params[0],
+    OppType.__BSR_SCALE__: lambda lhs, rhs, result, params: shift_round(lhs._val_int, params[0], params[1]),
+}
+
+# Position of the rounding mode and shift amount in each op's params
+_ROUNDING_PARAM = {OppType.__RESIZE__: 0, OppType.__BSR_SCALE__: 1}
+_SHIFT_OPS = (OppType.__LSHIFT__, OppType.__RSHIFT__, OppType.__BSL_SCALE__, OppType.__BSR_SCALE__)
+
+
+class TraceWriter:
+    """
+    TraceWriter streams FixedPoint ops into a columnar trace directory.
+
+    Rows are buffered and appended to one packed file per column every chunk_size ops. Raw
+    values beyond int64 are appended as "row raw" lines to a .wide file per raw column. meta.json
+    (formats and row count) is rewritten after each flush, so a trace stays readable up to the
+    last flush while the simulation is still running.
+
+    Operands are identified by var ids, numbered in order of creation while tracing. Vars
+    created before tracing started are numbered when first used. Only the max_ids most recently
+    created or used vars are remembered. A var unused for longer is renumbered when it is next
+    used, like a var created before tracing.
+
+    :param path: Trace directory, created if missing
+    :param chunk_size: Ops buffered between flushes
+    :param max_ids: Vars whose ids are remembered
+    """
+
+    def __init__(self, path: str | os.PathLike, chunk_size: int = 65536, max_ids: int = MAX_IDS):
+        """ TraceWriter class constructor """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        if max_ids < 1:
+            raise ValueError("max_ids must be a positive integer")
+
+        self.path: str = os.fspath(path)
+        self.chunk_size: int = chunk_size
+        self.max_ids: int = max_ids
+        self.n_ops: int = 0
+
+        os.makedirs(self.path, exist_ok=True)
+        self._files = {name: open(os.path.join(self.path, f"{name}.bin"), "wb") for name in COLUMNS.names}
+        self._wide_files = {name: open(os.path.join(self.path, f"{name}.wide"), "w") for name in _RAW_COLUMNS}
+        self._rows: list[tuple] = []
+        self._formats: dict[QFormat, int] = {}
+        # Buffered (row, raw) pairs per raw column for values outside int64, stored as 0 in the column
+        self._wide: dict[str, list[tuple[int, int]]] = {name: [] for name in _RAW_COLUMNS}
+        # id(var) -> var id, least recently used first. Python ids of freed vars are only
+        # overwritten once their address is reused, so the map is bounded by max_ids instead
+        self._ids: OrderedDict[int, int] = OrderedDict()
+        self._next_id = 0
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _fmt_id(self, fmt: QFormat) -> int:
+        fmt_id = self._formats.get(fmt)
+        if fmt_id is None:
+            fmt_id = self._formats[fmt] = len(self._formats)
+        return fmt_id
+
+    def _assign(self, key: int) -> int:
+        """ Number a var with the next id, forgetting the least recently used beyond max_ids """
+        ids = self._ids
+        ids[key] = var_id = self._next_id
+        ids.move_to_end(key)
+        self._next_id += 1
+        if len(ids) > self.max_ids:
+            ids.popitem(last=False)
+        return var_id
+
+    def _var_id(self, fxp: FixedPoint) -> int:
+        key = id(fxp)
+        var_id = self._ids.get(key)
+        if var_id is None:
+            return self._assign(key)
+        self._ids.move_to_end(key)
+        return var_id
+
+    def _raw(self, column: str, row: int, raw: int) -> int:
+        if _INT64_MIN <= raw <= _INT64_MAX:
+            return raw
+        self._wide[column].append((row, raw))
+        return 0
+
+    def log_var(self, fxp: FixedPoint) -> None:
+        # Python ids are reused after a var is freed, so creation always assigns a fresh number
+        self._assign(id(fxp))
+
+    def log_op(self, lhs: FixedPoint, rhs: FixedPoint | None, result: FixedPoint, opp_type: OppType,
+               params: tuple = ()) -> None:
+        row = self.n_ops
+        fmt = result._fmt
+        raw = result._val_int
+
+        flags = 0
+        exact = _EXACT.get(opp_type)
+        if exact is not None and exact(lhs, rhs, result, params) != raw:
+            flags = OVERFLOW | (SATURATED if raw == fmt.min_val or raw == fmt.max_val else 0)
+
+        rounding = _ROUNDING_PARAM.get(opp_type)
+        rounding = NO_ROUNDING if rounding is None else params[rounding].value
+        param = params[0] if opp_type in _SHIFT_OPS else NO_PARAM
+
+        self._rows.append((
+            opp_type, flags, rounding, param,
+            self._var_id(lhs), NO_ID if rhs is None else self._var_id(rhs), self._var_id(result),
+            self._fmt_id(lhs._fmt), NO_FMT if rhs is None else self._fmt_id(rhs._fmt), self._fmt_id(fmt),
+            self._raw("lhs_raw", row, lhs._val_int), 0 if rhs is None else self._raw("rhs_raw", row, rhs._val_int),
+            self._raw("result_raw", row, raw),
+        ))
+        self.n_ops += 1
+        if len(self._rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """ Append buffered rows to the column and .wide files, then rewrite meta.json """
+        if self._rows:
+            block = np.array(self._rows, dtype=COLUMNS)
+            for name, f in self._files.items():
+                block[name].tofile(f)
+                f.flush()
+            self._rows.clear()
+
+            for name, f in self._wide_files.items():
+                values = self._wide[name]
+                if values:
+                    f.write("".join(f"{row} {raw}\n" for row, raw in values))
+                    f.flush()
+                    values.clear()
+
+        # Written last, so readers never see rows whose columns are not on disk yet
+        meta = {
+            "version": _TRACE_VERSION,
+            "n_ops": self.n_ops,
+            "formats": [[fmt.int_width, fmt.fract_width, fmt.signed] for fmt in self._formats],
+        }
+        tmp = os.path.join(self.path, "meta.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(self.path, "meta.json"))
+
+    def close(self) -> None:
+        self.flush()
+        for f in (*self._files.values(), *self._wide_files.values()):
+            f.close()
+
+
+class TraceScope(RegistryScope):
+    """ RegistryScope that streams ops to a TraceWriter instead of keeping them in memory """
+
+    def __init__(self, writer: TraceWriter):
+        """ TraceScope class constructor """
+        super().__init__(mode=RegistryMode.COUNT)
+        # Every var and op must reach the writer
+        self.count_only = False
+        self.writer: TraceWriter = writer
+
+    def log_var(self, fxp: FixedPoint) -> None:
+        self.var_count += 1
+        self.writer.log_var(fxp)
+
+    def log_op(self, lhs: FixedPoint, rhs: FixedPoint | None, result: FixedPoint, opp_type: OppType,
+               params: tuple = ()) -> None:
+        super().log_op(lhs, rhs, result, opp_type, params)
+        self.writer.log_op(lhs, rhs, result, opp_type, params)
+
+
+@contextmanager
+def record_trace(path: str | os.PathLike, chunk_size: int = 65536, max_ids: int = MAX_IDS) -> Iterator[TraceScope]:
+    """
+    Stream every FixedPoint op logged inside the with-block to a trace directory.
+    Yields the recording scope, whose counters stay readable afterwards.
+    """
+    scope = TraceScope(TraceWriter(path, chunk_size, max_ids))
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        scope.writer.close()
+
+
+@dataclass
+class TraceOp:
+    """ One traced op with its operands resolved """
+    index: int
+    op: str
+    lhs_id: int
+    rhs_id: int | None
+    result_id: int
+    lhs_fmt: QFormat
+    rhs_fmt: QFormat | None
+    result_fmt: QFormat
+    lhs_raw: int
+    rhs_raw: int | None
+    result_raw: int
+    param: int | None
+    rounding: RoundingMode | None
+    flags: int
+
+    @property
+    def overflowed(self) -> bool:
+        return bool(self.flags & OVERFLOW)
+
+    @property
+    def saturated(self) -> bool:
+        return bool(self.flags & SATURATED)
+
+
+class Trace:
+    """
+    Trace memory-maps a trace directory written by TraceWriter for zero-copy queries.
+
+    Each column (op, flags, rounding, param, lhs_id, rhs_id, result_id, lhs_fmt, rhs_fmt,
+    result_fmt, lhs_raw, rhs_raw, result_raw) is a read-only NumPy memmap attribute, so
+    queries are whole-column array expressions. Raw values beyond int64 are read from the .wide
+    files and merged in by raw().
+
+    :param path: Trace directory
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """ Trace class constructor """
+        self.path: str = os.fspath(path)
+        with open(os.path.join(self.path, "meta.json")) as f:
+            meta = json.load(f)
+        if meta["version"] != _TRACE_VERSION:
+            raise ValueError(f"Trace version {meta['version']} is not supported")
+
+        self.n_ops: int = meta["n_ops"]
+        self.formats: list[QFormat] = [QFormat(*fields) for fields in meta["formats"]]
+        self._wide: dict[str, dict[int, int]] = {name: self._read_wide(name) for name in _RAW_COLUMNS}
+
+        for name in COLUMNS.names:
+            dtype = COLUMNS[name]
+            if self.n_ops == 0:
+                column = np.zeros(0, dtype=dtype)
+            else:
+                # Only rows covered by meta.json, a writer may have appended more since
+                column = np.memmap(os.path.join(self.path, f"{name}.bin"), dtype=dtype, mode="r", shape=(self.n_ops,))
+            setattr(self, name, column)
+
+    def _read_wide(self, column: str) -> dict[int, int]:
+        """ row -> raw value beyond int64 for rows covered by meta.json """
+        wide = {}
+        with open(os.path.join(self.path, f"{column}.wide")) as f:
+            for line in f:
+                row, raw = line.split()
+                row = int(row)
+                # Rows are appended in order, and a writer may have appended more since
+                if row >= self.n_ops:
+                    break
+                wide[row] = int(raw)
+        return wide
+
+    def __len__(self) -> int:
+        return self.n_ops
+
+    def raw(self, column: str) -> np.ndarray:
+        """ Raw values of lhs_raw, rhs_raw or result_raw, as Python ints if any exceed int64 """
+        values = getattr(self, column)
+        wide = self._wide[column]
+        if not wide:
+            return values
+        values = values.astype(object)
+        for row, raw in wide.items():
+            values[row] = raw
+        return values
+
+    def overflowed(self) -> np.ndarray:
+        """ Indices of ops whose result was changed by overflow handling """
+        return np.flatnonzero(self.flags & OVERFLOW)
+
+    def saturated(self) -> np.ndarray:
+        """ Indices of ops whose result saturated """
+        return np.flatnonzero(self.flags & SATURATED)
+
+    def where(self, op: str | None = None, fmt: QFormat | None = None, overflowed: bool | None = None) -> np.ndarray:
+        """ Indices of ops matching every given filter, e.g. where(op="mul", overflowed=True) """
+        mask = np.ones(self.n_ops, dtype=bool)
+        if op is not None:
+            op_types = [opp_type for opp_type, name in _OP_NAMES.items() if name == op]
+            if not op_types:
+                raise ValueError(f"Unknown op {op!r}")
+            mask &= self.op == op_types[0]
+        if fmt is not None:
+            mask &= self.result_fmt == (self.formats.index(fmt) if fmt in self.formats else NO_FMT)
+        if overflowed is not None:
+            mask &= (self.flags & OVERFLOW).astype(bool) == overflowed
+        return np.flatnonzero(mask)
+
+    def __getitem__(self, index: int) -> TraceOp:
+        if not -self.n_ops <= index < self.n_ops:
+            raise IndexError("Trace index out of range")
+        index %= self.n_ops
+
+        def raw(column: str) -> int:
+            return self._wide[column].get(index, int(getattr(self, column)[index]))
+
+        binary = int(self.rhs_fmt[index]) != NO_FMT
+        rounding = int(self.rounding[index])
+        param = int(self.param[index])
+        return TraceOp(
+            index=index, op=_OP_NAMES[int(self.op[index])],
+            lhs_id=int(self.lhs_id[index]), rhs_id=int(self.rhs_id[index]) if binary else None,
+            result_id=int(self.result_id[index]),
+            lhs_fmt=self.formats[self.lhs_fmt[index]], rhs_fmt=self.formats[self.rhs_fmt[index]] if binary else None,
+            result_fmt=self.formats[self.result_fmt[index]],
+            lhs_raw=raw("lhs_raw"), rhs_raw=raw("rhs_raw") if binary else None, result_raw=raw("result_raw"),
+            param=None if param == NO_PARAM else param,
+            rounding=None if rounding == NO_ROUNDING else RoundingMode(rounding),
+            flags=int(self.flags[index]),
+        )
+
+    def ops(self, indices) -> list[TraceOp]:
+        return [self[int(i)] for i in indices]
+
+
+def first_difference(a: Trace, b: Trace) -> int | None:
+    """
+    Index of the first op at which two traces disagree on op type, formats or raw values, or
+    None if they match. Var ids are ignored, so traces of separate runs can be compared.
+    """
+    n = min(len(a), len(b))
+    differs = np.zeros(n, dtype=bool)
+    for name in ("op", "param", "rounding"):
+        differs |= getattr(a, name)[:n] != getattr(b, name)[:n]
+
+    # Format ids are per trace, so map a's ids to b's before comparing
+    fmt_map = np.full(NO_FMT + 1, -1, dtype=np.int64)
+    fmt_map[NO_FMT] = NO_FMT
+    for fmt_id, fmt in enumerate(a.formats):
+        if fmt in b.formats:
+            fmt_map[fmt_id] = b.formats.index(fmt)
+    for name in ("lhs_fmt", "rhs_fmt", "result_fmt"):
+        differs |= fmt_map[getattr(a, name)[:n]] != getattr(b, name)[:n]
+    for name in _RAW_COLUMNS:
+        differs |= a.raw(name)[:n] != b.raw(name)[:n]
+
+    index = np.flatnonzero(differs)
+    if index.size:
+        return int(index[0])
+    return None if len(a) == len(b) else n
@@ -0,0 +1,251 @@
+import os
+import re
+
+import numpy as np
+
+from .fix_point_array import FixedPointArray
+from .q_format import QFormat
+
+
+_LIMB_MASK = (1 << 64) - 1
+_DIGIT_BITS = {2: 1, 16: 4}
+_DIGIT_CHARS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+# ASCII code -> digit value, -1 for characters that are not hex digits
+_DIGIT_VALUES = np.full(256, -1, dtype=np.int16)
+_DIGIT_VALUES[_DIGIT_CHARS] = np.arange(16)
+_DIGIT_VALUES[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+
+
+def _n_limbs(width: int) -> int:
+    return -(-width // 64)
+
+
+def _digit_bits(radix: int) -> int:
+    if radix not in _DIGIT_BITS:
+        raise ValueError(f"Unsupported radix {radix}, expected 2 or 16")
+    return _DIGIT_BITS[radix]
+
+
+def to_words(arr: FixedPointArray) -> np.ndarray:
+    """
+    Two's complement words of an array's raw values, as held in a total_width-bit register.
+    Returns uint64 for formats up to 64 bits and Python ints otherwise.
+    """
+    width = arr.total_width
+    raw = arr.val_int
+    if raw.dtype == object:
+        return raw & ((1 << width) - 1)
+    words = raw.astype(np.uint64)
+    return words if width == 64 else words & np.uint64((1 << width) - 1)
+
+
+def from_words(words: np.ndarray, fmt: QFormat) -> FixedPointArray:
+    """ Sign-extend total_width-bit two's complement words into an array of the given format """
+    return FixedPointArray._create(_words_to_raw(np.asarray(words), fmt), fmt, site="from_words")
+
+
+def _words_to_raw(words: np.ndarray, fmt: QFormat) -> np.ndarray:
+    width = fmt.total_width
+    if width > 64:
+        words = words.astype(object)
+        return words - ((words >> (width - 1)) << width) if fmt.signed else words
+
+    words = words.astype(np.uint64)
+    if not fmt.signed:
+        return words
+    # Move the sign bit to bit 63 and shift back arithmetically
+    pad = np.uint64(64 - width)
+    return (words << pad).view(np.int64) >> np.int64(64 - width)
+
+
+def _to_limbs(arr: FixedPointArray) -> np.ndarray:
+    """ Flattened words split into little-endian 64-bit limbs, shape (n, n_limbs) """
+    words = to_words(arr).ravel()
+    if words.dtype != object:
+        return words.reshape(-1, 1)
+    limbs = [((words >> (64 * k)) & _LIMB_MASK).astype(np.uint64) for k in range(_n_limbs(arr.total_width))]
+    return np.stack(limbs, axis=1)
+
+
+def _from_limbs(limbs: np.ndarray, width: int) -> np.ndarray:
+    if limbs.shape[1] == 1:
+        return limbs[:, 0]
+    words = limbs[:, 0].astype(object)
+    for k in range(1, limbs.shape[1]):
+        words = words + (limbs[:, k].astype(object) << (64 * k))
+    return words
+
+
+def _to_bytes(arr: FixedPointArray) -> np.ndarray:
+    """ Flattened words as little-endian bytes, shape (n, ceil(total_width / 8)) """
+    n_bytes = -(-arr.total_width // 8)
+    return _to_limbs(arr).astype("<u8").view(np.uint8)[:, :n_bytes]
+
+
+def _from_bytes(data: np.ndarray, width: int) -> np.ndarray:
+    """ Words from little-endian bytes, shape (n, n_bytes), ignoring bits above width """
+    n_limbs = _n_limbs(width)
+    buffer = np.zeros((len(data), n_limbs * 8), dtype=np.uint8)
+    buffer[:, :data.shape[1]] = data
+    limbs = buffer.view("<u8").astype(np.uint64)
+
+    top = width - 64 * (n_limbs - 1)
+    if top < 64:
+        limbs[:, -1] &= np.uint64((1 << top) - 1)
+    return _from_limbs(limbs, width)
+
+
+def format_words(arr: FixedPointArray, radix: int = 2) -> bytes:
+    """
+    Format every value as a fixed-width binary (radix 2) or hex (radix 16) word, one per line.
+
+    Words are split into bits or nibbles for the whole array at once and rendered through a
+    lookup table, so no per-value string formatting is done.
+    """
+    bits = _digit_bits(radix)
+    n_digits = -(-arr.total_width // bits)
+    data = _to_bytes(arr)[:, ::-1]
+
+    if bits == 1:
+        digits = np.unpackbits(data, axis=1)
+    else:
+        digits = np.empty((len(data), 2 * data.shape[1]), dtype=np.uint8)
+        digits[:, 0::2] = data >> 4
+        digits[:, 1::2] = data & 0xF
+
+    chars = np.empty((len(data), n_digits + 1), dtype=np.uint8)
+    chars[:, :-1] = _DIGIT_CHARS[digits[:, digits.shape[1] - n_digits:]]
+    chars[:, -1] = ord("\n")
+    return chars.tobytes()
+
+
+def _strip_readmem(text: bytes) -> bytes:
+    """ Remove comments and digit separators allowed in $readmemb/$readmemh files """
+    if b"/" in text:
+        text = re.sub(rb"/\*.*?\*/", b" ", text, flags=re.S)
+        text = re.sub(rb"//[^\n]*", b"", text)
+    if b"@" in text:
+        raise ValueError("Address directives (@addr) are not supported")
+    return text.replace(b"_", b"")
+
+
+def _fixed_stride(text: bytes, n_digits: int) -> np.ndarray | None:
+    """ View text as a (n, n_digits) character matrix if it holds one full word per line, as written by format_words """
+    if not text or len(text) % (n_digits + 1):
+        return None
+    lines = np.frombuffer(text, dtype=np.uint8).reshape(-1, n_digits + 1)
+    if (lines[:, -1] != ord("\n")).any():
+        return None
+    return lines[:, :-1]
+
+
+def parse_words(text: bytes | str, fmt: QFormat, radix: int = 2) -> FixedPointArray:
+    """
+    Parse whitespace-separated binary (radix 2) or hex (radix 16) words into an array.
+
+    Words shorter than the format width are zero-extended on the left, as $readmem does.
+    Words with bits set beyond total_width, or with non-digit characters (including x/z),
+    raise ValueError.
+    """
+    bits = _digit_bits(radix)
+    width = fmt.total_width
+    n_digits = -(-width // bits)
+
+    if isinstance(text, str):
+        text = text.encode()
+    # Comments, separators and directives can line up with the stride, so only plain text takes the fast path
+    plain = b"/" not in text and b"_" not in text and b"@" not in text
+    chars = _fixed_stride(text, n_digits) if plain else None
+    if chars is None:
+        tokens = _strip_readmem(text).split()
+        if not tokens:
+            return FixedPointArray._create(np.zeros(0, dtype=np.int64), fmt)
+
+        lengths = set(map(len, tokens))
+        if lengths != {n_digits}:
+            if max(lengths) > n_digits:
+                raise ValueError(f"Words must have at most {n_digits} digits for {width} bits")
+            tokens = [t.rjust(n_digits, b"0") for t in tokens]
+        chars = np.frombuffer(b"".join(tokens), dtype=np.uint8).reshape(len(tokens), n_digits)
+
+    values = _DIGIT_VALUES[chars]
+    if (values < 0).any() or (values >= radix).any():
+        raise ValueError(f"Invalid digit for radix {radix}")
+
+    # Digits beyond total_width in the leading digit must be zero
+    spare = n_digits * bits - width
+    if spare and (values[:, 0] >> (bits - spare)).any():
+        raise ValueError(f"Word exceeds {width} bits")
+
+    # Left-pad to whole bytes and fold digits into big-endian bytes
+    n_bytes = -(-width // 8)
+    padded = np.zeros((len(chars), n_bytes * 8 // bits), dtype=np.uint8)
+    padded[:, padded.shape[1] - n_digits:] = values
+    if bits == 1:
+        data = np.packbits(padded, axis=1)
+    else:
+        data = (padded[:, 0::2] << 4) | padded[:, 1::2]
+
+    return from_words(_from_bytes(data[:, ::-1], width), fmt)
+
+
+def write_memb(arr: FixedPointArray, path: str | os.PathLike) -> None:
+    """ Write raw values as a $readmemb file, one binary word per line """
+    with open(path, "wb") as f:
+        f.write(format_words(arr, 2))
+
+
+def write_memh(arr: FixedPointArray, path: str | os.PathLike) -> None:
+    """ Write raw values as a $readmemh file, one hex word per line """
+    with open(path, "wb") as f:
+        f.write(format_words(arr, 16))
+
+
+def read_memb(path: str | os.PathLike, fmt: QFormat) -> FixedPointArray:
+    """ Read a $readmemb file into an array of the given format """
+    with open(path, "rb") as f:
+        return parse_words(f.read(), fmt, 2)
+
+
+def read_memh(path: str | os.PathLike, fmt: QFormat) -> FixedPointArray:
+    """ Read a $readmemh file into an array of the given format """
+    with open(path, "rb") as f:
+        return parse_words(f.read(), fmt, 16)
+
+
+def pack_words(arr: FixedPointArray, byteorder: str = "little") -> bytes:
+    """
+    Pack raw values into ceil(total_width / 8) bytes each, e.g. for $fread or a DMA buffer.
+    Unused high bits of each word are zero.
+    """
+    packed = _to_bytes(arr)
+    return (packed if byteorder == "little" else packed[:, ::-1]).tobytes()
+
+
+def unpack_words(data: bytes, fmt: QFormat, byteorder: str = "little") -> FixedPointArray:
+    """
+    Unpack ceil(total_width / 8)-byte words into an array of the given format.
+    Bits above total_width are ignored, so sign-extended padding reads back correctly.
+    """
+    width = fmt.total_width
+    n_bytes = -(-width // 8)
+    if len(data) % n_bytes:
+        raise ValueError(f"Data length {len(data)} is not a multiple of the {n_bytes}-byte word size")
+
+    packed = np.frombuffer(data, dtype=np.uint8).reshape(-1, n_bytes)
+    if byteorder != "little":
+        packed = packed[:, ::-1]
+    return from_words(_from_bytes(packed, width), fmt)
+
+
+def write_packed(arr: FixedPointArray, path: str | os.PathLike, byteorder: str = "little") -> None:
+    """ Write raw values as packed binary words, see pack_words """
+    with open(path, "wb") as f:
+        f.write(pack_words(arr, byteorder))
+
+
+def read_packed(path: str | os.PathLike, fmt: QFormat, byteorder: str = "little") -> FixedPointArray:
+    """ Read packed binary words, see unpack_words """
+    with open(path, "rb") as f:
+        return unpack_words(f.read(), fmt, byteorder)
@@ -0,0 +1,223 @@
+import numpy as np
+
+from .rounding import RoundingMode, shift_round as _shift_round_int
+
+
+# 128-bit two's complement integers as a pair of 64-bit limbs, value = hi * 2⁶⁴ + lo
+INT128 = np.dtype([("lo", np.uint64), ("hi", np.int64)])
+
+_M64 = (1 << 64) - 1
+_M32 = np.uint64((1 << 32) - 1)
+_U32 = np.uint64(32)
+
+
+def fits(width: int, signed: bool) -> bool:
+    """ Whether every value of a format of the given width fits in INT128 """
+    return width <= (128 if signed else 127)
+
+
+def _pack(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    out = np.empty(np.broadcast(lo, hi).shape, dtype=INT128)
+    out["lo"] = lo
+    out["hi"] = hi
+    return out
+
+
+def const(value: int) -> np.ndarray:
+    """ 0-d INT128 array holding a Python int in [-2¹²⁷, 2¹²⁷) """
+    return _pack(np.uint64(value & _M64), np.int64(value >> 64))
+
+
+def from_int(raw: np.ndarray) -> np.ndarray:
+    """ Convert integer (native or Python int object) arrays to INT128 """
+    raw = np.asarray(raw)
+    if raw.dtype == INT128:
+        return raw
+    if raw.dtype == np.uint64:
+        return _pack(raw, np.zeros(raw.shape, dtype=np.int64))
+    if raw.dtype.kind in "iub":
+        raw = raw.astype(np.int64, copy=False)
+        return _pack(raw.astype(np.uint64), raw >> np.int64(63))
+    if raw.dtype == object:
+        lo, hi = np.asarray(raw & _M64, dtype=object), np.asarray(raw >> 64, dtype=object)
+        return _pack(lo.astype(np.uint64), hi.astype(np.int64))
+    raise TypeError(f"Cannot convert {raw.dtype} to INT128")
+
+
+def from_float(scaled: np.ndarray) -> np.ndarray:
+    """
+    Convert integral floats with magnitude below 2¹²⁷ to INT128 exactly.
+    Values of 2⁶³ or more are multiples of 2¹¹, so their low limb splits off without rounding.
+    """
+    small = np.abs(scaled) < 2.0 ** 63
+    native = np.where(small, scaled, 0).astype(np.int64)
+
+    hi = np.floor(np.where(small, 0, scaled) / 2.0 ** 64)
+    lo = np.where(small, 0, scaled) - hi * 2.0 ** 64
+    out = _pack(lo.astype(np.uint64), hi.astype(np.int64))
+    out[small] = from_int(native[small])
+    return out
+
+
+def to_object(w: np.ndarray) -> np.ndarray:
+    """ Python int object array of INT128 values """
+    out = np.empty(w.shape, dtype=object)
+    out[...] = (w["hi"].astype(object) << 64) + w["lo"].astype(object)
+    return out
+
+
+def to_int(item) -> int:
+    """ Python int of a single INT128 element """
+    return (int(item["hi"]) << 64) + int(item["lo"])
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """ Bit length of non-zero uint64 values """
+    e = np.minimum(np.frexp(x.astype(np.float64))[1], 64).astype(np.uint64)
+    # Conversion to float may round up to the next power of two
+    return np.where((x >> (e - np.uint64(1))) == 0, e - np.uint64(1), e)
+
+
+def to_float(w: np.ndarray) -> np.ndarray:
+    """
+    Correctly rounded float64 of INT128 values, matching float(int).
+    Magnitudes are normalized to 64 significant bits with a sticky bit so the final
+    uint64-to-float conversion rounds exactly once.
+    """
+    negative = w["hi"] < 0
+    mag = np.where(negative, neg(w), w)
+    mh, ml = mag["hi"].astype(np.uint64), mag["lo"]
+
+    wide = mh != 0
+    s = _bit_length(np.where(wide, mh, np.uint64(1)))
+    top = (mh << (np.uint64(64) - s)) | ((ml >> (s - np.uint64(1))) >> np.uint64(1))
+    sticky = (ml & (np.uint64(_M64) >> (np.uint64(64) - s))) != 0
+    big = np.ldexp((top | sticky).astype(np.float64), s.astype(np.int64))
+
+    out = np.where(wide, big, ml.astype(np.float64))
+    return np.where(negative, -out, out)
+
+
+def add(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    with np.errstate(over="ignore"):
+        lo = a["lo"] + b["lo"]
+        carry = (lo < a["lo"]).astype(np.int64)
+        return _pack(lo, a["hi"] + b["hi"] + carry)
+
+
+def sub(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    with np.errstate(over="ignore"):
+        borrow = (a["lo"] < b["lo"]).astype(np.int64)
+        return _pack(a["lo"] - b["lo"], a["hi"] - b["hi"] - borrow)
+
+
+def neg(a: np.ndarray) -> np.ndarray:
+    return sub(np.zeros(a.shape, dtype=INT128), a)
+
+
+def _mul64(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """ Full 128-bit product of uint64 values as (lo, hi) limbs, from 32-bit partial products """
+    x0, x1 = x & _M32, x >> _U32
+    y0, y1 = y & _M32, y >> _U32
+    p00, p01, p10, p11 = x0 * y0, x0 * y1, x1 * y0, x1 * y1
+
+    mid = (p00 >> _U32) + (p01 & _M32) + (p10 & _M32)
+    lo = (p00 & _M32) | (mid << _U32)
+    hi = p11 + (p01 >> _U32) + (p10 >> _U32) + (mid >> _U32)
+    return lo, hi
+
+
+def mul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ Product modulo 2¹²⁸, exact whenever the result fits INT128 """
+    with np.errstate(over="ignore"):
+        a_hi, b_hi = a["hi"].astype(np.uint64), b["hi"].astype(np.uint64)
+        lo, hi = _mul64(a["lo"], b["lo"])
+        hi = hi + a["lo"] * b_hi + a_hi * b["lo"]
+        return _pack(lo, hi.astype(np.int64))
+
+
+def lshift(a: np.ndarray, n: int) -> np.ndarray:
+    """ Left shift modulo 2¹²⁸ """
+    if n == 0:
+        return a.copy()
+    if n >= 128:
+        return np.zeros(a.shape, dtype=INT128)
+
+    lo, hi = a["lo"], a["hi"].astype(np.uint64)
+    if n >= 64:
+        return _pack(np.zeros(a.shape, dtype=np.uint64), (lo << np.uint64(n - 64)).astype(np.int64))
+    hi = (hi << np.uint64(n)) | (lo >> np.uint64(64 - n))
+    return _pack(lo << np.uint64(n), hi.astype(np.int64))
+
+
+def rshift(a: np.ndarray, n: int) -> np.ndarray:
+    """ Arithmetic (sign-preserving) right shift """
+    if n == 0:
+        return a.copy()
+
+    lo, hi = a["lo"], a["hi"]
+    sign = hi >> np.int64(63)
+    if n >= 128:
+        return _pack(sign.astype(np.uint64), sign)
+    if n >= 64:
+        return _pack((hi >> np.int64(n - 64)).astype(np.uint64), sign)
+    lo = (lo >> np.uint64(n)) | (hi.astype(np.uint64) << np.uint64(64 - n))
+    return _pack(lo, hi >> np.int64(n))
+
+
+def low_bits(a: np.ndarray, n: int) -> np.ndarray:
+    """ a mod 2ⁿ for 0 < n <= 127, i.e. the n least significant bits as a non-negative value """
+    if n <= 64:
+        return _pack(a["lo"] & np.uint64((1 << n) - 1), np.zeros(a.shape, dtype=np.int64))
+    return _pack(a["lo"], a["hi"] & np.int64((1 << (n - 64)) - 1))
+
+
+def less(a: np.ndarray, b: np.ndarray | int) -> np.ndarray:
+    b = const(b) if isinstance(b, int) else b
+    return (a["hi"] < b["hi"]) | ((a["hi"] == b["hi"]) & (a["lo"] < b["lo"]))
+
+
+def greater(a: np.ndarray, b: np.ndarray | int) -> np.ndarray:
+    b = const(b) if isinstance(b, int) else b
+    return (a["hi"] > b["hi"]) | ((a["hi"] == b["hi"]) & (a["lo"] > b["lo"]))
+
+
+def equal(a: np.ndarray, b: np.ndarray | int) -> np.ndarray:
+    b = const(b) if isinstance(b, int) else b
+    return (a["hi"] == b["hi"]) & (a["lo"] == b["lo"])
+
+
+def wrap(a: np.ndarray, width: int, signed: bool) -> np.ndarray:
+    """ Two's complement wrap into a width-bit format """
+    if not signed:
+        return low_bits(a, width)
+    return rshift(lshift(a, 128 - width), 128 - width)
+
+
+def shift_round(a: np.ndarray, n: int, rounding: RoundingMode = RoundingMode.FLOOR) -> np.ndarray:
+    """ INT128 counterpart of rounding.shift_round """
+    if n <= 0:
+        return lshift(a, -n)
+    if n >= 128:
+        return from_int(_shift_round_int(to_object(a), n, rounding))
+
+    quotient = rshift(a, n)
+    if rounding is RoundingMode.FLOOR:
+        return quotient
+
+    remainder = low_bits(a, n)
+    half = 1 << (n - 1)
+
+    match rounding:
+        case RoundingMode.CEIL:
+            carry = ~equal(remainder, 0)
+        case RoundingMode.HALF_UP:
+            carry = ~less(remainder, half)
+        case RoundingMode.CONVERGENT:
+            carry = greater(remainder, half) | (equal(remainder, half) & ((quotient["lo"] & np.uint64(1)) == 1))
+        case RoundingMode.TRUNCATE:
+            carry = (a["hi"] < 0) & ~equal(remainder, 0)
+        case _:
+            raise ValueError(f"Unsupported rounding mode {rounding}")
+
+    return add(quotient, _pack(carry.astype(np.uint64), np.zeros(carry.shape, dtype=np.int64)))
@@ -0,0 +1,63 @@
+"""
+Benchmark FixedPoint construction cost.
+
+Compares constructing values with lazy float/binary representations against the previous
+eager behaviour, emulated by reading val_float and val_bin straight after construction.
+
+    python -m benchmarks.bench_construction
+"""
+import timeit
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.registry import Registry
+
+
+N = 100_000
+
+
+def construct_lazy() -> None:
+    FixedPoint(1.2345, 7, 16, True)
+
+
+def construct_eager() -> None:
+    fxp = FixedPoint(1.2345, 7, 16, True)
+    fxp.val_float
+    fxp.val_bin
+
+
+def chain_lazy(a: FixedPoint, b: FixedPoint) -> None:
+    (a * b) + (a * b)
+
+
+def chain_eager(a: FixedPoint, b: FixedPoint) -> None:
+    p0 = a * b
+    p1 = a * b
+    for fxp in (p0, p1, p0 + p1):
+        fxp.val_float
+        fxp.val_bin
+
+
+def bench(label: str, fn, *args) -> float:
+    """ Run fn N times (best of 5) and report the mean cost per call in ns """
+    per_call = min(timeit.repeat(lambda: fn(*args), number=N, repeat=5)) / N * 1e9
+    Registry.var_registry.clear()
+    Registry.op_registry.clear()
+    print(f"{label:<32} {per_call:10.1f} ns")
+    return per_call
+
+
+def main() -> None:
+    a = FixedPoint(0.75, 3, 12, True)
+    b = FixedPoint(-1.25, 3, 12, True)
+
+    eager = bench("construct (eager repr)", construct_eager)
+    lazy = bench("construct (lazy repr)", construct_lazy)
+    print(f"{'speedup':<32} {eager / lazy:10.2f} x")
+
+    eager = bench("a*b + a*b (eager repr)", chain_eager, a, b)
+    lazy = bench("a*b + a*b (lazy repr)", chain_lazy, a, b)
+    print(f"{'speedup':<32} {eager / lazy:10.2f} x")
+
+
+if __name__ == "__main__":
+    main()
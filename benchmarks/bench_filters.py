@@ -0,0 +1,50 @@
+"""
+Benchmark filter engine throughput in simulated samples per second.
+
+    python -m benchmarks.bench_filters
+"""
+import time
+
+import numpy as np
+
+from PyFxP.filters import FIRFilter, IIRFilter, Quantizer
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.q_format import QFormat
+from PyFxP.registry import Registry, RegistryMode
+from PyFxP.rounding import RoundingMode
+
+
+BLOCK = 65_536
+
+
+def throughput(label: str, flt, x: FixedPointArray) -> float:
+    """ Stream x through flt in blocks and report samples per second """
+    start = time.perf_counter()
+    for i in range(0, len(x), BLOCK):
+        flt.process(x[i:i + BLOCK])
+    rate = len(x) / (time.perf_counter() - start)
+    print(f"{label:<28} {rate:14,.0f} samples/s")
+    return rate
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    sample_fmt = QFormat(0, 15, True)
+    output = Quantizer(sample_fmt, RoundingMode.CONVERGENT, OverflowMode.SATURATE)
+
+    fir = FIRFilter(rng.uniform(-0.5, 0.5, 32), sample_fmt, coeff_fmt=QFormat(0, 15, True),
+                    product=Quantizer(QFormat(1, 20, True), RoundingMode.CONVERGENT),
+                    accumulator=Quantizer(QFormat(6, 20, True)), output=output)
+    biquad = IIRFilter([0.2, 0.4, 0.2], [-0.5, 0.25], sample_fmt, output, coeff_fmt=QFormat(1, 14, True),
+                       product=Quantizer(QFormat(3, 29, True)), accumulator=Quantizer(QFormat(3, 29, True)))
+
+    x = FixedPointArray(rng.uniform(-0.5, 0.5, 1_000_000), 0, 15, True)
+
+    with Registry.configure(RegistryMode.OFF), overflow_policy(OverflowMode.SATURATE):
+        throughput("FIR, 32 taps", fir, x)
+        throughput("IIR biquad", biquad, x[:100_000])
+
+
+if __name__ == "__main__":
+    main()
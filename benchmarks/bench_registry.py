@@ -0,0 +1,62 @@
+"""
+Benchmark per-op overhead of each Registry mode.
+
+Times a multiply-add (two FixedPoint ops, three constructions) under every RegistryMode and
+reports the cost relative to OFF. A single multiply is then timed under OFF, COUNT and FULL,
+the modes a long simulation usually chooses between.
+
+    python -m benchmarks.bench_registry
+"""
+import timeit
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.registry import Registry, RegistryMode
+
+
+N = 50_000
+
+
+def mul_add(a: FixedPoint, b: FixedPoint, c: FixedPoint) -> None:
+    a * b + c
+
+
+def per_call(fn) -> float:
+    """ Best mean cost of fn in ns over 5 repeats of N calls """
+    return min(timeit.repeat(fn, number=N, repeat=5)) / N * 1e9
+
+
+def main() -> None:
+    a = FixedPoint(0.75, 3, 12, True)
+    b = FixedPoint(-1.25, 3, 12, True)
+    c = FixedPoint(0.5, 7, 24, True)
+
+    modes = [
+        ("OFF", dict(mode=RegistryMode.OFF)),
+        ("COUNT", dict(mode=RegistryMode.COUNT)),
+        ("SAMPLED (1/100)", dict(mode=RegistryMode.SAMPLED, sample_every=100)),
+        ("RING (1024)", dict(mode=RegistryMode.RING, capacity=1024)),
+        ("FULL", dict(mode=RegistryMode.FULL)),
+    ]
+
+    baseline = None
+    for label, config in modes:
+        with Registry.configure(**config):
+            cost = per_call(lambda: mul_add(a, b, c))
+        baseline = cost if baseline is None else baseline
+        # Each op also constructs (and logs) its result var
+        print(f"{label:<20} {cost:10.1f} ns/mul-add   +{(cost - baseline) / 2:8.1f} ns/op vs OFF")
+    print()
+
+    costs = {}
+    for mode in (RegistryMode.OFF, RegistryMode.COUNT, RegistryMode.FULL):
+        with Registry.configure(mode):
+            costs[mode] = per_call(lambda: a * b)
+        label = f"a * b ({mode.name})"
+        print(f"{label:<20} {costs[mode]:10.1f} ns")
+    off = costs[RegistryMode.OFF]
+    count, full = costs[RegistryMode.COUNT] - off, costs[RegistryMode.FULL] - off
+    print(f"{'COUNT overhead':<20} {count:10.1f} ns   {100 * count / full:6.1f} % of FULL's")
+
+
+if __name__ == "__main__":
+    main()
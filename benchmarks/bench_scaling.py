@@ -0,0 +1,48 @@
+"""
+Benchmark bsl_scale/bsr_scale.
+
+Compares the integer-only scaling against the previous float round-trip, reproduced here as
+FixedPoint(val_float * 2ⁿ, ...), for scalars and for a FixedPointArray.
+
+    python -m benchmarks.bench_scaling
+"""
+import timeit
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.registry import Registry, RegistryMode
+
+
+N = 50_000
+SIZE = 1_000_000
+
+
+def float_bsr_scale(fxp: FixedPoint, n: int) -> FixedPoint:
+    """ bsr_scale as implemented before the integer-only path """
+    return FixedPoint(fxp.val_float / (2 ** n), fxp.int_width, fxp.fract_width, fxp.signed)
+
+
+def bench(label: str, fn, number: int) -> float:
+    """ Report the best-of-5 mean cost per call in ns """
+    per_call = min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+    print(f"{label:<32} {per_call:14.1f} ns")
+    return per_call
+
+
+def main() -> None:
+    a = FixedPoint(0.8125, 3, 12, True)
+    arr = FixedPointArray(np.random.default_rng(0).uniform(-1, 1, SIZE), 3, 12, True)
+
+    with Registry.configure(RegistryMode.OFF):
+        before = bench("scalar bsr_scale (float)", lambda: float_bsr_scale(a, 3), N)
+        after = bench("scalar bsr_scale (int)", lambda: a.bsr_scale(3), N)
+        print(f"{'speedup':<32} {before / after:14.2f} x")
+
+        per_array = bench(f"array bsr_scale ({SIZE:,} values)", lambda: arr.bsr_scale(3), 1)
+        print(f"{'per value':<32} {per_array / SIZE:14.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark process startup and per-construction cost for short-lived workers.
+
+Startup is the wall time of fresh interpreters, comparing a bare interpreter, `import PyFxP`
+(scalar types only, NumPy not loaded) and first use of FixedPointArray, which loads NumPy lazily.
+Construction compares FixedPoint(float), FixedPoint(int), _create and from_raw, with the
+default registry and with recording switched off.
+
+    python -m benchmarks.bench_startup
+"""
+import subprocess
+import sys
+import time
+import timeit
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.q_format import QFormat
+from PyFxP.registry import Registry, RegistryMode
+
+
+RUNS = 10
+N = 100_000
+
+STARTUP = [
+    ("python (no import)", "pass"),
+    ("import PyFxP", "import PyFxP"),
+    ("import PyFxP + FixedPointArray", "import PyFxP; PyFxP.FixedPointArray"),
+]
+
+
+def startup(code: str) -> float:
+    """ Best wall time of RUNS fresh interpreters running code, including interpreter startup, in ms """
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def bench(label: str, fn) -> float:
+    """ Run fn N times (best of 5) and report the mean cost per call in ns """
+    per_call = min(timeit.repeat(fn, number=N, repeat=5)) / N * 1e9
+    print(f"{label:<40} {per_call:10.1f} ns")
+    return per_call
+
+
+def main() -> None:
+    for label, code in STARTUP:
+        print(f"{label:<40} {startup(code):10.1f} ms")
+    print()
+
+    fmt = QFormat(7, 16, True)
+    cases = [
+        ("FixedPoint(float, ...)", lambda: FixedPoint(1.2345, 7, 16, True)),
+        ("FixedPoint(int, ...)", lambda: FixedPoint(12345, 7, 16, True)),
+        ("FixedPoint._create", lambda: FixedPoint._create(12345, fmt)),
+        ("FixedPoint.from_raw", lambda: FixedPoint.from_raw(12345, fmt)),
+    ]
+    for registry_label, mode in (("registry FULL", RegistryMode.FULL), ("registry OFF", RegistryMode.OFF)):
+        with Registry.configure(mode):
+            baseline = None
+            for label, fn in cases:
+                per_call = bench(f"{label} ({registry_label})", fn)
+                baseline = baseline or per_call
+            print(f"{'from_raw speedup':<40} {baseline / per_call:10.2f} x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
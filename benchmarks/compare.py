@@ -0,0 +1,73 @@
+"""
+Compare two benchmark suite result files and flag regressions.
+
+A case regresses when its best time grows by more than the threshold relative to the baseline.
+Exits with status 1 if any case regressed, so it can gate CI.
+
+    python -m benchmarks.compare baseline.json current.json --threshold 0.10
+"""
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict[str, float]:
+    """ Best time per case from a benchmarks.suite JSON file """
+    with open(path) as f:
+        return {name: result["best"] for name, result in json.load(f)["results"].items()}
+
+
+def compare(baseline: dict[str, float], current: dict[str, float], threshold: float = 0.10) -> list[tuple[str, float, float, str]]:
+    """
+    Rows of (case, baseline, current, status) for every case in either run.
+    Status is "regressed", "improved", "ok", "new" or "missing".
+    """
+    rows = []
+    for name in list(baseline) + [name for name in current if name not in baseline]:
+        before, after = baseline.get(name), current.get(name)
+        if before is None:
+            status = "new"
+        elif after is None:
+            status = "missing"
+        elif after > before * (1 + threshold):
+            status = "regressed"
+        elif after < before / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append((name, before, after, status))
+    return rows
+
+
+def _ns(t: float | None) -> str:
+    """ Time in seconds rendered in ns, or "-" for a case absent from one run """
+    return "-" if t is None else f"{t * 1e9:.1f}"
+
+
+def report(rows: list[tuple[str, float, float, str]]) -> str:
+    """ Table of per-case times in ns and the change vs baseline """
+    lines = [f"{'case':<32} {'baseline':>14} {'current':>14} {'change':>8}  status"]
+    for name, before, after, status in rows:
+        change = f"{(after / before - 1) * 100:+.1f}%" if before and after else "-"
+        lines.append(f"{name:<32} {_ns(before):>14} {_ns(after):>14} {change:>8}  {status}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline", help="Saved baseline JSON from benchmarks.suite")
+    parser.add_argument("current", help="JSON of the run to check")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown, e.g. 0.10 for 10%%")
+    args = parser.parse_args()
+
+    rows = compare(load(args.baseline), load(args.current), args.threshold)
+    print(report(rows))
+
+    regressed = [name for name, _, _, status in rows if status == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s) above {args.threshold:.0%}: {', '.join(regressed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
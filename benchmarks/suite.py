@@ -0,0 +1,251 @@
+"""
+Benchmark suite with JSON output for regression tracking.
+
+Times scalar FixedPoint ops, chained expressions, registry modes and bulk conversions, and
+writes the best-of-repeat cost per call of every case to a JSON file. Compare two result files
+with benchmarks.compare.
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --output current.json --filter scalar
+    python -m benchmarks.compare baseline.json current.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Callable
+
+import numpy as np
+
+from PyFxP.constants import const
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.q_format import QFormat
+from PyFxP.registry import Registry, RegistryMode
+from PyFxP.rounding import RoundingMode
+from PyFxP.vectors import format_words
+
+
+SIZE = 100_000
+
+# name -> (setup returning the timed callable, calls per timing)
+Case = tuple[Callable[[], Callable[[], object]], int]
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, number: int):
+    """ Register a setup function whose return value is the callable to time """
+    def register(setup):
+        CASES[name] = (setup, number)
+        return setup
+    return register
+
+
+def _operands() -> tuple[FixedPoint, FixedPoint, FixedPoint]:
+    return FixedPoint(0.75, 3, 12, True), FixedPoint(-1.25, 3, 12, True), FixedPoint(0.5, 7, 24, True)
+
+
+@case("scalar.construct_float", 20_000)
+def _():
+    return lambda: FixedPoint(1.2345, 7, 16, True)
+
+
+@case("scalar.construct_int", 20_000)
+def _():
+    return lambda: FixedPoint(12345, 7, 16, True)
+
+
+@case("scalar.construct_bin", 20_000)
+def _():
+    return lambda: FixedPoint("0000001001101011", 7, 8, True)
+
+
+@case("scalar.from_raw", 20_000)
+def _():
+    fmt = QFormat(7, 16, True)
+    return lambda: FixedPoint.from_raw(12345, fmt)
+
+
+@case("scalar.const_cached", 20_000)
+def _():
+    const(0.7071, 1, 15, True)
+    return lambda: const(0.7071, 1, 15, True)
+
+
+@case("scalar.add", 20_000)
+def _():
+    a, b, _c = _operands()
+    return lambda: a + b
+
+
+@case("scalar.sub", 20_000)
+def _():
+    a, b, _c = _operands()
+    return lambda: a - b
+
+
+@case("scalar.mul", 20_000)
+def _():
+    a, b, _c = _operands()
+    return lambda: a * b
+
+
+@case("scalar.lshift", 20_000)
+def _():
+    a, _b, _c = _operands()
+    return lambda: a << 2
+
+
+@case("scalar.rshift", 20_000)
+def _():
+    a, _b, _c = _operands()
+    return lambda: a >> 2
+
+
+@case("scalar.resize", 20_000)
+def _():
+    a, _b, _c = _operands()
+    return lambda: a.resize(3, 6, True, RoundingMode.CONVERGENT)
+
+
+@case("scalar.bsr_scale", 20_000)
+def _():
+    a, _b, _c = _operands()
+    return lambda: a.bsr_scale(3)
+
+
+@case("scalar.val_float", 20_000)
+def _():
+    # A fresh value each call so the lazily computed representation is not cached
+    return lambda: FixedPoint(12345, 7, 16, True).val_float
+
+
+@case("scalar.val_bin", 20_000)
+def _():
+    return lambda: FixedPoint(12345, 7, 16, True).val_bin
+
+
+@case("chain.mul_add", 10_000)
+def _():
+    a, b, c = _operands()
+    return lambda: a * b + c
+
+
+@case("chain.horner4", 5_000)
+def _():
+    # 4th order polynomial in Horner form, the format grows with every step
+    x, *_ = _operands()
+    coeffs = [FixedPoint(v, 1, 12, True) for v in (0.125, -0.25, 0.5, 0.75, -1.0)]
+
+    def horner():
+        acc = coeffs[0]
+        for c in coeffs[1:]:
+            acc = (acc * x).resize(acc.int_width + 4, 12) + c
+        return acc
+    return horner
+
+
+def _registry_case(mode: RegistryMode, **config):
+    def setup():
+        a, b, c = _operands()
+
+        def run():
+            with Registry.configure(mode, **config):
+                for _ in range(100):
+                    a * b + c
+        return run
+    return setup
+
+
+case("registry.off", 100)(_registry_case(RegistryMode.OFF))
+case("registry.count", 100)(_registry_case(RegistryMode.COUNT))
+case("registry.sampled", 100)(_registry_case(RegistryMode.SAMPLED, sample_every=100))
+case("registry.ring", 100)(_registry_case(RegistryMode.RING, capacity=1024))
+case("registry.full", 100)(_registry_case(RegistryMode.FULL))
+
+
+def _bulk_floats() -> np.ndarray:
+    return np.random.default_rng(0).uniform(-1, 1, SIZE)
+
+
+@case("bulk.array_from_float", 10)
+def _():
+    x = _bulk_floats()
+    return lambda: FixedPointArray(x, 3, 12, True)
+
+
+@case("bulk.array_val_float", 10)
+def _():
+    arr = FixedPointArray(_bulk_floats(), 3, 12, True)
+    return lambda: arr.val_float
+
+
+@case("bulk.array_to_fixed_points", 1)
+def _():
+    arr = FixedPointArray(_bulk_floats(), 3, 12, True)
+    return arr.to_fixed_points
+
+
+@case("bulk.array_from_fixed_points", 1)
+def _():
+    values = FixedPointArray(_bulk_floats(), 3, 12, True).to_fixed_points()
+    return lambda: FixedPointArray.from_fixed_points(values)
+
+
+@case("bulk.scalar_val_bin", 1)
+def _():
+    values = FixedPointArray(_bulk_floats(), 3, 12, True).to_fixed_points()
+    return lambda: [FixedPoint(v.val_int, 3, 12, True).val_bin for v in values]
+
+
+@case("bulk.format_words_bin", 10)
+def _():
+    arr = FixedPointArray(_bulk_floats(), 3, 12, True)
+    return lambda: format_words(arr, 2)
+
+
+def run_case(name: str, repeat: int = 5) -> dict:
+    """ Time one case and return its best and median cost per call in seconds """
+    setup, number = CASES[name]
+    fn = setup()
+    with Registry.configure(RegistryMode.OFF):
+        # Warm caches (interned formats, lazily built tables) outside the timed region
+        fn()
+        times = [t / number for t in timeit.repeat(fn, number=number, repeat=repeat)]
+    return {"best": min(times), "median": float(np.median(times)), "number": number, "repeat": repeat}
+
+
+def run_suite(pattern: str | None = None, repeat: int = 5) -> dict:
+    """ Run every case whose name contains pattern and return the JSON-ready results """
+    names = [name for name in CASES if pattern is None or pattern in name]
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": {name: run_case(name, repeat) for name in names},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", "-o", help="Write JSON results to this file")
+    parser.add_argument("--filter", "-k", dest="pattern", help="Only run cases whose name contains this string")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats per case, the best is kept")
+    args = parser.parse_args()
+
+    suite = run_suite(args.pattern, args.repeat)
+    for name, result in suite["results"].items():
+        print(f"{name:<32} {result['best'] * 1e9:14.1f} ns")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(suite, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
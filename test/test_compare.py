@@ -0,0 +1,45 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.compare import compare, load, report
+
+
+class TestCompare(unittest.TestCase):
+
+    def setUp(self):
+        self.baseline = {"add": 100e-9, "mul": 200e-9, "shift": 50e-9, "resize": 80e-9, "dropped": 10e-9}
+        self.current = {"add": 115e-9, "mul": 150e-9, "shift": 54e-9, "resize": 88e-9, "added": 30e-9}
+
+    def test_classification(self):
+        rows = compare(self.baseline, self.current, threshold=0.10)
+        status = {name: s for name, _, _, s in rows}
+        self.assertEqual(status, {"add": "regressed", "mul": "improved", "shift": "ok", "resize": "ok",
+                                  "dropped": "missing", "added": "new"})
+        # Baseline order first, then cases only in the current run
+        self.assertEqual([name for name, *_ in rows], ["add", "mul", "shift", "resize", "dropped", "added"])
+        self.assertEqual(rows[0], ("add", 100e-9, 115e-9, "regressed"))
+
+    def test_threshold(self):
+        # A 15% slowdown regresses at 10% but not at 20%, and a 10% change sits on the boundary
+        self.assertEqual(compare({"add": 1.0}, {"add": 1.15}, threshold=0.10)[0][3], "regressed")
+        self.assertEqual(compare({"add": 1.0}, {"add": 1.15}, threshold=0.20)[0][3], "ok")
+        self.assertEqual(compare({"add": 1.0}, {"add": 1.1}, threshold=0.10)[0][3], "ok")
+        self.assertEqual(compare({"add": 1.1}, {"add": 1.0}, threshold=0.10)[0][3], "ok")
+        self.assertEqual(compare({"add": 1.0}, {"add": 0.8}, threshold=0.20)[0][3], "improved")
+
+    def test_report_and_load(self):
+        text = report(compare(self.baseline, self.current))
+        self.assertIn("+15.0%", text)
+        self.assertRegex(text, r"dropped\s+10\.0\s+-\s+-\s+missing")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "run.json")
+            with open(path, "w") as f:
+                json.dump({"results": {"add": {"best": 1e-7, "mean": 2e-7}}}, f)
+            self.assertEqual(load(path), {"add": 1e-7})
+
+
+if __name__ == "__main__":
+    unittest.main()
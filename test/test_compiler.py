@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+
+from PyFxP.compiler import compile_kernel
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.overflow import overflow_policy
+from PyFxP.q_format import QFormat
+from PyFxP.registry import OppType, Registry, RegistryMode
+from PyFxP.rounding import RoundingMode
+
+
+GAIN = FixedPoint(0.375, 1, 6, True)
+HALF = FixedPoint(0.5, 1, 6, True)
+
+
+def model(x, y):
+    acc = x * (GAIN * HALF) + y * (HALF * HALF)
+    acc = (acc >> 1).resize(3, 8, rounding=RoundingMode.CONVERGENT)
+    diff = x.bsr_scale(2) - y.bsl_scale(1)
+    return acc * diff, (x << 2) - diff
+
+
+class TestCompiler(unittest.TestCase):
+
+    def setUp(self):
+        self.fmt = QFormat(2, 7, True)
+        rng = np.random.default_rng(7)
+        self.xs = rng.uniform(-1, 1, 300)
+        self.ys = rng.uniform(-2, 2, 300)
+
+    def test_matches_scalar_model(self):
+        kernel = compile_kernel(model, self.fmt, self.fmt)
+        # bsl_scale saturates a few samples on both paths
+        with overflow_policy():
+            out_a, out_b = kernel(self.xs, self.ys)
+            expected = [model(FixedPoint(x, 2, 7, True), FixedPoint(y, 2, 7, True)) for x, y in zip(self.xs, self.ys)]
+
+        for i, (exp_a, exp_b) in enumerate(expected):
+            self.assertIs(out_a.fmt, exp_a.fmt)
+            self.assertIs(out_b.fmt, exp_b.fmt)
+            self.assertEqual(int(out_a.val_int[i]), exp_a.val_int)
+            self.assertEqual(int(out_b.val_int[i]), exp_b.val_int)
+
+    def test_constants_folded(self):
+        kernel = compile_kernel(model, self.fmt, self.fmt)
+        # GAIN * HALF and HALF * HALF do not depend on the inputs
+        self.assertEqual(sum(step[0] is OppType.__MUL__ for step in kernel.steps), 3)
+
+    def test_dead_ops_dropped(self):
+        def fn(x):
+            x * x
+            return x + x
+
+        kernel = compile_kernel(fn, self.fmt)
+        self.assertEqual([step[0] for step in kernel.steps], [OppType.__ADD__])
+
+    def test_single_output_and_wide_formats(self):
+        def cube(x):
+            return (x * x * x).resize(10, 30, rounding=RoundingMode.HALF_UP)
+
+        kernel = compile_kernel(cube, FixedPoint(1.0, 3, 20, True))
+        out = kernel(self.xs)
+        self.assertIsInstance(out, FixedPointArray)
+        self.assertEqual(out.val_int.tolist(), [cube(FixedPoint(x, 3, 20, True)).val_int for x in self.xs])
+
+    def test_input_format_checked(self):
+        kernel = compile_kernel(model, self.fmt, self.fmt)
+        wrong = FixedPointArray(self.xs, 3, 7, True)
+        with self.assertRaises(ValueError):
+            kernel(wrong, self.ys)
+        with self.assertRaises(TypeError):
+            kernel(self.xs)
+
+    def test_trace_does_not_touch_active_registry(self):
+        with Registry.configure(RegistryMode.COUNT) as scope:
+            compile_kernel(model, self.fmt, self.fmt)
+            self.assertEqual(scope.op_count, 0)
+
+    def test_unary_ops_logged(self):
+        with Registry.configure(RegistryMode.FULL) as scope:
+            x = FixedPoint(1.5, 3, 4, True)
+            (x << 1).resize(4, 2).bsr_scale(1)
+        self.assertEqual([op.opp_type for op in scope.op_registry],
+                         [OppType.__LSHIFT__, OppType.__RESIZE__, OppType.__BSR_SCALE__])
+        self.assertEqual(scope.op_registry[0].params, (1,))
+        self.assertIsNone(scope.op_registry[0].rhs)
+
+
+if __name__ == "__main__":
+    unittest.main()
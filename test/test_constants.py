@@ -0,0 +1,83 @@
+import pickle
+import unittest
+import warnings
+
+from PyFxP.constants import Constant, QuantCache, const, quantize
+from PyFxP.fix_point import FixedPoint
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.q_format import QFormat
+from PyFxP.registry import Registry, RegistryMode
+from PyFxP.rounding import RoundingMode
+
+
+class TestConstants(unittest.TestCase):
+
+    def test_quantize_matches_constructor(self):
+        for value in (0.7071, -0.7071, 0.5, 1.5, 2.5, -2.5, 1e-9, 123.456):
+            fmt = QFormat(7, 15, True)
+            self.assertEqual(quantize(value, fmt), FixedPoint(value, 7, 15, True).val_int)
+
+    def test_quantize_rounding_is_exact(self):
+        fmt = QFormat(3, 0, True)
+        self.assertEqual([quantize(2.5, fmt, mode) for mode in RoundingMode], [2, 3, 3, 2, 2])
+        self.assertEqual([quantize(-2.5, fmt, mode) for mode in RoundingMode], [-3, -2, -2, -2, -2])
+        # Adding 0.5 in floating point would round this up to 1
+        self.assertEqual(quantize(0.49999999999999994, fmt, RoundingMode.HALF_UP), 0)
+
+    def test_const_is_shared_and_immutable(self):
+        c = const(0.7071, 1, 15, True)
+        self.assertIs(const(0.7071, 1, 15, True), c)
+        self.assertIsNot(const(0.7071, 1, 15, True, RoundingMode.FLOOR), c)
+        self.assertIsInstance(c, FixedPoint)
+        self.assertEqual(c.val_int, FixedPoint(0.7071, 1, 15, True).val_int)
+        self.assertEqual(c.val_bin, FixedPoint(0.7071, 1, 15, True).val_bin)
+
+        with self.assertRaises(AttributeError):
+            c._val_int = 0
+        self.assertIs(type(c * c), FixedPoint)
+        self.assertEqual(pickle.loads(pickle.dumps(c)).val_int, c.val_int)
+
+    def test_overflow_counted_on_first_use(self):
+        with overflow_policy(OverflowMode.WRAP) as stats:
+            a = const(5.0, 1, 4, True)
+            b = const(5.0, 1, 4, True)
+        self.assertIs(a, b)
+        self.assertEqual(a.val_int, 80 - 64)
+        self.assertEqual(stats.total, 1)
+
+        with overflow_policy(OverflowMode.SATURATE):
+            self.assertEqual(const(5.0, 1, 4, True).val_int, 31)
+
+    def test_warns_like_constructor(self):
+        cache = QuantCache()
+        fmt = QFormat(1, 4, True)
+        with overflow_policy(warn=True):
+            with self.assertWarns(RuntimeWarning):
+                cache.get(6.0, fmt)
+        with warnings.catch_warnings(record=True) as w, overflow_policy(warn=True):
+            warnings.simplefilter("always")
+            self.assertEqual(cache.get(7.0, fmt, overflow=OverflowMode.SATURATE).val_int, 31)
+        self.assertEqual(len(w), 0)
+
+    def test_lru_eviction(self):
+        cache = QuantCache(maxsize=2)
+        fmt = QFormat(1, 8, True)
+        with Registry.configure(RegistryMode.COUNT) as scope:
+            first = cache.get(0.25, fmt)
+            cache.get(0.5, fmt)
+            self.assertIs(cache.get(0.25, fmt), first)
+            cache.get(0.75, fmt)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertEqual(scope.var_count, 3)
+        # 0.5 was least recently used, so 0.25 survived
+        self.assertIs(cache.get(0.25, fmt), first)
+        self.assertIsInstance(first, Constant)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+from PyFxP.crosscheck import Case, evaluate, reference, run_crosscheck, scalar_path, shrink
+from PyFxP.overflow import OverflowMode
+from PyFxP.q_format import QFormat
+from PyFxP.rounding import RoundingMode
+
+
+def off_by_one_rshift(case):
+    """ Scalar path with a planted bug: negative values shifted by more than 3 bits round up """
+    raw, fmt = scalar_path(case)
+    if case.op == "rshift" and case.raws[0] < 0 and case.params[0] > 3:
+        return raw + 1, fmt
+    return raw, fmt
+
+
+class TestCrossCheck(unittest.TestCase):
+
+    def test_paths_agree(self):
+        report = run_crosscheck(1500, seed=0, max_workers=0)
+        self.assertTrue(report.ok, report.report())
+        self.assertEqual(report.n_cases, 1500)
+
+    def test_reference_model(self):
+        s4 = QFormat(3, 0, True)
+        self.assertEqual(reference(Case("bsr_scale", (s4,), (-5,), (1, RoundingMode.CONVERGENT))), (-2, s4))
+        self.assertEqual(reference(Case("bsr_scale", (s4,), (-5,), (1, RoundingMode.TRUNCATE))), (-2, s4))
+        self.assertEqual(reference(Case("bsr_scale", (s4,), (-5,), (1, RoundingMode.HALF_UP))), (-2, s4))
+        self.assertEqual(reference(Case("bsr_scale", (s4,), (-5,), (1, RoundingMode.FLOOR))), (-3, s4))
+        self.assertEqual(reference(Case("lshift", (s4,), (5,), (1,), OverflowMode.WRAP)), (-6, s4))
+        self.assertEqual(reference(Case("lshift", (s4,), (5,), (1,), OverflowMode.RAISE)), "OverflowError")
+
+        u4 = QFormat(4, 0, False)
+        self.assertEqual(reference(Case("rshift", (u4,), (12,), (2,))), (3, u4))
+        # Mixed-sign sums can exceed the promoted format by one bit
+        self.assertEqual(reference(Case("add", (u4, s4), (15, 7))), (15, QFormat(4, 0, True)))
+        self.assertEqual(reference(Case("add", (u4, s4), (15, -8))), (7, QFormat(4, 0, True)))
+        self.assertEqual(reference(Case("add", (u4, QFormat(3, 1, True)), (1, 1))), "ValueError")
+
+    def test_kernel_paths_agree(self):
+        report = run_crosscheck(1500, seed=1, ops=["mac", "dot", "fir"], max_workers=0)
+        self.assertTrue(report.ok, report.report())
+
+    def test_kernel_reference_model(self):
+        s4, u4 = QFormat(3, 0, True), QFormat(4, 0, False)
+        q1 = QFormat(2, 1, True)
+        # 3 + (5 * 3) / 2 = 10.5, floored into Q2.1 (raw 21) and saturated to 3.5
+        self.assertEqual(reference(Case("mac", (q1, u4, QFormat(3, 1, True)), (6, 5, 3), (RoundingMode.FLOOR,))), (7, q1))
+        self.assertEqual(reference(Case("mac", (s4, s4, s4), (1, 2, 3), (RoundingMode.FLOOR,))), (7, s4))
+        # Default dot accumulator grows by the guard bits of n terms
+        self.assertEqual(reference(Case("dot", (u4, u4), (15, 15, 15, 15), (2, RoundingMode.FLOOR))),
+                         (450, QFormat(9, 0, False)))
+        self.assertEqual(reference(Case("dot", (u4, u4, s4), (1, 2, 3, 4), (2, RoundingMode.FLOOR), OverflowMode.RAISE)),
+                         "OverflowError")
+        # Each output sums c[k] * x[n - k] from zero history
+        self.assertEqual(reference(Case("fir", (s4, s4, QFormat(7, 0, True)), (1, 2, 1, 2, 3), (2, RoundingMode.FLOOR))),
+                         ((1, 4, 7), QFormat(7, 0, True)))
+
+    def test_regressions(self):
+        cases = [
+            # Mixed-sign add into a 128-bit result exceeds the format by one bit
+            Case("add", (QFormat(18, 109, False), QFormat(0, 109, True)), ((1 << 127) - 1, 1), (), OverflowMode.RAISE),
+            Case("add", (QFormat(18, 109, False), QFormat(0, 109, True)), ((1 << 127) - 1, 1), (), OverflowMode.WRAP),
+            # Rounding right shifts of native arrays by 64 bits or more
+            Case("bsr_scale", (QFormat(0, 1, False),), (1,), (65, RoundingMode.HALF_UP)),
+            Case("resize", (QFormat(3, 70, True),), (-(1 << 69) - 1,), (3, 0, True, RoundingMode.CEIL)),
+            # Unsigned full-precision kernel sums of 128 bits need a sign bit in the two-limb accumulator
+            Case("dot", (QFormat(64, 0, False), QFormat(63, 0, False)), ((1 << 64) - 1,) * 2 + ((1 << 63) - 1,) * 2,
+                 (2, RoundingMode.FLOOR)),
+            Case("mac", (QFormat(1, 25, True), QFormat(53, 8, False), QFormat(2, 64, False)),
+                 (67108863, (1 << 61) - 1, (1 << 66) - 1), (RoundingMode.FLOOR,)),
+        ]
+        for case in cases:
+            outcomes = evaluate(case)
+            self.assertTrue(all(outcome in (None, outcomes["reference"]) for outcome in outcomes.values()), outcomes)
+
+    def test_shrinks_to_minimal_reproducer(self):
+        report = run_crosscheck(2000, seed=2, ops=["rshift", "add"], paths={"bad": off_by_one_rshift},
+                                max_failures=1, max_workers=0)
+        self.assertFalse(report.ok)
+
+        for m in report.mismatches:
+            self.assertEqual(m.case.op, "rshift")
+            # Smallest signed format holding a negative value, smallest failing shift, default mode
+            self.assertEqual(m.shrunk, Case("rshift", (QFormat(0, 0, True),), (-1,), (4,)))
+            self.assertNotEqual(m.shrunk_outcomes["bad"], m.shrunk_outcomes["reference"])
+        self.assertIn("FixedPoint._create(-1, QFormat(int_width=0, fract_width=0, signed=True)) >> 4", report.report())
+        self.assertEqual(shrink(m.shrunk, {"bad": off_by_one_rshift}), m.shrunk)
+
+    def test_parallel_matches_serial(self):
+        args = dict(n_cases=1200, seed=3, ops=["rshift"], paths={"bad": off_by_one_rshift}, batch_size=300)
+        serial = run_crosscheck(max_workers=0, **args)
+        parallel = run_crosscheck(max_workers=2, **args)
+        self.assertEqual([m.case for m in serial.mismatches], [m.case for m in parallel.mismatches])
+        self.assertGreater(len(serial.mismatches), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+
+import numpy as np
+
+from PyFxP.filters import FIRFilter, IIRFilter, Quantizer
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.q_format import QFormat
+from PyFxP.registry import Registry, RegistryMode
+from PyFxP.rounding import RoundingMode
+
+
+def requantize(fxp: FixedPoint, quantizer: Quantizer | None) -> FixedPoint:
+    if quantizer is None:
+        return fxp
+    fmt = quantizer.fmt
+    return fxp.resize(fmt.int_width, fmt.fract_width, fmt.signed, quantizer.rounding, quantizer.overflow)
+
+
+def reference_fir(coeffs, samples, product, accumulator, output) -> list[int]:
+    """ Sample-by-sample FixedPoint chain the FIR engine must match bit for bit """
+    zero = FixedPoint(0, samples[0].int_width, samples[0].fract_width, samples[0].signed)
+    history = [zero] * len(coeffs)
+    outputs = []
+    for x in samples:
+        history = [x] + history[:-1]
+        acc = None
+        for c, h in zip(coeffs, history):
+            prod = requantize(c * h, product)
+            acc = requantize(prod if acc is None else acc + prod, accumulator)
+        outputs.append(requantize(acc, output).val_int)
+    return outputs
+
+
+def reference_iir(b, a, samples, product, accumulator, output) -> list[int]:
+    x_hist = [FixedPoint(0, samples[0].int_width, samples[0].fract_width, samples[0].signed)] * len(b)
+    y_hist = [FixedPoint(0, output.fmt.int_width, output.fmt.fract_width, output.fmt.signed)] * len(a)
+    outputs = []
+    for x in samples:
+        x_hist = [x] + x_hist[:-1]
+        acc = None
+        for c, h in zip(b, x_hist):
+            prod = requantize(c * h, product)
+            acc = requantize(prod if acc is None else acc + prod, accumulator)
+        for c, h in zip(a, y_hist):
+            acc = requantize(acc - requantize(c * h, product), accumulator)
+        y = requantize(acc, output)
+        y_hist = [y] + y_hist[:-1]
+        outputs.append(y.val_int)
+    return outputs
+
+
+class TestFIRFilter(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.input_fmt = QFormat(2, 10, True)
+        self.coeffs = FixedPointArray(rng.uniform(-1, 1, 7), 0, 12, True)
+        self.x = FixedPointArray(rng.uniform(-4, 4, 64), 2, 10, True)
+
+    def check(self, product=None, accumulator=None, output=None, block=64):
+        fir = FIRFilter(self.coeffs, self.input_fmt, product=product, accumulator=accumulator, output=output)
+        with Registry.configure(RegistryMode.OFF), overflow_policy(OverflowMode.SATURATE):
+            y = [int(v) for start in range(0, len(self.x), block) for v in fir.process(self.x[start:start + block]).val_int]
+            expected = reference_fir(self.coeffs.to_fixed_points(), self.x.to_fixed_points(), product, accumulator, output)
+        self.assertEqual(y, expected)
+        return fir
+
+    def test_full_precision(self):
+        fir = self.check()
+        self.assertEqual(fir.output_fmt, QFormat(9, 22, True))
+
+    def test_quantized_stages(self):
+        self.check(product=Quantizer(QFormat(2, 14, True), RoundingMode.CONVERGENT),
+                   accumulator=Quantizer(QFormat(3, 14, True), overflow=OverflowMode.WRAP),
+                   output=Quantizer(QFormat(2, 8, True), RoundingMode.HALF_UP, OverflowMode.SATURATE))
+
+    def test_streaming_blocks(self):
+        self.check(output=Quantizer(QFormat(2, 8, True)), block=5)
+
+    def test_float_input(self):
+        fir = FIRFilter([0.5, 0.5], QFormat(2, 10, True), coeff_fmt=QFormat(0, 4, True))
+        self.assertEqual(fir.process(np.array([1.0, 3.0])).val_float.tolist(), [0.5, 2.0])
+
+    def test_rejects_mismatched_input(self):
+        fir = FIRFilter(self.coeffs, self.input_fmt)
+        with self.assertRaises(ValueError):
+            fir.process(FixedPointArray([0.0], 3, 10, True))
+
+
+class TestIIRFilter(unittest.TestCase):
+
+    def test_biquad_matches_reference(self):
+        rng = np.random.default_rng(2)
+        input_fmt = QFormat(1, 12, True)
+        b = FixedPointArray([0.2, 0.4, 0.2], 1, 14, True)
+        a = FixedPointArray([-0.5, 0.25], 1, 14, True)
+        product = Quantizer(QFormat(3, 20, True), RoundingMode.CONVERGENT)
+        accumulator = Quantizer(QFormat(4, 20, True), overflow=OverflowMode.WRAP)
+        output = Quantizer(QFormat(1, 12, True), RoundingMode.HALF_UP, OverflowMode.SATURATE)
+        x = FixedPointArray(rng.uniform(-2, 2, 50), 1, 12, True)
+
+        iir = IIRFilter(b, a, input_fmt, output, product=product, accumulator=accumulator)
+        with Registry.configure(RegistryMode.OFF), overflow_policy(OverflowMode.SATURATE):
+            y = iir.process(x[:20]).val_int.tolist() + iir.process(x[20:]).val_int.tolist()
+            expected = reference_iir(b.to_fixed_points(), a.to_fixed_points(), x.to_fixed_points(), product, accumulator, output)
+        self.assertEqual(y, expected)
+
+    def test_configurations_match_reference(self):
+        rng = np.random.default_rng(3)
+        configs = [
+            # Unquantized products and sums, grown step by step
+            (QFormat(1, 6, True), [0.5, -0.25], [-0.75], QFormat(1, 6, True), None, None,
+             Quantizer(QFormat(2, 6, True), RoundingMode.CONVERGENT)),
+            # Tight wrapping accumulator, products rounded and saturating
+            (QFormat(2, 10, True), [0.9, 0.8, -0.7], [-1.2, 0.6], QFormat(1, 10, True),
+             Quantizer(QFormat(1, 12, True), RoundingMode.HALF_UP), Quantizer(QFormat(2, 12, True), overflow=OverflowMode.WRAP),
+             Quantizer(QFormat(2, 10, True), RoundingMode.FLOOR)),
+            # Products shifted left onto a finer grid, unsigned input
+            (QFormat(3, 4, False), [0.5], [0.25, -0.5, 0.125], QFormat(1, 6, True),
+             Quantizer(QFormat(6, 14, True)), Quantizer(QFormat(5, 14, True), RoundingMode.CEIL),
+             Quantizer(QFormat(3, 4, True), RoundingMode.TRUNCATE)),
+            # Intermediates beyond int64, held in object arrays
+            (QFormat(20, 30, True), [0.3, 0.3], [-0.4], QFormat(1, 30, True), None,
+             Quantizer(QFormat(24, 60, True), RoundingMode.CONVERGENT), Quantizer(QFormat(21, 30, True))),
+        ]
+        for input_fmt, b, a, coeff_fmt, product, accumulator, output in configs:
+            lo, hi = input_fmt.min_val * 1.2 / input_fmt.scale, input_fmt.max_val * 1.2 / input_fmt.scale
+            with overflow_policy(OverflowMode.SATURATE):
+                x = FixedPointArray(rng.uniform(lo, hi, 40), input_fmt.int_width, input_fmt.fract_width, input_fmt.signed)
+            b_arr = FixedPointArray(b, coeff_fmt.int_width, coeff_fmt.fract_width, coeff_fmt.signed)
+            a_arr = FixedPointArray(a, coeff_fmt.int_width, coeff_fmt.fract_width, coeff_fmt.signed)
+
+            iir = IIRFilter(b_arr, a_arr, input_fmt, output, product=product, accumulator=accumulator)
+            with Registry.configure(RegistryMode.OFF), overflow_policy(OverflowMode.SATURATE) as stats:
+                y = iir.process(x[:15]).val_int.tolist() + iir.process(x[15:]).val_int.tolist()
+            with Registry.configure(RegistryMode.OFF), overflow_policy(OverflowMode.SATURATE) as expected_stats:
+                expected = reference_iir(b_arr.to_fixed_points(), a_arr.to_fixed_points(), x.to_fixed_points(),
+                                         product, accumulator, output)
+            self.assertEqual(y, expected, input_fmt)
+            self.assertEqual(stats.total, expected_stats.total, input_fmt)
+
+    def test_reset(self):
+        iir = IIRFilter([1.0], [-0.5], QFormat(1, 8, True), Quantizer(QFormat(2, 8, True)), coeff_fmt=QFormat(1, 8, True))
+        first = iir.process(np.array([1.0, 0.0, 0.0])).val_float.tolist()
+        iir.reset()
+        self.assertEqual(iir.process(np.array([1.0, 0.0, 0.0])).val_float.tolist(), first)
+        self.assertEqual(first, [1.0, 0.5, 0.25])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,14 @@
+import os
+import subprocess
+import sys
 import unittest
 import warnings
 
 from PyFxP.fix_point import FixedPoint
-from PyFxP.registry import Registry
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.q_format import QFormat
+from PyFxP.registry import Registry, RegistryMode
+from PyFxP.rounding import RoundingMode
 
 
 class TestFixedPoint(unittest.TestCase):
@@ -34,6 +40,14 @@ class TestFixedPoint(unittest.TestCase):
         self.assertEqual(fxp.val_int, -24)
         self.assertAlmostEqual(fxp.val_float, -1.5, places=6)
 
+    def test_lazy_representations_cached(self):
+        fxp = FixedPoint(-1.5, int_width=3, fract_width=4, signed=True)
+        self.assertIsNone(fxp._val_float)
+        self.assertIsNone(fxp._val_bin)
+        self.assertIs(fxp.val_bin, fxp.val_bin)
+        self.assertEqual(fxp.val_bin, "11101000")
+        self.assertEqual(fxp.val_float, -1.5)
+
     def test_invalid_bin_length(self):
         with self.assertRaises(ValueError):
             FixedPoint("101010", int_width=4, fract_width=4, signed=False)
@@ -55,17 +69,20 @@ class TestFixedPoint(unittest.TestCase):
         self.assertAlmostEqual(fxp.val_float, 1.25, places=6)
 
     def test_clip_overflow_unsigned(self):
-        fxp = FixedPoint(300.0, int_width=4, fract_width=4, signed=False)
+        with self.assertWarns(RuntimeWarning), overflow_policy(warn=True):
+            fxp = FixedPoint(300.0, int_width=4, fract_width=4, signed=False)
         self.assertEqual(fxp.val_int, 255)  # clipped
         self.assertAlmostEqual(fxp.val_float, 15.9375, places=6)
 
     def test_clip_overflow_signed(self):
-        fxp = FixedPoint(100.0, int_width=5, fract_width=2, signed=True)
+        with self.assertWarns(RuntimeWarning), overflow_policy(warn=True):
+            fxp = FixedPoint(100.0, int_width=5, fract_width=2, signed=True)
         self.assertEqual(fxp.val_int, 127)
         self.assertAlmostEqual(fxp.val_float, 31.75, places=6)
 
     def test_clip_underflow_signed(self):
-        fxp = FixedPoint(-100.0, int_width=5, fract_width=2, signed=True)
+        with self.assertWarns(RuntimeWarning), overflow_policy(warn=True):
+            fxp = FixedPoint(-100.0, int_width=5, fract_width=2, signed=True)
         self.assertEqual(fxp.val_int, -128)
         self.assertAlmostEqual(fxp.val_float, -32.0, places=6)
 
@@ -95,7 +112,8 @@ class TestFixedPoint(unittest.TestCase):
         self.assertAlmostEqual(fxp.val_float, -4.0, places=6)
 
     def test_negative_overflow_clipping(self):
-        fxp = FixedPoint(-100.0, int_width=3, fract_width=3, signed=True)
+        with self.assertWarns(RuntimeWarning), overflow_policy(warn=True):
+            fxp = FixedPoint(-100.0, int_width=3, fract_width=3, signed=True)
         # min_val = -64 => int = -64 => float = -8.0
         self.assertEqual(fxp.val_int, -64)
         self.assertAlmostEqual(fxp.val_float, -8.0, places=6)
@@ -161,7 +179,7 @@ class TestFixedPoint(unittest.TestCase):
         a = FixedPoint(2.0, int_width=3, fract_width=4, signed=False)
         b = FixedPoint(4.5, int_width=3, fract_width=4, signed=False)
 
-        with warnings.catch_warnings(record=True) as w:
+        with warnings.catch_warnings(record=True) as w, overflow_policy(warn=True):
             warnings.simplefilter("always")
             c = a - b
 
@@ -268,5 +286,67 @@ class TestFixedPoint(unittest.TestCase):
         self.assertEqual(b.val_bin, "11100000")
         self.assertTrue(b.signed)
 
+    def test_bsl_scale(self):
+        a = FixedPoint(1.5, int_width=3, fract_width=4, signed=True)
+        self.assertEqual(a.bsl_scale(2).val_float, 6.0)
+        self.assertEqual((a.int_width, a.fract_width), (a.bsl_scale(2).int_width, a.bsl_scale(2).fract_width))
+
+    def test_bsl_scale_saturates(self):
+        a = FixedPoint(3.0, int_width=3, fract_width=4, signed=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertEqual(a.bsl_scale(2).val_int, 127)
+
+    def test_bsr_scale_rounds_half_even(self):
+        a = FixedPoint(0.1875, int_width=3, fract_width=4, signed=True)   # 3/16
+        self.assertEqual(a.bsr_scale(1).val_int, 2)                       # 1.5 -> 2
+        b = FixedPoint(0.3125, int_width=3, fract_width=4, signed=True)   # 5/16
+        self.assertEqual(b.bsr_scale(1).val_int, 2)                       # 2.5 -> 2
+
+    def test_bsr_scale_negative_shift(self):
+        a = FixedPoint(-0.5, int_width=3, fract_width=4, signed=True)
+        self.assertEqual(a.bsr_scale(-1).val_float, -1.0)
+        # The overflow mode applies to the delegated left shift
+        b = FixedPoint(3.0, int_width=3, fract_width=4, signed=True)
+        self.assertEqual(b.bsr_scale(-2, overflow=OverflowMode.WRAP).val_int, (48 << 2) - 256)
+
+    def test_bsl_scale_negative_shift_rounds(self):
+        a = FixedPoint(0.3125, int_width=3, fract_width=4, signed=True)   # 5/16
+        self.assertEqual(a.bsl_scale(-1).val_int, 2)                      # 2.5 -> 2
+        self.assertEqual(a.bsl_scale(-1, rounding=RoundingMode.FLOOR).val_int, 2)
+        self.assertEqual(a.bsl_scale(-1, rounding=RoundingMode.CEIL).val_int, 3)
+
+    def test_scale_exact_beyond_double(self):
+        raw = (1 << 80) + 3
+        a = FixedPoint(raw, int_width=10, fract_width=80, signed=False)
+        self.assertEqual(a.bsl_scale(1).val_int, raw << 1)
+        self.assertEqual(a.bsr_scale(1).val_int, (raw >> 1) + 1)
+
+    def test_from_raw(self):
+        fmt = QFormat(3, 4, True)
+        with Registry.configure(RegistryMode.COUNT) as scope:
+            a = FixedPoint.from_raw(-37, fmt)
+        self.assertEqual(scope.var_count, 0)
+        self.assertIs(a.fmt, fmt)
+        self.assertEqual(a.val_float, FixedPoint(-37, 3, 4, True).val_float)
+        self.assertEqual(a.val_bin, FixedPoint(-37, 3, 4, True).val_bin)
+        self.assertEqual((a * a).val_int, 37 * 37)
+
+
+class TestImport(unittest.TestCase):
+
+    def test_lazy_import(self):
+        code = ("import sys, PyFxP; assert 'numpy' not in sys.modules and 'PyFxP.lut' not in sys.modules; "
+                "PyFxP.FixedPoint(0.5, 2, 4) * PyFxP.FixedPoint(1.5, 2, 4); "
+                "assert 'numpy' not in sys.modules; "
+                "assert PyFxP.FixedPointArray.__module__ == 'PyFxP.fix_point_array'; "
+                "assert PyFxP.lut.LUT and 'lut' in dir(PyFxP)")
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(__file__)) or ".")
+
+        import PyFxP
+        with self.assertRaises(AttributeError):
+            PyFxP.missing
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import warnings
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.rounding import RoundingMode
+
+
+class TestFixedPointArray(unittest.TestCase):
+
+    def test_from_float_signed(self):
+        arr = FixedPointArray([-1.5, 3.75, 0.0], int_width=3, fract_width=4, signed=True)
+        self.assertEqual(arr.val_int.dtype, np.int64)
+        self.assertEqual(arr.val_int.tolist(), [-24, 60, 0])
+        np.testing.assert_allclose(arr.val_float, [-1.5, 3.75, 0.0])
+
+    def test_from_float_unsigned_storage(self):
+        arr = FixedPointArray([3.75], int_width=4, fract_width=4, signed=False)
+        self.assertEqual(arr.val_int.dtype, np.uint64)
+        self.assertEqual(arr.val_int.tolist(), [60])
+
+    def test_from_int_raw(self):
+        arr = FixedPointArray(np.array([60, 8]), int_width=4, fract_width=4, signed=False)
+        np.testing.assert_allclose(arr.val_float, [3.75, 0.5])
+
+    def test_clip_warns_once_per_array(self):
+        with warnings.catch_warnings(record=True) as w, overflow_policy(warn=True):
+            warnings.simplefilter("always")
+            arr = FixedPointArray([100.0, 200.0, -100.0], int_width=5, fract_width=2, signed=True)
+
+            self.assertEqual(len(w), 2)
+            self.assertIn("overflow", str(w[0].message).lower())
+            self.assertIn("underflow", str(w[1].message).lower())
+
+        self.assertEqual(arr.val_int.tolist(), [127, 127, -128])
+
+    def test_add_matches_scalar(self):
+        a = FixedPointArray([-2.0, 7.5], int_width=3, fract_width=4, signed=True)
+        b = FixedPointArray([1.25, 7.5], int_width=3, fract_width=4, signed=True)
+        c = a + b
+        expected = FixedPoint(-2.0, 3, 4, True) + FixedPoint(1.25, 3, 4, True)
+        self.assertEqual((c.int_width, c.fract_width, c.signed), (expected.int_width, expected.fract_width, expected.signed))
+        self.assertEqual(c.val_int.tolist(), [-12, 240])
+
+    def test_sub_unsigned_clips(self):
+        a = FixedPointArray([2.0], int_width=3, fract_width=4, signed=False)
+        b = FixedPointArray([4.5], int_width=3, fract_width=4, signed=False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            c = a - b
+        self.assertEqual(c.val_int.tolist(), [0])
+        self.assertEqual(c.int_width, 4)
+
+    def test_mul_signed_unsigned(self):
+        a = FixedPointArray([3.0, 1.5], int_width=3, fract_width=4, signed=False)
+        b = FixedPointArray([-2.0, -2.0], int_width=3, fract_width=4, signed=True)
+        c = a * b
+        self.assertEqual(c.val_int.tolist(), [-1536, -768])
+        self.assertEqual((c.int_width, c.fract_width, c.signed), (6, 8, True))
+
+    def test_scalar_broadcast(self):
+        gain = FixedPoint(0.5, 1, 4, signed=True)
+        arr = FixedPointArray([1.0, -1.0], int_width=1, fract_width=4, signed=True)
+        self.assertEqual((gain * arr).val_int.tolist(), (arr * gain).val_int.tolist())
+        self.assertEqual((gain * arr).val_float.tolist(), [0.5, -0.5])
+
+    def test_shifts_match_scalar(self):
+        values = [-4.0, -3.5, 1.5, 3.0]
+        arr = FixedPointArray(values, int_width=3, fract_width=4, signed=True)
+        for n in (0, 1, 3, 70):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                left = (arr << n).val_int.tolist()
+                right = (arr >> n).val_int.tolist()
+                self.assertEqual(left, [(FixedPoint(v, 3, 4, True) << n).val_int for v in values])
+            self.assertEqual(right, [(FixedPoint(v, 3, 4, True) >> n).val_int for v in values])
+
+    def test_scaling_matches_scalar(self):
+        values = [-3.9375, -0.1875, 0.3125, 1.5]
+        arr = FixedPointArray(values, int_width=3, fract_width=4, signed=True)
+        for n in (-2, 0, 1, 3):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                self.assertEqual(arr.bsl_scale(n).val_int.tolist(), [FixedPoint(v, 3, 4, True).bsl_scale(n).val_int for v in values])
+                self.assertEqual(arr.bsr_scale(n).val_int.tolist(), [FixedPoint(v, 3, 4, True).bsr_scale(n).val_int for v in values])
+                for rounding in (RoundingMode.FLOOR, RoundingMode.CEIL):
+                    self.assertEqual(arr.bsl_scale(n, rounding=rounding).val_int.tolist(),
+                                     [FixedPoint(v, 3, 4, True).bsl_scale(n, rounding=rounding).val_int for v in values])
+
+    def test_wide_format_object_storage(self):
+        a = FixedPointArray(np.array([1 << 70, -(1 << 70)], dtype=object), int_width=40, fract_width=40, signed=True)
+        self.assertEqual(a.val_int.dtype, object)
+        c = a * a
+        self.assertEqual(c.val_int.tolist(), [1 << 140, 1 << 140])
+
+    def test_getitem_returns_fixed_point(self):
+        arr = FixedPointArray([1.5, 2.5], int_width=3, fract_width=4, signed=False)
+        item = arr[1]
+        self.assertIsInstance(item, FixedPoint)
+        self.assertEqual(item.val_int, 40)
+        self.assertIsInstance(arr[:1], FixedPointArray)
+
+    def test_round_trip_fixed_points(self):
+        values = [FixedPoint(v, 3, 4, True) for v in (-1.5, 0.25, 2.0)]
+        arr = FixedPointArray.from_fixed_points(values)
+        self.assertEqual([v.val_int for v in arr.to_fixed_points()], [v.val_int for v in values])
+
+    def test_mixed_sign_add_at_128_bits(self):
+        # uQ18.109 max + 1 exceeds the promoted sQ18.109 (128 bits) by one bit
+        a = FixedPointArray.from_fixed_points([FixedPoint((1 << 127) - 1, 18, 109, False)])
+        b = FixedPointArray.from_fixed_points([FixedPoint(1, 0, 109, True)])
+        with overflow_policy(OverflowMode.WRAP, warn=False):
+            self.assertEqual(int((a + b).val_int[0]), (FixedPoint((1 << 127) - 1, 18, 109, False) +
+                                                         FixedPoint(1, 0, 109, True)).val_int)
+        with overflow_policy(OverflowMode.RAISE):
+            with self.assertRaises(OverflowError):
+                a + b
+
+    def test_round_shift_beyond_native_width(self):
+        arr = FixedPointArray([1, -3], int_width=3, fract_width=60, signed=True)
+        for n in (63, 64, 65):
+            for rounding in RoundingMode:
+                expected = [FixedPoint(v, 3, 60, True).bsr_scale(n, rounding).val_int for v in (1, -3)]
+                self.assertEqual(arr.bsr_scale(n, rounding).val_int.tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
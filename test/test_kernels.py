@@ -0,0 +1,100 @@
+import unittest
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.kernels import dot, dot_format, mac
+from PyFxP.overflow import OverflowMode
+from PyFxP.q_format import QFormat
+from PyFxP.registry import Registry, RegistryMode
+from PyFxP.rounding import RoundingMode
+
+
+COEFFS = [0.125, -0.5, 0.75, 0.25]
+SAMPLES = [1.5, -2.25, 3.0, -0.5]
+
+
+class TestKernels(unittest.TestCase):
+
+    def setUp(self):
+        self.coeffs = [FixedPoint(c, 0, 8, True) for c in COEFFS]
+        self.samples = [FixedPoint(s, 3, 4, True) for s in SAMPLES]
+
+    def test_dot_matches_chained_ops(self):
+        acc = self.coeffs[0] * self.samples[0]
+        for c, s in zip(self.coeffs[1:], self.samples[1:]):
+            acc = acc + c * s
+        result = dot(self.coeffs, self.samples)
+        self.assertEqual(result.val_int, acc.val_int)
+        self.assertEqual(result.val_float, sum(c * s for c, s in zip(COEFFS, SAMPLES)))
+
+    def test_dot_default_format_grows_log2(self):
+        fmt = dot_format(QFormat(0, 8, True), QFormat(3, 4, True), 4)
+        self.assertEqual(fmt, QFormat(6, 12, True))
+        self.assertIs(dot(self.coeffs, self.samples).fmt, fmt)
+
+    def test_dot_declared_accumulator(self):
+        acc_fmt = QFormat(7, 4, True)
+        result = dot(self.coeffs, self.samples, acc_fmt=acc_fmt, rounding=RoundingMode.CONVERGENT)
+        exact = dot(self.coeffs, self.samples)
+        self.assertIs(result.fmt, acc_fmt)
+        self.assertEqual(result.val_int, exact.resize(7, 4, rounding=RoundingMode.CONVERGENT).val_int)
+
+    def test_dot_batched_rows(self):
+        rows = np.array([[s.val_int for s in self.samples], [0, 0, 0, 16]])
+        samples = FixedPointArray(rows, 3, 4, True)
+        result = dot(FixedPointArray.from_fixed_points(self.coeffs), samples)
+        self.assertIsInstance(result, FixedPointArray)
+        self.assertEqual(result.val_int.tolist(), [dot(self.coeffs, self.samples).val_int, 64 * 16])
+
+    def test_dot_logs_no_ops(self):
+        with Registry.configure(RegistryMode.COUNT) as scope:
+            dot(self.coeffs, self.samples)
+        self.assertEqual(scope.op_count, 0)
+
+    def test_mac_scalar(self):
+        acc = FixedPoint(1.0, 7, 8, True)
+        result = mac(acc, self.coeffs[1], self.samples[1])
+        self.assertEqual(result.fmt, acc.fmt)
+        self.assertEqual(result.val_float, 1.0 + COEFFS[1] * SAMPLES[1])
+
+    def test_mac_rounds_once(self):
+        acc = FixedPoint(0.0, 7, 2, True)
+        a = FixedPoint(0.375, 0, 8, True)
+        b = FixedPoint(1.0, 3, 4, True)
+        self.assertEqual(mac(acc, a, b, rounding=RoundingMode.FLOOR).val_int, 1)
+        self.assertEqual(mac(acc, a, b, rounding=RoundingMode.HALF_UP).val_int, 2)
+
+    def test_mac_saturates_into_accumulator(self):
+        acc = FixedPoint(7.0, 3, 4, True)
+        result = mac(acc, self.samples[2], self.samples[2], overflow=OverflowMode.SATURATE)
+        self.assertEqual(result.val_int, acc.fmt.max_val)
+
+    def test_mac_array(self):
+        acc = FixedPointArray([0.5, -0.5], 7, 8, True)
+        a = FixedPointArray([0.25, 0.75], 0, 8, True)
+        result = mac(acc, a, self.samples[0])
+        np.testing.assert_array_equal(result.val_float, [0.5 + 0.25 * 1.5, -0.5 + 0.75 * 1.5])
+
+    def test_unsigned_at_128_bit_boundary(self):
+        # Unsigned full-precision sums of 127-128 bits need a sign bit in the two-limb accumulator
+        samples = FixedPointArray.from_fixed_points([FixedPoint((1 << 63) - 1, 63, 0)] * 2)
+        coeffs = FixedPointArray.from_fixed_points([FixedPoint((1 << 64) - 1, 64, 0)] * 2)
+        self.assertEqual(dot(coeffs, samples).val_int, 2 * ((1 << 63) - 1) * ((1 << 64) - 1))
+
+        acc = FixedPoint(67108863, 1, 25, True)
+        a, b = FixedPoint((1 << 61) - 1, 53, 8), FixedPoint((1 << 66) - 1, 2, 64)
+        expected = mac(acc, a, b, overflow=OverflowMode.SATURATE).val_int
+        self.assertEqual(expected, 67108863)
+        arr = mac(FixedPointArray.from_fixed_points([acc]), a, b, overflow=OverflowMode.SATURATE)
+        self.assertEqual(int(arr.val_int[0]), expected)
+
+        # One bit narrower still fits the limbs and must agree with the object path
+        samples = FixedPointArray.from_fixed_points([FixedPoint((1 << 63) - 1, 63, 0)] * 2)
+        coeffs = FixedPointArray.from_fixed_points([FixedPoint((1 << 63) - 1, 63, 0)] * 2)
+        self.assertEqual(dot(coeffs, samples).val_int, 2 * ((1 << 63) - 1) ** 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
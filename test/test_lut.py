@@ -0,0 +1,110 @@
+import functools
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.lut import LUT, cached_lut
+from PyFxP.q_format import QFormat
+from PyFxP.rounding import RoundingMode, shift_round
+
+
+IN_FMT = QFormat(1, 10, True)
+OUT_FMT = QFormat(1, 14, True)
+
+
+class TestLUT(unittest.TestCase):
+
+    def setUp(self):
+        self.x = FixedPointArray(np.random.default_rng(0).uniform(-2, 1.99, 5000), 1, 10, True)
+
+    def test_full_table_matches_direct_quantization(self):
+        lut = LUT(np.sin, IN_FMT, OUT_FMT)
+        self.assertEqual(len(lut), 1 << IN_FMT.total_width)
+        expected = FixedPointArray(np.sin(self.x.val_float), 1, 14, True)
+        np.testing.assert_array_equal(lut(self.x).val_int, expected.val_int)
+
+    def test_interpolation_is_bit_exact(self):
+        lut = LUT(np.sin, IN_FMT, OUT_FMT, addr_bits=6, interpolate=True, rounding=RoundingMode.HALF_UP)
+        self.assertEqual(len(lut), 65)
+        table, shift = [int(v) for v in lut.table], IN_FMT.total_width - 6
+
+        out = lut(self.x)
+        for k, raw in enumerate(self.x.val_int[:200].tolist()):
+            offset = raw - IN_FMT.min_val
+            lo, hi = table[offset >> shift], table[(offset >> shift) + 1]
+            expected = lo + shift_round((hi - lo) * (offset & ((1 << shift) - 1)), shift, RoundingMode.HALF_UP)
+            self.assertEqual(int(out.val_int[k]), expected)
+            self.assertEqual(lut(FixedPoint(raw, 1, 10, True)).val_int, expected)
+
+        # Linear interpolation error bound h²/8 * max|sin''| over segments of width h = 1/16, plus rounding
+        self.assertLess(np.abs(out.val_float - np.sin(self.x.val_float)).max(), (1 / 16) ** 2 / 8 + 2 * 2.0 ** -14)
+
+    def test_saturation_and_domain(self):
+        recip = LUT(lambda v: 1 / v, QFormat(2, 8, False), QFormat(5, 8, False), addr_bits=6)
+        self.assertEqual(recip.table[0], QFormat(5, 8, False).max_val)
+        self.assertGreater(recip.saturated, 0)
+
+        log = LUT(np.log, QFormat(3, 6, False), QFormat(4, 8, True))
+        self.assertEqual(log.table[0], QFormat(4, 8, True).min_val)
+
+    def test_format_checked(self):
+        lut = LUT(np.sin, IN_FMT, OUT_FMT, addr_bits=4)
+        with self.assertRaises(ValueError):
+            lut(FixedPoint(0.5, 2, 10, True))
+        with self.assertRaises(ValueError):
+            LUT(np.sin, IN_FMT, OUT_FMT, addr_bits=IN_FMT.total_width + 1)
+
+    def test_save_load_and_disk_cache(self):
+        calls = []
+
+        def sqrt(v):
+            calls.append(len(v))
+            return np.sqrt(v)
+
+        in_fmt, out_fmt = QFormat(4, 8, False), QFormat(2, 12, False)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # sqrt captures a list whose contents change, so it is cached under an explicit name
+            first = cached_lut(sqrt, in_fmt, out_fmt, addr_bits=8, interpolate=True, name="sqrt", cache_dir=cache_dir)
+            second = cached_lut(sqrt, in_fmt, out_fmt, addr_bits=8, interpolate=True, name="sqrt", cache_dir=cache_dir)
+            cached_lut(sqrt, in_fmt, out_fmt, addr_bits=6, interpolate=True, name="sqrt", cache_dir=cache_dir)
+
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            self.assertEqual((second.addr_bits, second.interpolate, second.output_fmt), (8, True, out_fmt))
+            x = FixedPointArray(np.linspace(0, 15, 300), 4, 8, False)
+            np.testing.assert_array_equal(first(x).val_int, second(x).val_int)
+
+            wide = LUT(np.sin, QFormat(1, 5, True), QFormat(1, 70, True))
+            path = os.path.join(cache_dir, "wide.npz")
+            wide.save(path)
+            self.assertEqual(LUT.load(path).table.tolist(), wide.table.tolist())
+
+    def test_cache_keys_closures(self):
+        def make(gain):
+            return lambda v: gain * v
+
+        in_fmt, out_fmt = QFormat(4, 4, False), QFormat(5, 4, True)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            up = cached_lut(make(0.5), in_fmt, out_fmt, cache_dir=cache_dir)
+            down = cached_lut(make(-0.5), in_fmt, out_fmt, cache_dir=cache_dir)
+            self.assertEqual(up.table[-1], -down.table[-1])
+            self.assertEqual(cached_lut(make(0.5), in_fmt, out_fmt, cache_dir=cache_dir).table.tolist(), up.table.tolist())
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            # Callables without code must be named
+            half = functools.partial(np.multiply, 0.5)
+            with self.assertRaises(ValueError):
+                cached_lut(half, in_fmt, out_fmt, cache_dir=cache_dir)
+            with self.assertRaises(ValueError):
+                cached_lut(make(threading.Lock()), in_fmt, out_fmt, cache_dir=cache_dir)
+            named = cached_lut(half, in_fmt, out_fmt, name="half", cache_dir=cache_dir)
+            self.assertEqual(named.table.tolist(), up.table.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
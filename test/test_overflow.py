@@ -0,0 +1,110 @@
+import unittest
+import warnings
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.overflow import OverflowMode, OverflowStats, current_policy, overflow_policy
+from PyFxP.q_format import QFormat
+
+
+class TestOverflow(unittest.TestCase):
+
+    def test_saturate_without_warnings(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            with overflow_policy(OverflowMode.SATURATE) as stats:
+                hi = FixedPoint(100.0, int_width=5, fract_width=2, signed=True)
+                lo = FixedPoint(-100.0, int_width=5, fract_width=2, signed=True)
+            self.assertEqual(len(w), 0)
+
+        self.assertEqual(hi.val_int, 127)
+        self.assertEqual(lo.val_int, -128)
+        self.assertEqual(stats.total, 2)
+        self.assertEqual(stats.counts[(QFormat(5, 2, True), "construct", "overflow")], 1)
+
+    def test_wrap_signed(self):
+        with overflow_policy(OverflowMode.WRAP):
+            fxp = FixedPoint(130, int_width=5, fract_width=2, signed=True)
+        self.assertEqual(fxp.val_int, 130 - 256)
+
+    def test_wrap_unsigned(self):
+        with overflow_policy(OverflowMode.WRAP):
+            a = FixedPoint(2.0, int_width=3, fract_width=4, signed=False)
+            b = FixedPoint(4.5, int_width=3, fract_width=4, signed=False)
+            c = a - b
+        self.assertEqual(c.val_bin, "11011000")
+
+    def test_lshift_wraps_like_hardware(self):
+        a = FixedPoint(-3.5, int_width=3, fract_width=4, signed=True)
+        with overflow_policy(OverflowMode.WRAP):
+            b = a << 2
+        self.assertEqual(b.val_bin, "00100000")
+
+    def test_raise(self):
+        with overflow_policy(OverflowMode.RAISE):
+            with self.assertRaises(OverflowError):
+                FixedPoint(100.0, int_width=5, fract_width=2, signed=True)
+
+    def test_per_call_override(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            fxp = FixedPoint(130, int_width=5, fract_width=2, signed=True, overflow=OverflowMode.WRAP)
+            arr = FixedPointArray([100.0], int_width=5, fract_width=2, signed=True, overflow=OverflowMode.SATURATE)
+        # The caller chose the mode, so the default policy does not warn
+        self.assertEqual(len(w), 0)
+        self.assertEqual(fxp.val_int, -126)
+        self.assertEqual(arr.val_int.tolist(), [127])
+
+    def test_default_warns_once_per_format_and_site(self):
+        self.assertTrue(current_policy().warn)
+        # A fresh policy, since the default one may have warned about these formats already
+        with warnings.catch_warnings(record=True) as w, overflow_policy(warn=True) as stats:
+            # Repeats are dropped by the policy itself, not by the warnings filter
+            warnings.simplefilter("always")
+            for value in (100.0, 200.0, 300.0):
+                FixedPoint(value, int_width=5, fract_width=2, signed=True)
+            FixedPointArray([100.0, 200.0], int_width=5, fract_width=2, signed=True)
+            FixedPoint(100.0, int_width=4, fract_width=2, signed=True)
+            FixedPoint(-100.0, int_width=4, fract_width=2, signed=True)
+        self.assertEqual([str(x.message) for x in w], [
+            "Overflow at construct: values above maximum 127 of sQ5.2 are clipped",
+            "Overflow at construct: values above maximum 63 of sQ4.2 are clipped",
+            "Underflow at construct: values below minimum -64 of sQ4.2 are clipped",
+        ])
+        self.assertEqual(stats.total, 7)
+
+    def test_counts_by_op_site(self):
+        stats = OverflowStats()
+        with overflow_policy(stats=stats):
+            a = FixedPoint(2.0, int_width=3, fract_width=4, signed=False)
+            b = FixedPoint(4.5, int_width=3, fract_width=4, signed=False)
+            for _ in range(3):
+                a - b
+        self.assertEqual(stats.by_site(), {"__sub__": 3})
+        self.assertIn("__sub__", stats.report())
+
+    def test_array_wrap_matches_scalar(self):
+        values = [130, -200, 5, 1000]
+        with overflow_policy(OverflowMode.WRAP) as stats:
+            arr = FixedPointArray(np.array(values), int_width=5, fract_width=2, signed=True)
+            expected = [FixedPoint(v, 5, 2, True).val_int for v in values]
+        self.assertEqual(arr.val_int.tolist(), expected)
+        self.assertEqual(stats.total, 6)
+
+    def test_array_float_wrap_matches_scalar(self):
+        values = [40.0, -40.0, 1.25]
+        with overflow_policy(OverflowMode.WRAP):
+            arr = FixedPointArray(values, int_width=5, fract_width=2, signed=True)
+            expected = [FixedPoint(v, 5, 2, True).val_int for v in values]
+        self.assertEqual(arr.val_int.tolist(), expected)
+
+    def test_array_raise(self):
+        with overflow_policy(OverflowMode.RAISE):
+            with self.assertRaises(OverflowError):
+                FixedPointArray([100.0], int_width=5, fract_width=2, signed=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import threading
+import unittest
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.profiling import Profiler, add_hook, node, profile, remove_hook
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.a = FixedPoint(0.75, 3, 12, True)
+        self.b = FixedPoint(-1.25, 3, 12, True)
+
+    def test_uninstrumented_when_disabled(self):
+        original = FixedPoint.__dict__["__mul__"]
+        with profile():
+            self.assertIsNot(FixedPoint.__dict__["__mul__"], original)
+        self.assertIs(FixedPoint.__dict__["__mul__"], original)
+
+    def test_aggregates_by_source_line(self):
+        with profile() as profiler:
+            for _ in range(10):
+                self.a * self.b + self.a * self.b
+
+        entries = {entry.op: entry for entry in profiler.top()}
+        self.assertEqual(set(entries), {"__mul__", "__add__"})
+        self.assertEqual(entries["__mul__"].calls, 20)
+        self.assertEqual(entries["__add__"].calls, 10)
+        self.assertEqual(entries["__add__"].max_width, 33)
+        self.assertTrue(entries["__mul__"].site.startswith("test_profiling.py:"))
+        self.assertGreater(entries["__mul__"].time_ns, 0)
+
+    def test_node_names_and_overflows(self):
+        x = FixedPointArray(np.linspace(-1, 1, 100), 1, 10, True)
+        with profile() as profiler, overflow_policy(OverflowMode.SATURATE):
+            with node("gain"):
+                y = x << 2
+            self.a + x.resize(3, 12)
+
+        gain = profiler.stats["gain", "__lshift__"]
+        self.assertEqual((gain.calls, gain.values), (1, 100))
+        shifted = x.val_int << 2
+        self.assertEqual(gain.overflows, int(np.count_nonzero((shifted > x.fmt.max_val) | (shifted < x.fmt.min_val))))
+        self.assertEqual(y.fmt, x.fmt)
+        # The reflected array op is reported once, under its forward name
+        self.assertEqual(sum(entry.calls for entry in profiler.top() if entry.op == "__add__"), 1)
+
+    def test_overflows_ignore_other_threads(self):
+        # Another thread records events into the shared default stats while ops are profiled
+        stop = threading.Event()
+
+        def overflow_elsewhere():
+            while not stop.is_set():
+                FixedPoint(100.0, 3, 0, True, overflow=OverflowMode.SATURATE)
+
+        worker = threading.Thread(target=overflow_elsewhere)
+        worker.start()
+        try:
+            with profile() as profiler:
+                for _ in range(2000):
+                    self.a * self.b
+        finally:
+            stop.set()
+            worker.join()
+
+        self.assertEqual(profiler.top()[0].calls, 2000)
+        self.assertEqual(profiler.top()[0].overflows, 0)
+
+    def test_sorted_report(self):
+        profiler = Profiler()
+        profiler("slow", "__mul__", self.a, 500, 0)
+        profiler("fast", "__add__", self.a, 10, 2)
+        self.assertEqual([entry.site for entry in profiler.top()], ["slow", "fast"])
+        self.assertEqual([entry.site for entry in profiler.top(key="overflows")], ["fast", "slow"])
+        self.assertLess(profiler.report().index("slow"), profiler.report().index("fast"))
+
+    def test_custom_hook(self):
+        events = []
+        hook = lambda site, op, result, elapsed, overflows: events.append((op, result.val_int))
+        add_hook(hook)
+        try:
+            self.a - self.b
+        finally:
+            remove_hook(hook)
+        self.a - self.b
+
+        self.assertEqual(events, [("__sub__", self.a.val_int - self.b.val_int)])
+
+
+if __name__ == "__main__":
+    unittest.main()
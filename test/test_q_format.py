@@ -0,0 +1,60 @@
+import pickle
+import unittest
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.q_format import QFormat
+
+
+class TestQFormat(unittest.TestCase):
+
+    def test_interned(self):
+        self.assertIs(QFormat(3, 4, True), QFormat(3, 4, signed=True))
+        self.assertIsNot(QFormat(3, 4, True), QFormat(3, 4, False))
+
+    def test_bounds_signed(self):
+        fmt = QFormat(3, 4, True)
+        self.assertEqual(fmt.total_width, 8)
+        self.assertEqual(fmt.min_val, -128)
+        self.assertEqual(fmt.max_val, 127)
+        self.assertEqual(fmt.mask, 0xFF)
+        self.assertEqual(fmt.scale, 16)
+
+    def test_bounds_unsigned(self):
+        fmt = QFormat(4, 4, False)
+        self.assertEqual(fmt.min_val, 0)
+        self.assertEqual(fmt.max_val, 255)
+
+    def test_immutable(self):
+        fmt = QFormat(3, 4, True)
+        with self.assertRaises(AttributeError):
+            fmt.int_width = 5
+
+    def test_hashable(self):
+        formats = {QFormat(3, 4, True): "a", QFormat(3, 4, False): "b"}
+        self.assertEqual(formats[QFormat(3, 4, True)], "a")
+
+    def test_pickle_reinterns(self):
+        fmt = QFormat(5, 11, True)
+        self.assertIs(pickle.loads(pickle.dumps(fmt)), fmt)
+
+    def test_result_formats_memoized(self):
+        a = QFormat(3, 4, True)
+        b = QFormat(3, 4, False)
+        self.assertIs(a.add(b), QFormat(4, 4, True))
+        self.assertIs(a.sub(b), QFormat(4, 4, True))
+        self.assertIs(a.mul(b), QFormat(6, 8, True))
+        self.assertIs(a._mul_cache[b], a.mul(b))
+
+    def test_fract_mismatch(self):
+        with self.assertRaises(ValueError):
+            QFormat(3, 4, True).add(QFormat(3, 5, True))
+
+    def test_fixed_point_shares_format(self):
+        a = FixedPoint(1.5, 3, 4, True)
+        b = FixedPoint(-0.5, 3, 4, True)
+        self.assertIs(a.fmt, b.fmt)
+        self.assertFalse(hasattr(a, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
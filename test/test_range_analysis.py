@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+from PyFxP.compiler import compile_kernel
+from PyFxP.fix_point import FixedPoint
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.q_format import QFormat
+from PyFxP.range_analysis import analyze_ranges, min_int_width
+
+
+HALF = FixedPoint(0.5, 1, 6, True)
+
+
+def model(x, y):
+    acc = x * HALF + y * HALF
+    for _ in range(3):
+        acc = acc + (acc * HALF).resize(acc.int_width, acc.fract_width)
+    return acc
+
+
+class TestRangeAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.fmt = QFormat(2, 7, True)
+        self.kernel = compile_kernel(model, self.fmt, self.fmt)
+
+    def test_min_int_width(self):
+        self.assertEqual(min_int_width(-128, 127, 7, True), 0)
+        self.assertEqual(min_int_width(-129, 0, 7, True), 1)
+        self.assertEqual(min_int_width(0, 128, 7, True), 1)
+        self.assertEqual(min_int_width(0, 255, 4, False), 4)
+        self.assertEqual(min_int_width(0, 0, 4, False), 0)
+
+    def test_static_ranges(self):
+        report = analyze_ranges(self.kernel, [(-1, 1), (-1, 1)])
+        first = report["n0"]
+        self.assertEqual(first.op, "mul")
+        self.assertEqual(first.static, (-128 * 32, 128 * 32))
+        # |x/2 + y/2| <= 1 then grows by 1.5x per iteration, to 3.375
+        self.assertEqual(report.nodes[-1].static_int_width, 2)
+        self.assertLess(report.nodes[-1].static_int_width, report.nodes[-1].fmt.int_width)
+        self.assertGreater(report.bits_saved, 0)
+
+    def test_observed_within_static(self):
+        rng = np.random.default_rng(3)
+        samples = [(rng.uniform(-1, 1, 5000), rng.uniform(-1, 1, 5000)) for _ in range(2)]
+        report = analyze_ranges(self.kernel, [(-1, 1), (-1, 1)], samples=samples)
+
+        for node in report:
+            self.assertIsNotNone(node.observed)
+            self.assertLessEqual(node.static[0], node.observed[0])
+            self.assertLessEqual(node.observed[1], node.static[1])
+            self.assertLessEqual(node.observed_int_width, node.static_int_width)
+
+    def test_recommended_fmt(self):
+        node = analyze_ranges(self.kernel, [(-1, 1), (-1, 1)]).nodes[-1]
+        fmt = node.recommended_fmt()
+        self.assertEqual((fmt.fract_width, fmt.signed), (node.fmt.fract_width, node.fmt.signed))
+        self.assertEqual(fmt.int_width, node.static_int_width)
+
+    def test_overflow_flagged_and_clipped(self):
+        kernel = compile_kernel(lambda x: (x << 2) + x, self.fmt)
+        with overflow_policy(OverflowMode.SATURATE):
+            report = analyze_ranges(kernel)
+        shift, add = report["n0"], report["n1"]
+        self.assertTrue(shift.may_overflow)
+        self.assertEqual(shift.static_int_width, 4)
+        # Saturation bounds the shifted value to its format before the add
+        self.assertFalse(add.may_overflow)
+        self.assertEqual(add.static, (2 * self.fmt.min_val, 2 * self.fmt.max_val))
+
+        with overflow_policy(OverflowMode.WRAP):
+            self.assertEqual(analyze_ranges(kernel)["n1"].static, (2 * self.fmt.min_val, 2 * self.fmt.max_val))
+
+    def test_input_range_count_checked(self):
+        with self.assertRaises(ValueError):
+            analyze_ranges(self.kernel, [(-1, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
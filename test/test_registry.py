@@ -1,6 +1,13 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
 from PyFxP.fix_point import FixedPoint
-from PyFxP.registry import Registry, OppType, Opp
+from PyFxP.registry import Registry, RegistryMode, OppType, Opp, _scope_from_env
 
 
 class TestRegistry(unittest.TestCase):
@@ -41,5 +48,151 @@ class TestRegistry(unittest.TestCase):
         self.assertEqual(Registry.op_registry[0].opp_type, OppType.__MUL__)
 
 
+class TestRegistryModes(unittest.TestCase):
+
+    def setUp(self):
+        Registry.var_registry.clear()
+        Registry.op_registry.clear()
+
+    def test_off_records_nothing(self):
+        with Registry.configure(RegistryMode.OFF) as scope:
+            FixedPoint(1.0, 3, 4) + FixedPoint(2.0, 3, 4)
+            self.assertFalse(Registry.enabled)
+        self.assertEqual(scope.var_count, 0)
+        self.assertEqual(len(scope.op_registry), 0)
+        self.assertTrue(Registry.enabled)
+
+    def test_count_only(self):
+        with Registry.configure(RegistryMode.COUNT) as scope:
+            a = FixedPoint(1.0, 3, 4)
+            b = FixedPoint(1.0, 6, 8)
+            a * a + b
+        self.assertEqual(scope.var_count, 4)
+        self.assertEqual(scope.op_count, 2)
+        self.assertEqual(scope.op_counts, {OppType.__MUL__: 1, OppType.__ADD__: 1})
+        self.assertEqual(len(scope.var_registry), 0)
+        self.assertEqual(len(scope.op_registry), 0)
+
+    def test_count_merges_per_type_counts(self):
+        with Registry.configure(RegistryMode.COUNT) as outer:
+            a = FixedPoint(1.0, 3, 4)
+            with Registry.scope() as inner:
+                (a << 1).bsr_scale(1) - a
+        self.assertEqual(inner.op_counts, {OppType.__LSHIFT__: 1, OppType.__BSR_SCALE__: 1, OppType.__SUB__: 1})
+        self.assertEqual(outer.op_counts, inner.op_counts)
+        self.assertEqual((outer.var_count, outer.op_count), (4, 3))
+
+    def test_sampled(self):
+        with Registry.configure(RegistryMode.SAMPLED, sample_every=3) as scope:
+            a = FixedPoint(1.0, 3, 4)
+            for _ in range(9):
+                a + a
+        self.assertEqual(scope.op_count, 9)
+        self.assertEqual(len(scope.op_registry), 3)
+
+    def test_ring_keeps_last_ops(self):
+        with Registry.configure(RegistryMode.RING, capacity=2) as scope:
+            a = FixedPoint(1.0, 3, 4)
+            results = [a + a for _ in range(5)]
+        self.assertEqual([op.result for op in scope.op_registry], results[-2:])
+        self.assertEqual(len(scope.var_registry), 2)
+
+    def test_ring_requires_capacity(self):
+        with self.assertRaises(ValueError):
+            with Registry.configure(RegistryMode.RING):
+                pass
+
+    def test_previous_scope_restored(self):
+        FixedPoint(1.0, 3, 4)
+        with Registry.configure(RegistryMode.FULL) as scope:
+            FixedPoint(2.0, 3, 4)
+            self.assertIs(Registry.var_registry, scope.var_registry)
+        self.assertEqual(len(Registry.var_registry), 1)
+        self.assertEqual(len(scope.var_registry), 1)
+
+
+class TestRegistryScopes(unittest.TestCase):
+
+    def setUp(self):
+        Registry.var_registry.clear()
+        Registry.op_registry.clear()
+
+    def test_scope_merges_into_parent(self):
+        with Registry.scope() as outer:
+            a = FixedPoint(1.0, 3, 4)
+            with Registry.scope() as inner:
+                a + a
+                self.assertIs(Registry.current(), inner)
+            self.assertEqual(len(inner.op_registry), 1)
+            self.assertEqual(outer.op_count, 1)
+            self.assertEqual(outer.op_registry[0], inner.op_registry[0])
+        self.assertEqual(len(Registry.op_registry), 1)
+
+    def test_configure_does_not_merge(self):
+        with Registry.scope() as outer:
+            with Registry.configure(RegistryMode.FULL):
+                FixedPoint(1.0, 3, 4)
+        self.assertEqual(outer.var_count, 0)
+
+    def test_threads_record_separately(self):
+        def model(offset: float) -> list:
+            a = FixedPoint(offset, 3, 4)
+            results = [a + a for _ in range(50)]
+            return [op.result for op in Registry.op_registry] == results
+
+        with Registry.scope() as parent:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                outcomes = list(pool.map(Registry.bind(model), [0.5, 1.0, 1.5, 2.0]))
+
+        self.assertTrue(all(outcomes))
+        self.assertEqual(parent.op_count, 200)
+        self.assertEqual(len(parent.op_registry), 200)
+
+    def test_thread_without_scope_uses_root(self):
+        seen = []
+        with Registry.scope():
+            thread = threading.Thread(target=lambda: seen.append(Registry.current()))
+            thread.start()
+            thread.join()
+        self.assertIsNot(seen[0], None)
+        self.assertIsNone(seen[0].parent)
+
+    def test_asyncio_tasks_record_separately(self):
+        async def model(offset: float) -> int:
+            with Registry.scope() as scope:
+                a = FixedPoint(offset, 3, 4)
+                for _ in range(10):
+                    a + a
+                    await asyncio.sleep(0)
+                return len(scope.op_registry)
+
+        async def main() -> list:
+            return await asyncio.gather(*(model(v) for v in (0.5, 1.0, 1.5)))
+
+        with Registry.scope() as parent:
+            counts = asyncio.run(main())
+
+        self.assertEqual(counts, [10, 10, 10])
+        self.assertEqual(parent.op_count, 30)
+
+    def test_root_mode_from_env(self):
+        self.assertIs(_scope_from_env(None).mode, RegistryMode.FULL)
+        self.assertIs(_scope_from_env("count").mode, RegistryMode.COUNT)
+        scope = _scope_from_env("RING:16")
+        self.assertEqual((scope.mode, scope.capacity), (RegistryMode.RING, 16))
+        scope = _scope_from_env("sampled:4")
+        self.assertEqual((scope.mode, scope.sample_every), (RegistryMode.SAMPLED, 4))
+        for value in ("bounded", "ring", "ring:x", "sampled:0"):
+            with self.assertRaises(ValueError):
+                _scope_from_env(value)
+
+        code = ("from PyFxP.fix_point import FixedPoint; from PyFxP.registry import Registry; "
+                "[FixedPoint(1, 3, 4) + FixedPoint(1, 3, 4) for _ in range(10)]; "
+                "assert Registry.current().op_count == 10 and len(Registry.op_registry) == 2")
+        env = dict(os.environ, PYFXP_REGISTRY="ring:2")
+        subprocess.run([sys.executable, "-c", code], check=True, env=env,
+                       cwd=os.path.dirname(os.path.dirname(__file__)) or ".")
+
+
 if __name__ == "__main__":
     unittest.main()
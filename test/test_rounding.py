@@ -0,0 +1,101 @@
+import math
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.overflow import OverflowMode
+from PyFxP.rounding import RoundingMode, shift_round
+
+
+def reference(raw: int, n: int, rounding: RoundingMode) -> int:
+    exact = Fraction(raw, 1 << n)
+    match rounding:
+        case RoundingMode.FLOOR:
+            return math.floor(exact)
+        case RoundingMode.CEIL:
+            return math.ceil(exact)
+        case RoundingMode.HALF_UP:
+            return math.floor(exact + Fraction(1, 2))
+        case RoundingMode.CONVERGENT:
+            return round(exact)
+        case RoundingMode.TRUNCATE:
+            return int(exact)
+
+
+class TestShiftRound(unittest.TestCase):
+
+    def test_scalar_matches_reference(self):
+        for rounding in RoundingMode:
+            for n in range(1, 5):
+                for raw in range(-40, 40):
+                    self.assertEqual(shift_round(raw, n, rounding), reference(raw, n, rounding), (raw, n, rounding))
+
+    def test_array_matches_reference(self):
+        raw = np.arange(-40, 40, dtype=np.int64)
+        for rounding in RoundingMode:
+            for n in range(1, 5):
+                expected = [reference(int(v), n, rounding) for v in raw]
+                self.assertEqual(shift_round(raw, n, rounding).tolist(), expected)
+                self.assertEqual(shift_round(raw.astype(object), n, rounding).tolist(), expected)
+
+    def test_native_extremes_do_not_overflow(self):
+        raw = np.array([np.iinfo(np.int64).max, np.iinfo(np.int64).min], dtype=np.int64)
+        self.assertEqual(shift_round(raw, 1, RoundingMode.HALF_UP).tolist(), [1 << 62, -(1 << 62)])
+
+    def test_negative_shift_is_left_shift(self):
+        self.assertEqual(shift_round(3, -2), 12)
+
+
+class TestResize(unittest.TestCase):
+
+    def test_narrow_fraction_convergent(self):
+        a = FixedPoint(0.625, int_width=3, fract_width=4, signed=True)    # 10/16
+        b = a.resize(3, 2, rounding=RoundingMode.CONVERGENT)               # 2.5/4 -> 2/4
+        self.assertEqual(b.val_int, 2)
+        self.assertEqual((b.int_width, b.fract_width, b.signed), (3, 2, True))
+
+    def test_narrow_fraction_half_up(self):
+        a = FixedPoint(-0.625, int_width=3, fract_width=4, signed=True)   # -10/16
+        self.assertEqual(a.resize(3, 2, rounding=RoundingMode.HALF_UP).val_int, -2)
+        self.assertEqual(a.resize(3, 2, rounding=RoundingMode.FLOOR).val_int, -3)
+        self.assertEqual(a.resize(3, 2, rounding=RoundingMode.TRUNCATE).val_int, -2)
+
+    def test_widen_fraction_exact(self):
+        a = FixedPoint(-1.5, int_width=3, fract_width=4, signed=True)
+        self.assertEqual(a.resize(3, 60).val_float, -1.5)
+
+    def test_wide_product_exact(self):
+        a = FixedPoint((1 << 70) + 1, int_width=10, fract_width=70, signed=False)
+        b = a.resize(10, 0, rounding=RoundingMode.CEIL)
+        self.assertEqual(b.val_int, 2)
+
+    def test_narrow_integer_saturates(self):
+        a = FixedPoint(7.5, int_width=3, fract_width=4, signed=True)
+        self.assertEqual(a.resize(1, 4, overflow=OverflowMode.SATURATE).val_int, 31)
+        self.assertEqual(a.resize(1, 4, overflow=OverflowMode.WRAP).val_bin, "111000")
+
+    def test_signed_to_unsigned(self):
+        a = FixedPoint(-1.0, int_width=3, fract_width=4, signed=True)
+        self.assertEqual(a.resize(3, 4, signed=False, overflow=OverflowMode.SATURATE).val_int, 0)
+
+    def test_array_matches_scalar(self):
+        values = [-3.9375, -0.625, 0.03125, 1.5, 7.96875]
+        arr = FixedPointArray(values, int_width=3, fract_width=5, signed=True)
+        for rounding in RoundingMode:
+            resized = arr.resize(2, 2, rounding=rounding, overflow=OverflowMode.WRAP)
+            expected = [FixedPoint(v, 3, 5, True).resize(2, 2, rounding=rounding, overflow=OverflowMode.WRAP).val_int for v in values]
+            self.assertEqual(resized.val_int.tolist(), expected)
+
+    def test_mul_then_requantize(self):
+        a = FixedPointArray([0.7071, -0.5], int_width=0, fract_width=15, signed=True)
+        b = FixedPointArray([0.5, 0.5], int_width=0, fract_width=15, signed=True)
+        y = (a * b).resize(0, 15, rounding=RoundingMode.CONVERGENT)
+        self.assertEqual((y.int_width, y.fract_width), (0, 15))
+        np.testing.assert_allclose(y.val_float, [0.7071 / 2, -0.25], atol=2 ** -15)
+
+
+if __name__ == "__main__":
+    unittest.main()
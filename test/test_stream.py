@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from PyFxP.filters import FIRFilter
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.q_format import QFormat
+from PyFxP.stream import quantize_file, quantize_stream, read_chunks, write_stream
+
+
+class TestStream(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        self.signal = np.sin(np.linspace(0, 20, 1000)) * 0.9
+        self.fmt = QFormat(0, 15, True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self._dir.name, name)
+
+    def test_read_chunks_npy(self):
+        np.save(self.path("x.npy"), self.signal)
+        chunks = list(read_chunks(self.path("x.npy"), chunk_size=300))
+        self.assertEqual([len(c) for c in chunks], [300, 300, 300, 100])
+        np.testing.assert_array_equal(np.concatenate(chunks), self.signal)
+
+    def test_read_chunks_raw(self):
+        self.signal.astype(np.float32).tofile(self.path("x.f32"))
+        chunks = list(read_chunks(self.path("x.f32"), chunk_size=256, dtype=np.float32))
+        np.testing.assert_array_equal(np.concatenate(chunks), self.signal.astype(np.float32))
+
+    def test_read_chunks_csv(self):
+        np.savetxt(self.path("x.csv"), self.signal)
+        chunks = list(read_chunks(self.path("x.csv"), chunk_size=400))
+        self.assertEqual([len(c) for c in chunks], [400, 400, 200])
+        np.testing.assert_allclose(np.concatenate(chunks), self.signal)
+
+    def test_quantize_stream_matches_whole_array(self):
+        chunks = read_chunks_from(self.signal, 128)
+        raw = np.concatenate([a.val_int for a in quantize_stream(chunks, self.fmt)])
+        expected = FixedPointArray(self.signal, 0, 15, True).val_int
+        np.testing.assert_array_equal(raw, expected)
+
+    def test_stateful_stage_continues_across_chunks(self):
+        taps = [0.25, 0.5, 0.25]
+        chunked = FIRFilter(taps, self.fmt, coeff_fmt=self.fmt)
+        whole = FIRFilter(taps, self.fmt, coeff_fmt=self.fmt)
+
+        streamed = [a.val_int for a in quantize_stream(read_chunks_from(self.signal, 97), self.fmt, stage=chunked.process)]
+        expected = whole.process(FixedPointArray(self.signal, 0, 15, True))
+        np.testing.assert_array_equal(np.concatenate(streamed), expected.val_int)
+
+    def test_quantize_file_raw_round_trip(self):
+        np.save(self.path("x.npy"), self.signal)
+        n = quantize_file(self.path("x.npy"), self.path("y.bin"), self.fmt, chunk_size=100)
+        self.assertEqual(n, len(self.signal))
+
+        raw = np.fromfile(self.path("y.bin"), dtype="<i8")
+        np.testing.assert_array_equal(raw, FixedPointArray(self.signal, 0, 15, True).val_int)
+
+    def test_write_stream_csv(self):
+        arrays = quantize_stream(read_chunks_from(np.array([0.5, -0.25]), 1), QFormat(3, 4, True))
+        write_stream(arrays, self.path("y.csv"))
+        with open(self.path("y.csv")) as f:
+            self.assertEqual(f.read(), "8\n-4\n")
+
+    def test_write_stream_rejects_wide_raw(self):
+        arrays = [FixedPointArray(np.array([1], dtype=object), 40, 40, True)]
+        with self.assertRaises(ValueError):
+            write_stream(arrays, self.path("y.bin"))
+
+
+def read_chunks_from(signal: np.ndarray, chunk_size: int):
+    for start in range(0, len(signal), chunk_size):
+        yield signal[start:start + chunk_size]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import math
+import unittest
+
+import numpy as np
+
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.overflow import OverflowMode
+from PyFxP.sweep import SweepReport, SweepResult, run_sweep
+
+
+def gen_inputs(rng):
+    return (rng.uniform(-1.5, 1.5, 2000),)
+
+
+def reference(x):
+    return x * 0.75
+
+
+def model(fract_width, x):
+    """ Quantize x to sQ0.fract_width, so samples beyond +/-1 overflow, and scale by 0.75 """
+    xq = FixedPointArray(x, 0, fract_width, True)
+    gain = FixedPointArray(np.array([0.75]), 0, fract_width, True)
+    return xq * gain
+
+
+class TestSweep(unittest.TestCase):
+
+    def test_serial_metrics(self):
+        report = run_sweep(model, [4, 8, 12], reference, gen_inputs, seeds=[1, 2], max_workers=0)
+        sqnr = [r.sqnr_db for r in report]
+
+        self.assertEqual([r.config for r in report], [4, 8, 12])
+        self.assertEqual([r.n_runs for r in report], [2, 2, 2])
+        self.assertTrue(all(r.n_samples == 4000 for r in report))
+        # Inputs beyond +/-1 saturate in every configuration
+        self.assertTrue(all(r.overflows > 0 for r in report))
+        self.assertLess(sqnr[0], sqnr[2])
+
+    def test_explicit_inputs_without_error(self):
+        x = np.array([0.5, -0.25, 0.125])
+        report = run_sweep(lambda cfg, v: FixedPointArray(v, 1, cfg, True), [4], lambda v: v, [(x,)], max_workers=0)
+        result = report.results[0]
+        self.assertEqual(result.sqnr_db, math.inf)
+        self.assertEqual((result.max_error, result.overflows), (0.0, 0))
+
+    def test_process_pool_matches_serial(self):
+        kwargs = dict(seeds=[3, 4, 5], overflow=OverflowMode.WRAP)
+        serial = run_sweep(model, [6, 10], reference, gen_inputs, max_workers=0, **kwargs)
+        pooled = run_sweep(model, [6, 10], reference, gen_inputs, max_workers=2, **kwargs)
+        self.assertEqual([r.__dict__ for r in serial], [r.__dict__ for r in pooled])
+
+    def test_best(self):
+        results = [SweepResult(4, 1.0, 1e-2, 0.1, 0, 10, 1), SweepResult(8, 1.0, 1e-5, 0.01, 3, 10, 1),
+                   SweepResult(12, 1.0, 1e-7, 0.001, 0, 10, 1)]
+        report = SweepReport(results)
+        self.assertEqual(report.best(40).config, 12)
+        self.assertEqual(report.best(40, max_overflows=5).config, 8)
+        self.assertEqual(report.best().config, 12)
+        self.assertIsNone(report.best(100))
+        self.assertIn("sqnr_db", report.report())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.q_format import QFormat
+from PyFxP.registry import OppType
+from PyFxP.rounding import RoundingMode
+from PyFxP.trace import OVERFLOW, SATURATED, Trace, TraceWriter, first_difference, record_trace
+
+
+def simulate(gain: float = 1.5):
+    """ Small MAC loop that saturates once the accumulator grows """
+    with overflow_policy(OverflowMode.SATURATE, warn=False) as stats:
+        acc = FixedPoint(0, 3, 8, True)
+        k = FixedPoint(gain, 1, 8, True)
+        for x in np.linspace(-1, 1, 20):
+            product = (FixedPoint(float(x), 1, 8, True) * k).resize(3, 8)
+            acc = (acc + product).resize(3, 8, rounding=RoundingMode.CONVERGENT)
+            acc = acc.bsl_scale(1) >> 1
+    return stats
+
+
+class TestTrace(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "run")
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_round_trip(self):
+        with record_trace(self.path, chunk_size=7) as scope:
+            simulate()
+        trace = Trace(self.path)
+
+        self.assertEqual(len(trace), scope.op_count)
+        self.assertEqual(len(trace), 20 * 6)
+        self.assertIsInstance(trace.result_raw, np.memmap)
+        self.assertEqual(trace.where(op="mul").size, 20)
+
+        first = trace[0]
+        self.assertEqual(first.op, "mul")
+        self.assertEqual((first.lhs_fmt, first.rhs_fmt, first.result_fmt),
+                         (QFormat(1, 8, True), QFormat(1, 8, True), QFormat(3, 16, True)))
+        self.assertEqual(first.result_raw, first.lhs_raw * first.rhs_raw)
+        self.assertEqual(trace[1].lhs_id, first.result_id)
+        self.assertEqual(trace[-1].op, "rshift")
+        self.assertEqual(trace[-1].param, 1)
+        self.assertEqual(trace[3].rounding, RoundingMode.CONVERGENT)
+        self.assertIsNone(trace[2].rounding)
+
+    def test_saturation_query(self):
+        with record_trace(self.path):
+            stats = simulate()
+        trace = Trace(self.path)
+
+        saturated = trace.saturated()
+        self.assertGreater(saturated.size, 0)
+        self.assertEqual(trace.overflowed().size, stats.total)
+        for op in trace.ops(saturated):
+            self.assertTrue(op.overflowed)
+            self.assertIn(op.result_raw, (op.result_fmt.min_val, op.result_fmt.max_val))
+
+        # Saturated ops are the overflowed ops clipped to a bound of Q3.8
+        at_bound = np.isin(trace.result_raw, [QFormat(3, 8, True).min_val, QFormat(3, 8, True).max_val])
+        self.assertTrue(np.all(at_bound[saturated]))
+        self.assertTrue(np.all(trace.flags[saturated] == OVERFLOW | SATURATED))
+
+    def test_wide_values(self):
+        with record_trace(self.path) as scope:
+            a = FixedPoint(-(1 << 90) + 3, 100, 0, True)
+            a * a
+            a << 2
+        self.assertEqual(scope.op_count, 2)
+
+        trace = Trace(self.path)
+        self.assertEqual(trace[0].result_raw, (-(1 << 90) + 3) ** 2)
+        self.assertEqual(trace.raw("lhs_raw").tolist(), [-(1 << 90) + 3] * 2)
+        self.assertEqual(trace.raw("rhs_raw")[1], 0)
+        self.assertEqual(trace[1].rhs_raw, None)
+        self.assertEqual(trace.where(op="lshift", overflowed=False).tolist(), [1])
+
+    def test_wide_values_are_appended(self):
+        writer = TraceWriter(self.path, chunk_size=2)
+        values = [FixedPoint((1 << 80) + k, 100, 0, True) for k in range(5)]
+        for a in values:
+            writer.log_op(a, None, a << 1, OppType.__LSHIFT__, (1,))
+        meta_size = os.path.getsize(os.path.join(self.path, "meta.json"))
+
+        # Two chunks flushed, and raw values stay out of meta.json
+        trace = Trace(self.path)
+        self.assertEqual(trace.raw("result_raw").tolist(), [((1 << 80) + k) << 1 for k in range(4)])
+        writer.close()
+        self.assertEqual(os.path.getsize(os.path.join(self.path, "meta.json")), meta_size)
+        self.assertEqual(Trace(self.path)[4].lhs_raw, (1 << 80) + 4)
+
+    def test_stream_is_readable_before_close(self):
+        writer = TraceWriter(self.path, chunk_size=4)
+        a = FixedPoint(0.5, 2, 4, True)
+        for _ in range(10):
+            writer.log_op(a, a, a + a, 0)
+        # Two chunks flushed, the last two ops are still buffered
+        self.assertEqual(len(Trace(self.path)), 8)
+        writer.close()
+        self.assertEqual(len(Trace(self.path)), 10)
+
+    def test_first_difference(self):
+        other = os.path.join(self._dir.name, "other")
+        third = os.path.join(self._dir.name, "third")
+        with record_trace(self.path):
+            simulate()
+        with record_trace(other):
+            simulate()
+        with record_trace(third):
+            simulate(gain=1.25)
+
+        self.assertIsNone(first_difference(Trace(self.path), Trace(other)))
+        self.assertEqual(first_difference(Trace(self.path), Trace(third)), 0)
+
+        with record_trace(other):
+            simulate()
+            FixedPoint(1, 2, 0) + FixedPoint(1, 2, 0)
+        self.assertEqual(first_difference(Trace(self.path), Trace(other)), 120)
+
+    def test_var_ids_are_bounded(self):
+        writer = TraceWriter(self.path, max_ids=8)
+        acc = FixedPoint(0, 7, 8, True)
+        for _ in range(10):
+            writer.log_var(acc)
+            for k in range(20):
+                writer.log_var(FixedPoint(k, 7, 8, True))
+                writer._var_id(acc)
+            self.assertLessEqual(len(writer._ids), 8)
+        # A var used every step keeps its id while temporaries are forgotten
+        self.assertEqual(writer._var_id(acc), writer._var_id(acc))
+        self.assertEqual(writer._ids[id(acc)], 189)
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            TraceWriter(self.path, max_ids=0)
+
+    def test_empty_trace(self):
+        with record_trace(self.path):
+            pass
+        trace = Trace(self.path)
+        self.assertEqual(len(trace), 0)
+        self.assertEqual(trace.saturated().size, 0)
+        with self.assertRaises(IndexError):
+            trace[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
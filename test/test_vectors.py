@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.q_format import QFormat
+from PyFxP.vectors import (format_words, pack_words, parse_words, read_memb, read_memh, read_packed,
+                           unpack_words, write_memb, write_memh, write_packed)
+
+
+class TestVectors(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [-4.0, -0.0625, 0.0, 1.5, 3.9375]
+        self.arr = FixedPointArray(self.values, int_width=2, fract_width=4, signed=True)
+
+    def test_format_binary_matches_val_bin(self):
+        expected = "".join(FixedPoint(v, 2, 4, True).val_bin + "\n" for v in self.values)
+        self.assertEqual(format_words(self.arr, 2).decode(), expected)
+
+    def test_format_hex(self):
+        self.assertEqual(format_words(self.arr, 16).decode().split(), ["40", "7f", "00", "18", "3f"])
+
+    def test_round_trip_wide_formats(self):
+        for fmt in (QFormat(40, 40, True), QFormat(63, 0, True), QFormat(64, 0, False), QFormat(70, 60, False)):
+            raw = np.array([fmt.min_val, fmt.max_val, 0, fmt.max_val // 3], dtype=object)
+            arr = FixedPointArray._create(raw, fmt)
+            for radix in (2, 16):
+                self.assertEqual(parse_words(format_words(arr, radix), fmt, radix).val_int.tolist(), raw.tolist())
+            for byteorder in ("little", "big"):
+                self.assertEqual(unpack_words(pack_words(arr, byteorder), fmt, byteorder).val_int.tolist(), raw.tolist())
+
+    def test_parse_readmem_syntax(self):
+        text = "// header\n3f /* block\ncomment */ 4_0\r\n8\n"
+        arr = parse_words(text, QFormat(2, 4, True), 16)
+        self.assertEqual(arr.val_int.tolist(), [63, -64, 8])
+
+    def test_parse_readmem_syntax_at_word_stride(self):
+        # Comment lines and separated words as long as a full word are still stripped
+        fmt = QFormat(9, 0, False)
+        self.assertEqual(parse_words(b"// header\n000000001\n", fmt).val_int.tolist(), [1])
+        self.assertEqual(parse_words(b"0000_0001\n1_0000_0000\n", fmt).val_int.tolist(), [1, 256])
+
+    def test_parse_rejects_bad_words(self):
+        fmt = QFormat(2, 4, True)
+        for text, radix in (("x0\n", 16), ("80\n", 16), ("10000000\n", 2), ("@10 00\n", 16)):
+            with self.assertRaises(ValueError):
+                parse_words(text, fmt, radix)
+
+    def test_pack_bytes(self):
+        arr = FixedPointArray(np.array([-2, 0x1234]), int_width=15, fract_width=0, signed=True)
+        self.assertEqual(pack_words(arr), b"\xfe\xff\x34\x12")
+        self.assertEqual(pack_words(arr, "big"), b"\xff\xfe\x12\x34")
+
+    def test_unpack_ignores_sign_extension_padding(self):
+        arr = unpack_words(b"\xff\xff\x05\x00", QFormat(11, 0, True))
+        self.assertEqual(arr.val_int.tolist(), [-1, 5])
+
+    def test_file_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for write, read, name in ((write_memb, read_memb, "v.memb"), (write_memh, read_memh, "v.memh"),
+                                      (write_packed, read_packed, "v.bin")):
+                path = os.path.join(tmp, name)
+                write(self.arr, path)
+                self.assertEqual(read(path, self.arr.fmt).val_int.tolist(), self.arr.val_int.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import random
+import unittest
+
+import numpy as np
+
+from PyFxP import wide
+from PyFxP.fix_point import FixedPoint
+from PyFxP.fix_point_array import FixedPointArray
+from PyFxP.kernels import dot
+from PyFxP.overflow import OverflowMode, overflow_policy
+from PyFxP.rounding import RoundingMode, shift_round
+
+
+EDGES = [0, 1, -1, (1 << 63) - 1, -(1 << 63), 1 << 64, -(1 << 64), (1 << 127) - 1, -(1 << 127)]
+
+
+def wrap128(v: int) -> int:
+    return ((v + (1 << 127)) % (1 << 128)) - (1 << 127)
+
+
+class TestWide(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.a = EDGES + [rng.randint(-(1 << 127), (1 << 127) - 1) for _ in range(200)]
+        self.b = list(reversed(EDGES)) + [rng.randint(-(1 << 127), (1 << 127) - 1) for _ in range(200)]
+        self.wa = wide.from_int(np.array(self.a, dtype=object))
+        self.wb = wide.from_int(np.array(self.b, dtype=object))
+
+    def test_round_trip(self):
+        self.assertEqual(wide.to_object(self.wa).tolist(), self.a)
+        self.assertEqual(wide.to_int(self.wa[3]), self.a[3])
+        self.assertEqual(wide.to_object(wide.from_int(np.array([-5, 7]))).tolist(), [-5, 7])
+        self.assertEqual(wide.to_object(wide.from_int(np.array([(1 << 64) - 1], dtype=np.uint64))).tolist(), [(1 << 64) - 1])
+
+    def test_arithmetic_modulo_2_128(self):
+        for op, ref in ((wide.add, lambda x, y: x + y), (wide.sub, lambda x, y: x - y), (wide.mul, lambda x, y: x * y)):
+            out = wide.to_object(op(self.wa, self.wb)).tolist()
+            self.assertEqual(out, [wrap128(ref(x, y)) for x, y in zip(self.a, self.b)])
+
+    def test_shifts(self):
+        for n in (0, 1, 63, 64, 65, 127, 128):
+            self.assertEqual(wide.to_object(wide.rshift(self.wa, n)).tolist(), [x >> n for x in self.a])
+            self.assertEqual(wide.to_object(wide.lshift(self.wa, n)).tolist(), [wrap128(x << n) for x in self.a])
+
+    def test_shift_round_matches_scalar(self):
+        for rounding in RoundingMode:
+            for n in (1, 30, 64, 100, 127):
+                out = wide.to_object(wide.shift_round(self.wa, n, rounding)).tolist()
+                self.assertEqual(out, [shift_round(x, n, rounding) for x in self.a])
+
+    def test_compare_and_wrap(self):
+        self.assertEqual(wide.less(self.wa, self.wb).tolist(), [x < y for x, y in zip(self.a, self.b)])
+        self.assertEqual(wide.greater(self.wa, 1 << 64).tolist(), [x > 1 << 64 for x in self.a])
+        sign = 1 << 99
+        self.assertEqual(wide.to_object(wide.wrap(self.wa, 100, True)).tolist(),
+                         [((x & ((1 << 100) - 1)) ^ sign) - sign for x in self.a])
+
+    def test_float_conversion(self):
+        values = np.array([0.0, -1.0, 2.0 ** 63, -2.0 ** 100 + 2.0 ** 60, 3.0 * 2.0 ** 120])
+        w = wide.from_float(values)
+        self.assertEqual(wide.to_object(w).tolist(), [int(v) for v in values])
+        self.assertEqual(wide.to_float(self.wa).tolist(), [float(x) for x in self.a])
+
+
+class TestWideArray(unittest.TestCase):
+
+    def test_storage(self):
+        arr = FixedPointArray([1.5, -2.25], int_width=40, fract_width=60, signed=True)
+        self.assertEqual(arr._val_int.dtype, wide.INT128)
+        self.assertEqual(arr.val_int.dtype, object)
+        self.assertEqual(arr.val_int.tolist(), [3 << 59, -9 << 58])
+        np.testing.assert_array_equal(arr.val_float, [1.5, -2.25])
+        self.assertEqual(arr[1].val_int, -9 << 58)
+        # Unsigned 128-bit formats do not fit the signed limb pair
+        self.assertEqual(FixedPointArray([1.0], 120, 8, False)._val_int.dtype, object)
+
+    def test_ops_match_scalar(self):
+        rng = random.Random(3)
+        a_vals = [rng.randint(-(1 << 49), (1 << 49) - 1) for _ in range(20)]
+        b_vals = [rng.randint(-(1 << 39), (1 << 39) - 1) for _ in range(20)]
+        a = FixedPointArray(np.array(a_vals, dtype=object), 30, 40, True)
+        b = FixedPointArray(np.array(b_vals, dtype=object), 0, 40, True)
+        scalars = [(FixedPoint(x, 30, 40, True), FixedPoint(y, 0, 40, True)) for x, y in zip(a_vals, b_vals)]
+
+        self.assertEqual((a * b).val_int.tolist(), [(x * y).val_int for x, y in scalars])
+        self.assertEqual((a + b).val_int.tolist(), [(x + y).val_int for x, y in scalars])
+        self.assertEqual((a - b).val_int.tolist(), [(x - y).val_int for x, y in scalars])
+        self.assertEqual((a << 20).val_int.tolist(), [(x << 20).val_int for x, _ in scalars])
+        self.assertEqual((a >> 45).val_int.tolist(), [(x >> 45).val_int for x, _ in scalars])
+        self.assertEqual(a.resize(30, 10, True, RoundingMode.CONVERGENT).val_int.tolist(),
+                         [x.resize(30, 10, True, RoundingMode.CONVERGENT).val_int for x, _ in scalars])
+
+    def test_overflow_modes(self):
+        a = FixedPointArray(np.array([(1 << 90) + 5, -(1 << 90), 3], dtype=object), 50, 41, True)
+        with overflow_policy(OverflowMode.SATURATE) as stats:
+            sat = a.bsl_scale(10)
+        with overflow_policy(OverflowMode.WRAP):
+            wrapped = a.bsl_scale(10)
+
+        self.assertEqual(stats.total, 2)
+        self.assertEqual(sat.val_int.tolist(), [a.fmt.max_val, a.fmt.min_val, 3 << 10])
+        self.assertEqual(wrapped.val_int.tolist(), [5 << 10, 0, 3 << 10])
+
+    def test_dot_wide_accumulator(self):
+        coeffs = FixedPointArray([0.25, -0.5, 0.75], 1, 40, True)
+        samples = FixedPointArray(np.random.default_rng(0).uniform(-4, 4, (50, 3)), 3, 40, True)
+        out = dot(coeffs, samples)
+        self.assertGreater(out.total_width, 64)
+        expected = [dot(coeffs.to_fixed_points(), samples[i].to_fixed_points()).val_int for i in range(50)]
+        self.assertEqual(out.val_int.tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()